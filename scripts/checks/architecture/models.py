@@ -6,8 +6,9 @@ Contains all data structures used throughout the architecture checking system.
 """
 
 from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from enum import Enum
 
 
@@ -189,10 +190,14 @@ class CheckResults:
         """Get all issues (errors + warnings)."""
         return self.errors + self.warnings
     
+    def iter_issues(self) -> Iterator[ArchError]:
+        """Iterate errors then warnings without building a combined list."""
+        return chain(self.errors, self.warnings)
+    
     def get_summary_by_type(self) -> Dict[str, int]:
         """Get count of issues by error type."""
         summary = {}
-        for issue in self.get_all_issues():
+        for issue in self.iter_issues():
             error_type = issue.error_type.value
             summary[error_type] = summary.get(error_type, 0) + 1
         return summary
@@ -200,7 +205,7 @@ class CheckResults:
     def get_summary_by_subsystem(self) -> Dict[str, int]:
         """Get count of issues by subsystem."""
         summary = {}
-        for issue in self.get_all_issues():
+        for issue in self.iter_issues():
             if issue.subsystem:
                 subsystem = issue.subsystem
                 summary[subsystem] = summary.get(subsystem, 0) + 1
@@ -209,7 +214,7 @@ class CheckResults:
     def get_summary_by_recommendation(self) -> Dict[str, int]:
         """Get count of issues by recommendation type."""
         summary = {}
-        for issue in self.get_all_issues():
+        for issue in self.iter_issues():
             if issue.recommendation:
                 rec_type = self._categorize_recommendation(issue.recommendation, issue)
                 summary[rec_type] = summary.get(rec_type, 0) + 1
@@ -220,7 +225,7 @@ class CheckResults:
         exact_summary = {}
         missing_recommendations = []
         
-        for issue in self.get_all_issues():
+        for issue in self.iter_issues():
             if issue.recommendation:
                 # Count exact recommendation text
                 exact_summary[issue.recommendation] = exact_summary.get(issue.recommendation, 0) + 1
@@ -318,7 +323,6 @@ class CheckResults:
     
     def to_dict(self) -> Dict:
         """Convert results to dictionary for JSON serialization."""
-        all_issues = self.get_all_issues()
         return {
             "timestamp": None,  # Will be set by reporter
             "target_path": self.target_path,
@@ -330,5 +334,5 @@ class CheckResults:
                 "by_subsystem": self.get_summary_by_subsystem(),
                 "by_recommendation": self.get_summary_by_recommendation()
             },
-            "errors": [issue.to_dict() for issue in all_issues]
+            "errors": [issue.to_dict() for issue in self.iter_issues()]
         }
\ No newline at end of file
@@ -12,6 +12,9 @@ from typing import Dict
 
 from .models import CheckResults, ErrorType, Severity
 
+# Console order of the error type breakdown (alphabetical, fixed once at import)
+ERROR_TYPE_ORDER = tuple(sorted(error_type.value for error_type in ErrorType))
+
 
 class ArchitectureReporter:
     """Handles reporting of architecture check results."""
@@ -55,7 +58,7 @@ class ArchitectureReporter:
         total_warnings = len(results.warnings)
         
         # Check for custom thresholds usage
-        custom_threshold_count = sum(1 for issue in results.get_all_issues() 
+        custom_threshold_count = sum(1 for issue in results.iter_issues() 
                                    if issue.metadata and 'custom_threshold' in issue.metadata)
         
         if custom_threshold_count > 0:
@@ -73,8 +76,10 @@ class ArchitectureReporter:
             type_summary = results.get_summary_by_type()
             if type_summary:
                 print("🔍 By error type:")
-                for error_type, count in sorted(type_summary.items()):
-                    print(f"  • {error_type}: {count}")
+                for error_type in ERROR_TYPE_ORDER:
+                    count = type_summary.get(error_type)
+                    if count:
+                        print(f"  • {error_type}: {count}")
                 print()
             
             # Breakdown by subsystem
@@ -148,7 +153,7 @@ class ArchitectureReporter:
         
         # Group by error type
         by_type: Dict[ErrorType, list] = {}
-        for issue in results.get_all_issues():
+        for issue in results.iter_issues():
             if issue.error_type not in by_type:
                 by_type[issue.error_type] = []
             by_type[issue.error_type].append(issue)
@@ -9,9 +9,10 @@ import os
 import re
 import time
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from collections import defaultdict, deque
+from typing import Dict, Iterator, List, Set, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from collections import defaultdict
+from dataclasses import replace
 
 from .models import (
     CheckResults, DeadCodeIssue, DeadCodeType, Severity,
@@ -22,6 +23,63 @@ from .models import (
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from shared.typescript_parser import TypeScriptParser, Import, Export, Symbol
+from shared.analysis_cache import AnalysisCache, CacheEntry, content_digest, source_digest
+
+# Symbols are keyed by (file path, symbol name); '__file__' denotes file-level usage
+SymbolKey = Tuple[Path, str]
+
+SOURCE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+
+# Bump for analysis format changes the source digests in _analysis_cache_version miss
+ANALYSIS_CACHE_VERSION = 3
+
+# Below this many files to parse (or with a single CPU), parse in-process: starting
+# worker processes and shipping results back costs more than the parsing itself
+PROCESS_POOL_MIN_FILES = 32
+
+
+# Parser reused by every file analyzed in a worker process (set by _init_analysis_worker)
+_worker_parser: Optional[TypeScriptParser] = None
+
+
+def _analyze_source_file(file_path: Path, parser: TypeScriptParser) -> FileAnalysis:
+    """Analyze a single TypeScript file using shared parser."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        exports = parser.extract_exports(content, file_path)
+        imports = parser.extract_imports(content, file_path)
+        symbols = parser.extract_symbols(content, file_path)
+        used_symbols = parser.find_symbol_usage(content)
+        interface_implementations = parser.extract_interface_implementations(content, file_path)
+        
+        analysis = FileAnalysis(
+            path=file_path,
+            exports=exports,
+            imports=imports,
+            symbols=symbols,
+            used_symbols=used_symbols,
+            interface_implementations=interface_implementations,
+            content=content,
+            lines=len(content.split('\n'))
+        )
+        
+        return analysis
+        
+    except (UnicodeDecodeError, OSError) as e:
+        return FileAnalysis(path=file_path)
+
+
+def _init_analysis_worker(use_tree_sitter: bool) -> None:
+    """Create the worker's parser with the same backend as the checker's parser."""
+    global _worker_parser
+    _worker_parser = TypeScriptParser(use_tree_sitter=use_tree_sitter)
+
+
+def _analyze_file_worker(file_path: Path) -> FileAnalysis:
+    """Analyze a file in a worker process (module-level so it pickles without the checker)."""
+    return _analyze_source_file(file_path, _worker_parser)
 
 
 class DependencyGraph:
@@ -29,119 +87,314 @@ class DependencyGraph:
     
     def __init__(self):
         # symbol_key -> set of symbol_keys it depends on
-        self.dependencies: Dict[str, Set[str]] = defaultdict(set)
+        self.dependencies: Dict[SymbolKey, Set[SymbolKey]] = defaultdict(set)
         # symbol_key -> set of symbol_keys that depend on it
-        self.dependents: Dict[str, Set[str]] = defaultdict(set)
+        self.dependents: Dict[SymbolKey, Set[SymbolKey]] = defaultdict(set)
         # Track all symbols
-        self.all_symbols: Set[str] = set()
+        self.all_symbols: Set[SymbolKey] = set()
         # Track which symbols are exports
-        self.exported_symbols: Set[str] = set()
+        self.exported_symbols: Set[SymbolKey] = set()
         # Track dead symbols
-        self.dead_symbols: Set[str] = set()
+        self.dead_symbols: Set[SymbolKey] = set()
         # Track transitively dead symbols
-        self.transitively_dead: Set[str] = set()
+        self.transitively_dead: Set[SymbolKey] = set()
+        # Dead symbol -> bitmask of the dead symbols its chain reaches (built by count_dead_chain)
+        self._dead_chain_masks: Optional[Dict[SymbolKey, int]] = None
     
-    def add_dependency(self, from_symbol: str, to_symbol: str) -> None:
+    def add_dependency(self, from_symbol: SymbolKey, to_symbol: SymbolKey) -> None:
         """Add a dependency relationship."""
         self.dependencies[from_symbol].add(to_symbol)
         self.dependents[to_symbol].add(from_symbol)
         self.all_symbols.add(from_symbol)
         self.all_symbols.add(to_symbol)
+        self._dead_chain_masks = None
     
-    def mark_as_export(self, symbol: str) -> None:
+    def add_file_dependencies(self, symbol_keys: List[SymbolKey], used_keys: List[SymbolKey]) -> None:
+        """Make each symbol of a file depend on every used symbol of that file other than itself.
+        
+        Equivalent to add_dependency for each (symbol, used symbol) pair, done as set updates.
+        """
+        used = set(used_keys)
+        if not used:
+            return
+        self._dead_chain_masks = None
+        symbols = set(symbol_keys)
+        for symbol_key in symbols:
+            targets = used - {symbol_key} if symbol_key in used else used
+            if targets:
+                self.dependencies[symbol_key].update(targets)
+                self.all_symbols.add(symbol_key)
+        for used_key in used:
+            sources = symbols - {used_key} if used_key in symbols else symbols
+            if sources:
+                self.dependents[used_key].update(sources)
+                self.all_symbols.add(used_key)
+    
+    def mark_as_export(self, symbol: SymbolKey) -> None:
         """Mark a symbol as an export."""
         self.exported_symbols.add(symbol)
         self.all_symbols.add(symbol)
     
-    def mark_as_dead(self, symbol: str) -> None:
+    def mark_as_dead(self, symbol: SymbolKey) -> None:
         """Mark a symbol as dead code."""
         self.dead_symbols.add(symbol)
+        self._dead_chain_masks = None
     
     def find_transitive_dead_code(self) -> None:
-        """Find all transitively dead code."""
-        # Multiple passes to find transitively dead code
-        changed = True
-        passes = 0
-        
-        while changed and passes < 10:  # Limit passes to avoid infinite loops
-            changed = False
-            passes += 1
+        """Find all transitively dead code.
+        
+        A symbol is transitively dead when every symbol depending on it is dead. A file-level
+        dependent counts as dead when the file has no live exports. Rather than re-scanning all
+        symbols until nothing changes, each candidate tracks how many live dependents it has;
+        symbols whose count drops to zero are processed from a worklist, so the fixed point is
+        reached in time linear in the graph size.
+        """
+        dead_symbols = self.dead_symbols
+        transitively_dead = self.transitively_dead
+        self._dead_chain_masks = None
+        
+        # Live exports per file, for deciding when a file-level dependent counts as dead
+        live_exports: Dict[Path, int] = defaultdict(int)
+        for symbol in self.exported_symbols:
+            if symbol not in dead_symbols and symbol not in transitively_dead:
+                live_exports[symbol[0]] += 1
+        
+        def is_dead_like(symbol: SymbolKey) -> bool:
+            return (symbol in dead_symbols or symbol in transitively_dead
+                    or (symbol[1] == '__file__' and not live_exports.get(symbol[0])))
+        
+        # Nodes known to count as dead dependents
+        dead_like = {
+            dependent
+            for dependents in self.dependents.values()
+            for dependent in dependents
+            if is_dead_like(dependent)
+        }
+        
+        # Live dependent counts for symbols that could still become transitively dead
+        live_counts: Dict[SymbolKey, int] = {}
+        worklist: List[SymbolKey] = []
+        for symbol in self.all_symbols:
+            if symbol in dead_symbols or symbol in transitively_dead:
+                continue
+            dependents = self.dependents.get(symbol)
+            # If it has no dependents and is an export, it might be directly dead (already handled)
+            if not dependents:
+                continue
+            live_count = sum(1 for dependent in dependents if dependent not in dead_like)
+            live_counts[symbol] = live_count
+            if live_count == 0:
+                worklist.append(symbol)
+        
+        def mark_dead_like(node: SymbolKey) -> None:
+            if node in dead_like:
+                return
+            dead_like.add(node)
+            for dependency in self.dependencies.get(node, ()):
+                if dependency in live_counts:
+                    live_counts[dependency] -= 1
+                    if live_counts[dependency] == 0:
+                        worklist.append(dependency)
+        
+        while worklist:
+            symbol = worklist.pop()
+            if symbol in transitively_dead:
+                continue
+            # This symbol is only used by dead code
+            transitively_dead.add(symbol)
+            mark_dead_like(symbol)
             
-            # Check each symbol that isn't already marked as dead
-            for symbol in list(self.all_symbols):
-                if symbol in self.dead_symbols or symbol in self.transitively_dead:
-                    continue
-                
-                # Check if this symbol is only used by dead code
-                dependents = self.dependents.get(symbol, set())
-                
-                # If it has no dependents and is an export, it might be directly dead (already handled)
-                if not dependents:
-                    continue
-                
-                # Check if ALL symbols that depend on this are dead
-                all_dependents_dead = True
-                for dependent in dependents:
-                    if dependent not in self.dead_symbols and dependent not in self.transitively_dead:
-                        # Special case: file-level dependencies - check if the file has any live exports
-                        if dependent.endswith(':__file__'):
-                            # Extract file path from dependent
-                            file_path = dependent[:-9]  # Remove ':__file__'
-                            # Check if this file has any non-dead exports
-                            has_live_exports = False
-                            for other_symbol in self.exported_symbols:
-                                if other_symbol.startswith(file_path + ':'):
-                                    if other_symbol not in self.dead_symbols and other_symbol not in self.transitively_dead:
-                                        has_live_exports = True
-                                        break
-                            if has_live_exports:
-                                all_dependents_dead = False
-                                break
-                        else:
-                            all_dependents_dead = False
-                            break
-                
-                if all_dependents_dead and dependents:
-                    # This symbol is only used by dead code
-                    self.transitively_dead.add(symbol)
-                    changed = True
+            if symbol in self.exported_symbols:
+                file_path = symbol[0]
+                live_exports[file_path] -= 1
+                if live_exports[file_path] == 0:
+                    mark_dead_like((file_path, '__file__'))
     
-    def count_dead_chain(self, symbol: str) -> int:
+    def count_dead_chain(self, symbol: SymbolKey) -> int:
         """Count total symbols in a dead code chain."""
-        visited = set()
-        queue = deque([symbol])
-        count = 0
+        if self._dead_chain_masks is None:
+            self._dead_chain_masks = self._build_dead_chain_masks()
+        mask = self._dead_chain_masks.get(symbol)
+        if mask is not None:
+            return mask.bit_count()
+        
+        # A live symbol: itself plus the chains of the dead symbols it uses
+        mask = 0
+        for dep in self.dependencies.get(symbol, ()):
+            mask |= self._dead_chain_masks.get(dep, 0)
+        return 1 + mask.bit_count()
+    
+    def _build_dead_chain_masks(self) -> Dict[SymbolKey, int]:
+        """Map each dead symbol to a bitmask of the dead symbols reachable from it, itself included.
         
-        while queue:
-            current = queue.popleft()
-            if current in visited:
+        Each dead symbol gets one bit. Tarjan's algorithm emits strongly connected components
+        after every component they depend on, so a component's mask is its members' bits OR'ed
+        with the finished masks of their dependencies, and every chain count is a popcount
+        instead of a breadth-first search.
+        """
+        dependencies = self.dependencies
+        bits = {symbol: 1 << i for i, symbol in enumerate(self.dead_symbols | self.transitively_dead)}
+        masks: Dict[SymbolKey, int] = {}
+        index: Dict[SymbolKey, int] = {}
+        lowlink: Dict[SymbolKey, int] = {}
+        stack: List[SymbolKey] = []
+        on_stack: Set[SymbolKey] = set()
+        
+        def visit(node: SymbolKey) -> Tuple[SymbolKey, Iterator[SymbolKey]]:
+            index[node] = lowlink[node] = len(index)
+            stack.append(node)
+            on_stack.add(node)
+            return node, iter(dependencies.get(node, ()))
+        
+        for root in bits:
+            if root in index:
                 continue
-            visited.add(current)
-            count += 1
-            
-            # Add all symbols that only this symbol uses
-            for dep in self.dependencies.get(current, set()):
-                if dep in self.dead_symbols or dep in self.transitively_dead:
-                    queue.append(dep)
+            frames = [visit(root)]
+            while frames:
+                node, children = frames[-1]
+                for child in children:
+                    if child not in bits:
+                        continue
+                    if child not in index:
+                        frames.append(visit(child))
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                else:
+                    frames.pop()
+                    if frames:
+                        parent = frames[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] != index[node]:
+                        continue
+                    
+                    # node roots a component: pop it and combine its reach
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    mask = 0
+                    for member in component:
+                        mask |= bits[member]
+                        for dep in dependencies.get(member, ()):
+                            mask |= masks.get(dep, 0)
+                    for member in component:
+                        masks[member] = mask
         
-        return count
+        return masks
+
+
+class ImportIndex:
+    """Import usage resolved in a single pass over all analyzed files."""
+    
+    def __init__(self):
+        # Importing file -> (import, resolved target path) for each of its imports that resolves
+        self.resolved_imports: Dict[Path, List[Tuple[Import, Path]]] = {}
+        # Normalized symbol keys used by any import, including re-export origins
+        self.imported_symbols: Set[SymbolKey] = set()
+        # Files imported as a whole (namespace or dynamic imports)
+        self.namespace_targets: Set[Path] = set()
+        # Re-export symbol key -> symbol key it re-exports from
+        self.aliased_sources: Dict[SymbolKey, SymbolKey] = {}
 
 
 class DeadCodeChecker:
     """Detects dead code in TypeScript/JavaScript codebases."""
     
-    def __init__(self, target_path: str = "src"):
+    def __init__(self, target_path: str = "src", cache_file: Optional[str] = None, parser: Optional[TypeScriptParser] = None):
         self.target_path = Path(target_path)
+        self.analysis_cache = AnalysisCache(cache_file)
+        self._target_prefix = str(self.target_path)
         self.src_path = Path("src")  # Always analyze full src
+        self._src_prefix = str(self.src_path) + os.sep
         self.file_cache: Dict[Path, FileAnalysis] = {}
         self.export_map: Dict[str, List[Export]] = defaultdict(list)
         self.import_map: Dict[str, List[Import]] = defaultdict(list)
         self.exceptions: Set[str] = set()
         self.dependency_graph = DependencyGraph()
-        self.parser = TypeScriptParser()
+        self.import_index = ImportIndex()
+        self.parser = parser or TypeScriptParser()
+        self._resolved_paths: Dict[Tuple[str, Path], Optional[Path]] = {}
+        self._normalized_paths: Dict[Tuple[Path, Path], Path] = {}
+        self._exception_cache: Dict[Path, bool] = {}
+        self._barrel_cache: Dict[Path, bool] = {}
+        self._discovered: Optional[Tuple[List[Path], List[Path]]] = None
+        self._rel_cache: Dict[Path, str] = {}
+        self._canonical_paths: Dict[Path, Path] = {}
+        # Whole-project export and re-export maps, computed once per run
+        self._all_exports: Dict[SymbolKey, Export] = {}
+        self._reexport_chains: Dict[SymbolKey, Set[SymbolKey]] = {}
+        # Analyzed files that fall under target_path (filled once files are analyzed)
+        self._in_target_files: Set[Path] = set()
         
         self._load_exceptions()
     
+    def _analysis_cache_version(self) -> Tuple[int, bytes, str]:
+        """Identify the analysis format so code changes (or a parser backend switch) invalidate the cache.
+        
+        The digest covers the parser, this module (per-file analysis) and the models the
+        cached analyses are made of.
+        """
+        code_digest = source_digest(
+            sys.modules[TypeScriptParser.__module__].__file__,
+            __file__,
+            sys.modules[FileAnalysis.__module__].__file__,
+        )
+        return (ANALYSIS_CACHE_VERSION, code_digest, self.parser.backend)
+    
+    def _analyze_project_files(self, files: List[Path]) -> None:
+        """Fill file_cache, reusing cached analyses of unchanged files (stored without content)."""
+        version = self._analysis_cache_version() if self.analysis_cache.enabled else None
+        cached = self.analysis_cache.load(version)
+        entries: Dict[Path, CacheEntry] = {}
+        stats: Dict[Path, Tuple[int, int]] = {}
+        analyses: Dict[Path, FileAnalysis] = {}
+        stale_files: List[Path] = []
+        for file_path in files:
+            stat = self.analysis_cache.stat(file_path)
+            if stat is not None:
+                stats[file_path] = stat
+            entry = self.analysis_cache.reuse(cached.get(file_path), file_path, stat)
+            if entry is None:
+                stale_files.append(file_path)
+                continue
+            entries[file_path] = entry
+            analyses[file_path] = entry[3]
+        
+        for file_path, analysis in zip(stale_files, self._parse_files(stale_files)):
+            analyses[file_path] = analysis
+            if file_path in stats:
+                entries[file_path] = stats[file_path] + (
+                    content_digest(analysis.content), replace(analysis, content=""),
+                )
+        
+        for file_path in files:
+            analysis = analyses[file_path]
+            # Key by the analysis' own path object, shared by its exports, imports and symbols
+            self.file_cache[analysis.path] = analysis
+        
+        if entries != cached:
+            self.analysis_cache.save(entries, version)
+    
+    def _parse_files(self, files: List[Path]) -> Iterator[FileAnalysis]:
+        """Analyze files in order, sharding them across worker processes when worthwhile."""
+        max_workers = os.cpu_count() or 1
+        if max_workers == 1 or len(files) < PROCESS_POOL_MIN_FILES:
+            return (_analyze_source_file(file_path, self.parser) for file_path in files)
+        return self._parse_files_in_pool(files, max_workers)
+    
+    def _parse_files_in_pool(self, files: List[Path], max_workers: int) -> Iterator[FileAnalysis]:
+        # Parsing is CPU-bound, so use processes rather than threads to sidestep the GIL.
+        chunksize = max(1, len(files) // (max_workers * 4))
+        use_tree_sitter = self.parser.backend == 'tree-sitter'
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_analysis_worker, initargs=(use_tree_sitter,)
+        ) as executor:
+            yield from executor.map(_analyze_file_worker, files, chunksize=chunksize)
+    
     def _load_exceptions(self) -> None:
         """Load dead code exceptions from .deadcode-ignore file."""
         ignore_file = Path(".deadcode-ignore")
@@ -153,12 +406,14 @@ class DeadCodeChecker:
                         self.exceptions.add(line)
     
     def _is_exception(self, file_path: Path) -> bool:
-        """Check if file matches any exception pattern."""
-        file_str = str(file_path)
-        return any(
-            self._matches_pattern(file_str, pattern) 
-            for pattern in self.exceptions
-        )
+        """Check if file matches any exception pattern (memoized per path)."""
+        if file_path not in self._exception_cache:
+            file_str = str(file_path)
+            self._exception_cache[file_path] = any(
+                self._matches_pattern(file_str, pattern) 
+                for pattern in self.exceptions
+            )
+        return self._exception_cache[file_path]
     
     def _matches_pattern(self, file_str: str, pattern: str) -> bool:
         """Check if file matches a glob-like pattern."""
@@ -172,6 +427,27 @@ class DeadCodeChecker:
         else:
             return pattern in file_str
     
+    def _canonical_path(self, file_path: Path) -> Path:
+        """Return one shared Path object per distinct path.
+        
+        Symbol keys are (Path, str) tuples; when both keys hold the same Path object,
+        tuple comparison short-circuits on identity instead of calling Path.__eq__.
+        """
+        return self._canonical_paths.setdefault(file_path, file_path)
+    
+    def _relativize(self, file_path: Path) -> str:
+        """Path relative to src for reports, or the path as-is outside src (memoized)."""
+        if file_path not in self._rel_cache:
+            file_str = str(file_path)
+            if file_str.startswith(self._src_prefix):
+                self._rel_cache[file_path] = file_str[len(self._src_prefix):]
+            else:
+                try:
+                    self._rel_cache[file_path] = str(file_path.relative_to(self.src_path))
+                except ValueError:
+                    self._rel_cache[file_path] = file_str
+        return self._rel_cache[file_path]
+    
     def _is_test_file(self, file_path: Path) -> bool:
         """Check if file is a test file."""
         file_str = str(file_path)
@@ -180,20 +456,57 @@ class DeadCodeChecker:
         ])
     
     def _is_barrel_file(self, file_path: Path) -> bool:
-        """Check if file is a barrel/index file."""
-        return file_path.name in ['index.ts', 'index.tsx', 'index.js', 'index.jsx']
+        """Check if file is a barrel/index file (memoized per path)."""
+        if file_path not in self._barrel_cache:
+            self._barrel_cache[file_path] = file_path.name in ['index.ts', 'index.tsx', 'index.js', 'index.jsx']
+        return self._barrel_cache[file_path]
+    
+    def _walk_source_files(self, root: Path) -> List[Path]:
+        """Find TypeScript/JavaScript files under root in a single directory walk."""
+        files = []
+        pending = [str(root)]
+        
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        # Filter out node_modules
+                        if "node_modules" in entry.name:
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith(SOURCE_EXTENSIONS) and entry.is_file():
+                            files.append(Path(entry.path))
+            except OSError:
+                continue
+        
+        return files
+    
+    def _discover(self) -> Tuple[List[Path], List[Path]]:
+        """Find all src files and the target files to check, walking src only once.
+        
+        Returns (all src files, target files excluding tests). Cached after the first call.
+        """
+        if self._discovered is None:
+            src_files = self._walk_source_files(self.src_path)
+            
+            target_parts = self.target_path.parts
+            if target_parts[:len(self.src_path.parts)] == self.src_path.parts:
+                # Target lies within src: select its files from the same walk
+                candidates = [f for f in src_files if f.parts[:len(target_parts)] == target_parts]
+            else:
+                candidates = self._walk_source_files(self.target_path)
+            
+            # Filter out test files
+            target_files = [f for f in candidates if not self._is_test_file(f)]
+            self._discovered = (src_files, target_files)
+        
+        return self._discovered
     
     def _find_all_src_files(self) -> List[Path]:
         """Find all TypeScript files in src directory."""
-        files = []
-        for pattern in ["**/*.ts", "**/*.tsx", "**/*.js", "**/*.jsx"]:
-            files.extend(self.src_path.glob(pattern))
-
-        # Filter out node_modules
-        return [
-            f for f in files
-            if "node_modules" not in str(f)
-        ]
+        return self._discover()[0]
 
     def _find_all_project_files(self) -> List[Path]:
         """Find all relevant files in project for usage analysis."""
@@ -205,12 +518,7 @@ class DeadCodeChecker:
         # Include build scripts directory
         scripts_path = Path("scripts")
         if scripts_path.exists():
-            for pattern in ["**/*.ts", "**/*.tsx", "**/*.js", "**/*.jsx"]:
-                script_files = scripts_path.glob(pattern)
-                files.extend([
-                    f for f in script_files
-                    if "node_modules" not in str(f)
-                ])
+            files.extend(self._walk_source_files(scripts_path))
 
         # Include configuration files that might import from src
         root_path = Path(".")
@@ -260,15 +568,7 @@ class DeadCodeChecker:
 
     def _find_target_files(self) -> List[Path]:
         """Find files in the target path to check for dead code."""
-        files = []
-        for pattern in ["**/*.ts", "**/*.tsx", "**/*.js", "**/*.jsx"]:
-            files.extend(self.target_path.glob(pattern))
-        
-        # Filter out node_modules and test files
-        return [
-            f for f in files 
-            if "node_modules" not in str(f) and not self._is_test_file(f)
-        ]
+        return self._discover()[1]
     
     def _extract_exports(self, content: str, file_path: Path) -> List[Export]:
         """Extract export statements from file content."""
@@ -734,33 +1034,17 @@ class DeadCodeChecker:
     
     def _analyze_file(self, file_path: Path) -> FileAnalysis:
         """Analyze a single TypeScript file using shared parser."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            exports = self.parser.extract_exports(content, file_path)
-            imports = self.parser.extract_imports(content, file_path)
-            symbols = self.parser.extract_symbols(content, file_path)
-            used_symbols = self.parser.find_symbol_usage(content)
-            interface_implementations = self.parser.extract_interface_implementations(content, file_path)
-            
-            analysis = FileAnalysis(
-                path=file_path,
-                exports=exports,
-                imports=imports,
-                symbols=symbols,
-                used_symbols=used_symbols,
-                interface_implementations=interface_implementations,
-                content=content,
-                lines=len(content.split('\n'))
-            )
-            
-            return analysis
-            
-        except (UnicodeDecodeError, OSError) as e:
-            return FileAnalysis(path=file_path)
+        return _analyze_source_file(file_path, self.parser)
     
     def _resolve_import_path(self, import_path: str, from_file: Path) -> Optional[Path]:
+        """Resolve import path, memoized per import path and importing directory."""
+        cache_key = (import_path, from_file.parent)
+        if cache_key not in self._resolved_paths:
+            resolved_path = self._resolve_import_path_uncached(import_path, from_file)
+            self._resolved_paths[cache_key] = self._canonical_path(resolved_path) if resolved_path else None
+        return self._resolved_paths[cache_key]
+    
+    def _resolve_import_path_uncached(self, import_path: str, from_file: Path) -> Optional[Path]:
         """Resolve relative import path to file path consistent with cache storage."""
         if import_path.startswith('.'):
             # Relative import
@@ -807,62 +1091,83 @@ class DeadCodeChecker:
 
         return None
     
+    def _collect_edges_for_file(self, file_analysis: FileAnalysis) -> Tuple[List[SymbolKey], List[SymbolKey], List[Tuple[SymbolKey, SymbolKey]], Tuple[List[SymbolKey], List[SymbolKey]]]:
+        """Collect a file's graph contributions without changing the graph.
+        
+        Imports are read already resolved from the import index.
+        Returns (export keys, internal symbol keys, import edges, (symbol keys, used symbol keys)).
+        """
+        export_keys = [(export.file_path, export.name) for export in file_analysis.exports]
+        internal_keys = [
+            (symbol.file_path, symbol.name)
+            for symbol in file_analysis.symbols
+            if not symbol.is_exported
+        ]
+        
+        import_edges = []
+        from_symbol = (file_analysis.path, '__file__')  # File-level dependency
+        for imp, resolved_path in self.import_index.resolved_imports.get(file_analysis.path, ()):
+            if resolved_path in self.file_cache:
+                # Handle different import types
+                if imp.import_type == 'namespace':
+                    # For namespace imports (import * as foo), mark all exports as potentially used
+                    resolved_analysis = self.file_cache[resolved_path]
+                    for export in resolved_analysis.exports:
+                        import_edges.append((from_symbol, (resolved_path, export.name)))
+                else:
+                    # Find the actual export name (handle aliasing)
+                    export_name = imp.original_name if hasattr(imp, 'original_name') and imp.original_name else imp.name
+                    import_edges.append((from_symbol, (resolved_path, export_name)))
+        
+        # Track which symbols use which other symbols within the file
+        # This is simplified - ideally we'd parse actual usage: every symbol depends on every
+        # used symbol, so the pairs are left to the graph to join as whole sets
+        symbol_keys = [(symbol.file_path, symbol.name) for symbol in file_analysis.symbols]
+        used_keys = [key for key in symbol_keys if key[1] in file_analysis.used_symbols]
+        
+        return export_keys, internal_keys, import_edges, (symbol_keys, used_keys)
+    
     def _build_dependency_graph(self) -> None:
         """Build the dependency graph from analyzed files."""
-        # First, register all exports
-        for file_analysis in self.file_cache.values():
-            for export in file_analysis.exports:
-                symbol_key = f"{export.file_path}:{export.name}"
-                self.dependency_graph.mark_as_export(symbol_key)
-            
-            # Also track internal symbols
-            for symbol in file_analysis.symbols:
-                if not symbol.is_exported:
-                    symbol_key = f"{symbol.file_path}:{symbol.name}"
-                    self.dependency_graph.all_symbols.add(symbol_key)
+        # Collect per-file edges, then merge them in file order. This runs serially: it is
+        # pure Python (threads only contend for the GIL) and fills the path resolution memos.
+        file_edges = [self._collect_edges_for_file(file_analysis) for file_analysis in self.file_cache.values()]
         
-        # Build import dependencies
-        for file_analysis in self.file_cache.values():
-            for imp in file_analysis.imports:
-                resolved_path = self._resolve_import_path(imp.from_path, imp.file_path)
-                if resolved_path and resolved_path in self.file_cache:
-                    # Handle different import types
-                    if imp.import_type == 'namespace':
-                        # For namespace imports (import * as foo), mark all exports as potentially used
-                        resolved_analysis = self.file_cache[resolved_path]
-                        for export in resolved_analysis.exports:
-                            from_symbol = f"{imp.file_path}:__file__"
-                            to_symbol = f"{resolved_path}:{export.name}"
-                            self.dependency_graph.add_dependency(from_symbol, to_symbol)
-                    else:
-                        # Find the actual export name (handle aliasing)
-                        export_name = imp.original_name if hasattr(imp, 'original_name') and imp.original_name else imp.name
-                        
-                        # Create dependency relationship
-                        from_symbol = f"{imp.file_path}:__file__"  # File-level dependency
-                        to_symbol = f"{resolved_path}:{export_name}"
-                        self.dependency_graph.add_dependency(from_symbol, to_symbol)
+        graph = self.dependency_graph
         
-        # Build internal dependencies within files
+        # First, register all exports and internal symbols
+        for export_keys, internal_keys, _, _ in file_edges:
+            for symbol_key in export_keys:
+                graph.mark_as_export(symbol_key)
+            graph.all_symbols.update(internal_keys)
+        
+        # Then import dependencies, then internal dependencies within files
+        for _, _, import_edges, _ in file_edges:
+            for from_symbol, to_symbol in import_edges:
+                graph.add_dependency(from_symbol, to_symbol)
+        for _, _, _, (symbol_keys, used_keys) in file_edges:
+            graph.add_file_dependencies(symbol_keys, used_keys)
+    
+    def _build_export_map(self) -> Dict[SymbolKey, Export]:
+        """Map every export in the project by its normalized symbol key (last one wins)."""
+        project_root = Path(".").resolve()
+        all_exports = {}
         for file_analysis in self.file_cache.values():
-            # Track which symbols use which other symbols within the file
-            for symbol in file_analysis.symbols:
-                symbol_key = f"{symbol.file_path}:{symbol.name}"
-                
-                # This is simplified - ideally we'd parse actual usage
-                for other_symbol in file_analysis.symbols:
-                    if other_symbol.name != symbol.name and other_symbol.name in file_analysis.used_symbols:
-                        other_key = f"{other_symbol.file_path}:{other_symbol.name}"
-                        self.dependency_graph.add_dependency(symbol_key, other_key)
+            normalized_path = self._normalize_path(file_analysis.path, project_root)
+            for export in file_analysis.exports:
+                all_exports[(normalized_path, export.name)] = export
+        return all_exports
     
-    def _build_reexport_chains(self) -> Dict[str, Set[str]]:
+    def _build_reexport_chains(self) -> Dict[SymbolKey, Set[SymbolKey]]:
         """Build mapping from original exports to all their re-export locations.
         
         Returns a dict mapping original symbol keys to sets of re-export symbol keys.
         """
-        from collections import defaultdict
+        # Append while collecting; duplicates are dropped once at the end
+        reexport_chains: Dict[SymbolKey, List[SymbolKey]] = {}
         
-        reexport_chains = defaultdict(set)
+        # Origins of each wildcard source's exports, computed once per source file
+        wildcard_origins: Dict[Path, List[Tuple[SymbolKey, str]]] = {}
         
         for file_analysis in self.file_cache.values():
             for export in file_analysis.exports:
@@ -874,34 +1179,45 @@ class DeadCodeChecker:
                         if export.export_type == 'wildcard':
                             # Handle wildcard exports: export * from './file'
                             # Mark ALL exports from the source file as re-exported
-                            source_analysis = self.file_cache[source_path]
-                            for source_export in source_analysis.exports:
-                                if source_export.is_reexport:
-                                    # Handle transitive re-exports: if A re-exports from B, and C re-exports * from A,
-                                    # then C should also re-export from B
-                                    if source_export.from_path:
-                                        # Resolve the original source
-                                        original_source_path = self._resolve_import_path(source_export.from_path, source_path)
-                                        if original_source_path and original_source_path in self.file_cache:
-                                            original_key = f"{original_source_path}:{source_export.name}"
-                                            reexport_key = f"{export.file_path}:{source_export.name}"
-                                            reexport_chains[original_key].add(reexport_key)
-                                else:
-                                    # Direct export from this file
-                                    original_key = f"{source_path}:{source_export.name}"
-                                    reexport_key = f"{export.file_path}:{source_export.name}"
-                                    reexport_chains[original_key].add(reexport_key)
+                            if source_path not in wildcard_origins:
+                                wildcard_origins[source_path] = self._collect_wildcard_origins(source_path)
+                            for original_key, name in wildcard_origins[source_path]:
+                                reexport_chains.setdefault(original_key, []).append((export.file_path, name))
                         else:
                             # Handle named re-exports: export { foo } from './file' or export { foo as bar }
                             # For aliased exports, we need to map from the original name to the alias
                             source_name = export.original_name if export.original_name else export.name
-                            original_key = f"{source_path}:{source_name}"
-                            reexport_key = f"{export.file_path}:{export.name}"
-                            reexport_chains[original_key].add(reexport_key)
+                            original_key = (source_path, source_name)
+                            reexport_key = (export.file_path, export.name)
+                            reexport_chains.setdefault(original_key, []).append(reexport_key)
         
-        return reexport_chains
+        return {key: set(reexport_keys) for key, reexport_keys in reexport_chains.items()}
+
+    def _collect_wildcard_origins(self, source_path: Path) -> List[Tuple[SymbolKey, str]]:
+        """List (original symbol key, exported name) for every export of a wildcard source."""
+        origins = []
+        for source_export in self.file_cache[source_path].exports:
+            if source_export.is_reexport:
+                # Handle transitive re-exports: if A re-exports from B, and C re-exports * from A,
+                # then C should also re-export from B
+                if source_export.from_path:
+                    # Resolve the original source
+                    original_source_path = self._resolve_import_path(source_export.from_path, source_path)
+                    if original_source_path and original_source_path in self.file_cache:
+                        origins.append(((original_source_path, source_export.name), source_export.name))
+            else:
+                # Direct export from this file
+                origins.append(((source_path, source_export.name), source_export.name))
+        return origins
 
-    def _normalize_path(self, file_path: Path, project_root: Path) -> str:
+    def _normalize_path(self, file_path: Path, project_root: Path) -> Path:
+        """Normalize file path to be relative to project root (memoized)."""
+        cache_key = (file_path, project_root)
+        if cache_key not in self._normalized_paths:
+            self._normalized_paths[cache_key] = self._canonical_path(self._normalize_path_uncached(file_path, project_root))
+        return self._normalized_paths[cache_key]
+
+    def _normalize_path_uncached(self, file_path: Path, project_root: Path) -> Path:
         """Normalize file path to be relative to project root."""
         try:
             # Ensure both paths are resolved (absolute)
@@ -909,156 +1225,107 @@ class DeadCodeChecker:
             resolved_root = project_root.resolve()
 
             # Try to make relative
-            relative_path = resolved_file.relative_to(resolved_root)
-            return str(relative_path)
+            return resolved_file.relative_to(resolved_root)
         except ValueError:
-            # If relative conversion fails, use the string representation
-            return str(file_path)
-
-    def _trace_reexport_usage(self, file_path: Path, symbol_name: str, imported_symbols: set, visited: set = None, project_root: Path = None) -> None:
-        """Recursively trace re-export chains to mark original sources as used."""
-        if visited is None:
-            visited = set()
-
-        # Prevent infinite recursion
-        key = f"{file_path}:{symbol_name}"
-        if key in visited:
-            return
-        visited.add(key)
-
-
-        if file_path not in self.file_cache:
-            return
-
-        file_analysis = self.file_cache[file_path]
-        for export in file_analysis.exports:
-            if export.name == symbol_name:
-                if export.is_reexport and export.from_path:
-                    # This is a re-export, trace to the original source
-                    source_path = self._resolve_import_path(export.from_path, file_path)
-                    if source_path:
-                        # Mark original source as used - normalize path
-                        source_name = export.original_name if export.original_name else export.name
-                        if project_root is None:
-                            project_root = Path(".").resolve()
-                        normalized_source_path = self._normalize_path(source_path, project_root)
-                        source_key = f"{normalized_source_path}:{source_name}"
-                        imported_symbols.add(source_key)
-
-                        # Continue tracing recursively
-                        self._trace_reexport_usage(source_path, source_name, imported_symbols, visited, project_root)
-                break
-
-    def _mark_dead_symbols(self) -> None:
-        """Mark symbols as dead without reporting them yet, considering re-export chains."""
+            # If relative conversion fails, keep the path as given
+            return file_path
 
-        # Build export map from all analyzed files (excluding re-exports for dead detection)
-        all_exports = {}
+    def _build_import_index(self) -> ImportIndex:
+        """Resolve every import once and collect the exports they use."""
+        index = ImportIndex()
         project_root = Path(".").resolve()
-        for file_analysis in self.file_cache.values():
-            for export in file_analysis.exports:
-                # Normalize path to be relative to project root
-                normalized_path = self._normalize_path(export.file_path, project_root)
-                key = f"{normalized_path}:{export.name}"
-                all_exports[key] = export
         
-        # Build re-export chains
-        reexport_chains = self._build_reexport_chains()
+        def normalize(path: Path) -> Path:
+            return self._normalize_path(path, project_root)
         
-        # Check package.json script usage for additional file-level usage
-        package_json_used_files = self._analyze_package_json_usage()
-
-        # Build import usage map from ALL files (including outside target)
-        imported_symbols = set()
         for file_analysis in self.file_cache.values():
+            # Record where each re-export comes from (first export wins per name)
+            seen_names = set()
+            for export in file_analysis.exports:
+                if export.name in seen_names:
+                    continue
+                seen_names.add(export.name)
+                if export.is_reexport and export.from_path:
+                    source_path = self._resolve_import_path(export.from_path, export.file_path)
+                    if source_path:
+                        source_name = export.original_name if export.original_name else export.name
+                        index.aliased_sources[(export.file_path, export.name)] = (source_path, source_name)
+            
+            resolved_imports = []
             for imp in file_analysis.imports:
                 resolved_path = self._resolve_import_path(imp.from_path, imp.file_path)
-                if resolved_path:
-                    if imp.import_type == 'namespace':
-                        # For namespace imports, mark all exports from that file as used
-                        if resolved_path in self.file_cache:
-                            resolved_analysis = self.file_cache[resolved_path]
-                            for export in resolved_analysis.exports:
-                                if export.is_reexport and export.from_path:
-                                    # Add the original source
-                                    source_path = self._resolve_import_path(export.from_path, resolved_path)
-                                    if source_path:
-                                        # Use the original name from the source, not the aliased name
-                                        source_name = export.original_name if export.original_name else export.name
-                                        normalized_source_path = self._normalize_path(source_path, project_root)
-                                        source_key = f"{normalized_source_path}:{source_name}"
-                                        imported_symbols.add(source_key)
-                                else:
-                                    # Regular export - normalize path
-                                    normalized_path = self._normalize_path(resolved_path, project_root)
-                                    key = f"{normalized_path}:{export.name}"
-                                    imported_symbols.add(key)
-                    elif imp.import_type == 'dynamic':
-                        # For dynamic imports (import('path')), mark all exports from that file as used
-                        # Similar to namespace imports, since dynamic imports can access all exports
-                        if resolved_path in self.file_cache:
-                            resolved_analysis = self.file_cache[resolved_path]
-                            for export in resolved_analysis.exports:
-                                if export.is_reexport and export.from_path:
-                                    # Add the original source
-                                    source_path = self._resolve_import_path(export.from_path, resolved_path)
-                                    if source_path:
-                                        # Use the original name from the source, not the aliased name
-                                        source_name = export.original_name if export.original_name else export.name
-                                        normalized_source_path = self._normalize_path(source_path, project_root)
-                                        source_key = f"{normalized_source_path}:{source_name}"
-                                        imported_symbols.add(source_key)
-                                else:
-                                    # Regular export - normalize path
-                                    normalized_path = self._normalize_path(resolved_path, project_root)
-                                    key = f"{normalized_path}:{export.name}"
-                                    imported_symbols.add(key)
-                    else:
-                        # Handle aliasing
-                        export_name = imp.original_name if hasattr(imp, 'original_name') and imp.original_name else imp.name
-                        
-                        # Normalize path to be relative to project root for consistency
-                        normalized_path = self._normalize_path(resolved_path, project_root)
-                        key = f"{normalized_path}:{export_name}"
-                        imported_symbols.add(key)
-
-                        # Check if this is a re-export and add the source (recursively trace)
-                        self._trace_reexport_usage(resolved_path, export_name, imported_symbols, project_root=project_root)
-                        
-                        # Handle default imports
-                        if imp.import_type == 'default':
-                            normalized_path = self._normalize_path(resolved_path, project_root)
-                            default_key = f"{normalized_path}:default"
-                            imported_symbols.add(default_key)
-
-
-        # Mark exports as dead, considering re-export chains
-        for symbol_key, export in all_exports.items():
-            if export.is_reexport:
-                continue  # Skip re-exports, we'll check originals
+                if not resolved_path:
+                    continue
+                resolved_imports.append((imp, resolved_path))
+                
+                if imp.import_type in ('namespace', 'dynamic'):
+                    # Namespace and dynamic imports can access every export of the module
+                    if resolved_path in self.file_cache:
+                        index.namespace_targets.add(resolved_path)
+            if resolved_imports:
+                index.resolved_imports[file_analysis.path] = resolved_imports
+        
+        # Named and default imports: mark the export and trace re-export chains to the origin
+        for resolved_imports in index.resolved_imports.values():
+            for imp, resolved_path in resolved_imports:
+                if imp.import_type in ('namespace', 'dynamic'):
+                    continue
+                
+                export_name = imp.original_name if hasattr(imp, 'original_name') and imp.original_name else imp.name
+                index.imported_symbols.add((normalize(resolved_path), export_name))
+                
+                symbol_key = (resolved_path, export_name)
+                visited = set()
+                while symbol_key in index.aliased_sources and symbol_key not in visited:
+                    visited.add(symbol_key)
+                    source_path, source_name = index.aliased_sources[symbol_key]
+                    index.imported_symbols.add((normalize(source_path), source_name))
+                    symbol_key = (source_path, source_name)
+                
+                if imp.import_type == 'default':
+                    index.imported_symbols.add((normalize(resolved_path), 'default'))
+        
+        # Whole-module imports: mark all exports, using the original source for re-exports
+        for target_path in index.namespace_targets:
+            for export in self.file_cache[target_path].exports:
+                if export.is_reexport and export.from_path:
+                    source_path = self._resolve_import_path(export.from_path, target_path)
+                    if source_path:
+                        # Use the original name from the source, not the aliased name
+                        source_name = export.original_name if export.original_name else export.name
+                        index.imported_symbols.add((normalize(source_path), source_name))
+                else:
+                    index.imported_symbols.add((normalize(target_path), export.name))
+        
+        return index
 
-            # Check if this symbol is used directly
-            is_used = symbol_key in imported_symbols
+    def _find_dead_symbols_in_file(self, file_analysis: FileAnalysis, project_root: Path, candidates: Set[SymbolKey], package_json_used_files: Set[str], implemented_interfaces: Set[str]) -> Tuple[List[SymbolKey], List[SymbolKey]]:
+        """Find a file's dead exports and dead local symbols without marking them in the graph.
+        
+        Only exports in candidates (not re-exports, not imported directly) need the fallback checks.
+        """
+        imported_symbols = self.import_index.imported_symbols
+        reexport_chains = self._reexport_chains
+        
+        # This file's keys in the project-wide export map
+        normalized_path = self._normalize_path(file_analysis.path, project_root)
+        file_export_keys = dict.fromkeys((normalized_path, export.name) for export in file_analysis.exports)
+        
+        dead_exports = []
+        for symbol_key in file_export_keys:
+            if symbol_key not in candidates:
+                continue  # Re-export (we check originals) or used directly
+            export = self._all_exports[symbol_key]
 
-            # If not used directly, check if any of its re-exports are used
-            if not is_used:
-                reexport_keys = reexport_chains.get(symbol_key, set())
-                for reexport_key in reexport_keys:
-                    if reexport_key in imported_symbols:
-                        is_used = True
-                        break
+            # Not used directly: check if any of its re-exports are used
+            is_used = any(
+                reexport_key in imported_symbols
+                for reexport_key in reexport_chains.get(symbol_key, ())
+            )
             
-            # Special handling for interfaces: check if they have implementations
+            # Special handling for interfaces: if they have implementations, mark them as used
             if not is_used and export.export_type in ['interface', 'type']:
-                # Check if this interface has implementations across all files
-                has_implementations = False
-                for file_analysis in self.file_cache.values():
-                    if export.name in file_analysis.interface_implementations:
-                        has_implementations = True
-                        break
-                
-                # If interface has implementations, mark it as used
-                if has_implementations:
+                if export.name in implemented_interfaces:
                     is_used = True
             
             # Check if file is used by package.json scripts
@@ -1080,21 +1347,58 @@ class DeadCodeChecker:
             
             # Mark as dead if not used anywhere
             if not is_used:
-                self.dependency_graph.mark_as_dead(symbol_key)
+                dead_exports.append(symbol_key)
         
-        # Mark unused local symbols as dead
-        for file_analysis in self.file_cache.values():
-            for symbol in file_analysis.symbols:
-                if symbol.name not in file_analysis.used_symbols:
-                    if not symbol.name.startswith('_') and symbol.symbol_type not in ['interface', 'type']:
-                        symbol_key = f"{symbol.file_path}:{symbol.name}"
-                        self.dependency_graph.mark_as_dead(symbol_key)
+        # Unused local symbols
+        dead_locals = [
+            (symbol.file_path, symbol.name)
+            for symbol in file_analysis.symbols
+            if symbol.name not in file_analysis.used_symbols
+            and not symbol.name.startswith('_')
+            and symbol.symbol_type not in ['interface', 'type']
+        ]
+        
+        return dead_exports, dead_locals
+    
+    def _mark_dead_symbols(self) -> None:
+        """Mark symbols as dead without reporting them yet, considering re-export chains."""
+        project_root = Path(".").resolve()
+        
+        # Check package.json script usage for additional file-level usage
+        package_json_used_files = self._analyze_package_json_usage()
+        
+        # Interfaces implemented anywhere in the project
+        implemented_interfaces: Set[str] = set().union(
+            *(file_analysis.interface_implementations for file_analysis in self.file_cache.values())
+        )
+
+        # Most exports are imported directly; only the rest need the fallback checks
+        candidates = {
+            symbol_key for symbol_key, export in self._all_exports.items()
+            if not export.is_reexport
+        } - self.import_index.imported_symbols
+
+        # Check each file against import usage from ALL files (including outside target)
+        file_dead_symbols = [
+            self._find_dead_symbols_in_file(
+                file_analysis, project_root, candidates, package_json_used_files, implemented_interfaces
+            )
+            for file_analysis in self.file_cache.values()
+        ]
+        
+        # Merge in file order: dead exports first, then unused local symbols
+        for dead_exports, _ in file_dead_symbols:
+            for symbol_key in dead_exports:
+                self.dependency_graph.mark_as_dead(symbol_key)
+        for _, dead_locals in file_dead_symbols:
+            for symbol_key in dead_locals:
+                self.dependency_graph.mark_as_dead(symbol_key)
     
     def _check_unused_exports(self, results: CheckResults, dead_files: set) -> None:
         """Report unused exports that aren't in dead files."""
         for file_analysis in self.file_cache.values():
             # Only report on files in target path
-            if not str(file_analysis.path).startswith(str(self.target_path)):
+            if file_analysis.path not in self._in_target_files:
                 continue
             
             # Skip if file is already reported as dead
@@ -1106,7 +1410,7 @@ class DeadCodeChecker:
                 continue
             
             for export in file_analysis.exports:
-                symbol_key = f"{file_analysis.path}:{export.name}"
+                symbol_key = (file_analysis.path, export.name)
                 
                 # Only report if marked as dead and not used internally
                 if symbol_key in self.dependency_graph.dead_symbols:
@@ -1119,10 +1423,7 @@ class DeadCodeChecker:
                     
                     # Only report as error if not used anywhere (internally or externally)
                     if not is_used_internally:
-                        try:
-                            relative_path = str(export.file_path.relative_to(self.src_path))
-                        except ValueError:
-                            relative_path = str(export.file_path)
+                        relative_path = self._relativize(export.file_path)
                         
                         issue = DeadCodeIssue.create_error(
                             message=f"Unused export '{export.name}'",
@@ -1144,7 +1445,7 @@ class DeadCodeChecker:
         """Check for unused local symbols within files."""
         for file_analysis in self.file_cache.values():
             # Only check files in target path
-            if not str(file_analysis.path).startswith(str(self.target_path)):
+            if file_analysis.path not in self._in_target_files:
                 continue
             
             # Skip if file is already reported as dead
@@ -1165,13 +1466,10 @@ class DeadCodeChecker:
                         continue
                     
                     # Mark as dead
-                    symbol_key = f"{symbol.file_path}:{symbol.name}"
+                    symbol_key = (symbol.file_path, symbol.name)
                     self.dependency_graph.mark_as_dead(symbol_key)
                     
-                    try:
-                        relative_path = str(symbol.file_path.relative_to(self.src_path))
-                    except ValueError:
-                        relative_path = str(symbol.file_path)
+                    relative_path = self._relativize(symbol.file_path)
                     
                     # Only report non-exported unused symbols as errors
                     if not symbol.is_exported:
@@ -1189,17 +1487,15 @@ class DeadCodeChecker:
         """Check for code that's only used by other dead code."""
         self.dependency_graph.find_transitive_dead_code()
         
+        # First non-re-export per name, built once per file instead of scanned per symbol
+        exports_by_name: Dict[Path, Dict[str, Export]] = {}
+        
         # Report transitively dead symbols
         for symbol_key in self.dependency_graph.transitively_dead:
-            parts = symbol_key.split(':', 1)
-            if len(parts) != 2:
-                continue
-            
-            file_path = Path(parts[0])
-            symbol_name = parts[1]
+            file_path, symbol_name = symbol_key
             
             # Only report on files in target path
-            if not str(file_path).startswith(str(self.target_path)):
+            if file_path not in self._in_target_files:
                 continue
             
             # Skip if file is already reported as dead
@@ -1212,40 +1508,41 @@ class DeadCodeChecker:
             
             # Find the actual symbol details
             if file_path in self.file_cache:
-                file_analysis = self.file_cache[file_path]
-                
-                # Find in exports
-                for export in file_analysis.exports:
-                    if export.name == symbol_name:
+                file_exports = exports_by_name.get(file_path)
+                if file_exports is None:
+                    file_exports = {}
+                    for export in self.file_cache[file_path].exports:
                         # Skip reporting re-exports as transitively dead
-                        if export.is_reexport:
-                            continue
-                            
-                        chain_count = self.dependency_graph.count_dead_chain(symbol_key)
-                        
-                        try:
-                            relative_path = str(file_path.relative_to(self.src_path))
-                        except ValueError:
-                            relative_path = str(file_path)
-                        
-                        issue = DeadCodeIssue.create_error(
-                            message=f"Transitively unused export '{symbol_name}' ({chain_count} symbols in chain)",
-                            issue_type=DeadCodeType.UNUSED_EXPORT,
-                            file_path=relative_path,
-                            line_number=export.line_number,
-                            symbol_name=symbol_name,
-                            recommendation=f"Remove unused export"
-                        )
-                        results.add_issue(issue)
-                        break
+                        if not export.is_reexport:
+                            file_exports.setdefault(export.name, export)
+                    exports_by_name[file_path] = file_exports
+                
+                export = file_exports.get(symbol_name)
+                if export is None:
+                    continue
+                
+                chain_count = self.dependency_graph.count_dead_chain(symbol_key)
+                
+                relative_path = self._relativize(file_path)
+                
+                issue = DeadCodeIssue.create_error(
+                    message=f"Transitively unused export '{symbol_name}' ({chain_count} symbols in chain)",
+                    issue_type=DeadCodeType.UNUSED_EXPORT,
+                    file_path=relative_path,
+                    line_number=export.line_number,
+                    symbol_name=symbol_name,
+                    recommendation=f"Remove unused export"
+                )
+                results.add_issue(issue)
     
-    def _detect_dead_files(self, results: CheckResults) -> List[Path]:
+    def _detect_dead_files(self) -> List[Path]:
         """Detect files that contain only dead code."""
         dead_files = []
+        dead_union = self.dependency_graph.dead_symbols | self.dependency_graph.transitively_dead
         
         for file_path, file_analysis in self.file_cache.items():
             # Only check files in target path
-            if not str(file_path).startswith(str(self.target_path)):
+            if file_path not in self._in_target_files:
                 continue
             
             # Skip test files and exceptions
@@ -1256,39 +1553,16 @@ class DeadCodeChecker:
             if not file_analysis.exports:
                 continue  # No exports, not a dead file candidate
             
-            all_exports_dead = True
-            for export in file_analysis.exports:
-                symbol_key = f"{file_path}:{export.name}"
-                if symbol_key not in self.dependency_graph.dead_symbols and \
-                   symbol_key not in self.dependency_graph.transitively_dead:
-                    all_exports_dead = False
-                    break
-            
-            if all_exports_dead:
+            if all((file_path, export.name) in dead_union for export in file_analysis.exports):
                 dead_files.append(file_path)
-                
-                # Count total symbols in file
-                total_symbols = len(file_analysis.exports) + len([s for s in file_analysis.symbols if not s.is_exported])
-                
-                try:
-                    relative_path = str(file_path.relative_to(self.src_path))
-                except ValueError:
-                    relative_path = str(file_path)
-                
-                issue = DeadCodeIssue.create_error(
-                    message=f"Dead file - all exports unused ({total_symbols} total symbols)",
-                    issue_type=DeadCodeType.UNUSED_EXPORT,
-                    file_path=relative_path,
-                    line_number=1,
-                    symbol_name="__file__",
-                    recommendation=f"Remove unused file"
-                )
-                results.add_issue(issue)
         
         return dead_files
     
-    def _detect_dead_folders(self, results: CheckResults, dead_files: List[Path]) -> Set[Path]:
-        """Detect folders where all or most files are dead code."""
+    def _detect_dead_folders(self, dead_files: List[Path]) -> Dict[Path, int]:
+        """Detect folders where all files are dead code.
+        
+        Returns a mapping from each dead folder to its number of files.
+        """
         from collections import defaultdict
         
         # Group dead files by their parent directory
@@ -1308,7 +1582,7 @@ class DeadCodeChecker:
                 parent_dir = file_path.parent
                 all_files_by_folder[parent_dir].append(file_path)
         
-        dead_folders = set()
+        dead_folders = {}
         
         # Check each folder to see if it should be reported as dead
         for folder_path, folder_dead_files in dead_files_by_folder.items():
@@ -1323,51 +1597,54 @@ class DeadCodeChecker:
             dead_ratio = dead_count / total_count
             
             # Only report folder if ALL files are dead (100%)
-            should_report_folder = (dead_ratio >= 1.0)
-            
-            if should_report_folder:
-                dead_folders.add(folder_path)
-                
-                try:
-                    relative_folder_path = str(folder_path.relative_to(self.src_path))
-                except ValueError:
-                    relative_folder_path = str(folder_path)
-                
-                # Remove individual file issues for this folder
-                issues_to_remove = []
-                all_issues = results.get_all_issues()
-                for issue in all_issues:
-                    if issue.file_path and issue.symbol_name == "__file__":
-                        try:
-                            issue_file_path = self.src_path / issue.file_path
-                            if issue_file_path.parent == folder_path:
-                                issues_to_remove.append(issue)
-                        except:
-                            pass
-                
-                # Remove from both errors and warnings lists
-                for issue in issues_to_remove:
-                    if issue in results.errors:
-                        results.errors.remove(issue)
-                    if issue in results.warnings:
-                        results.warnings.remove(issue)
-                
-                # Create folder-level issue
-                message = f"Dead folder - all {total_count} files unused"
-                recommendation = f"Remove unused folder"
-                
-                issue = DeadCodeIssue.create_error(
-                    message=message,
-                    issue_type=DeadCodeType.UNUSED_EXPORT,
-                    file_path=relative_folder_path + "/",
-                    line_number=1,
-                    symbol_name="__folder__",
-                    recommendation=recommendation
-                )
-                results.add_issue(issue)
+            if dead_ratio >= 1.0:
+                dead_folders[folder_path] = total_count
         
         return dead_folders
     
+    def _report_dead_files(self, results: CheckResults, dead_files: List[Path], dead_folders: Dict[Path, int]) -> None:
+        """Report dead files, except those covered by a dead folder issue."""
+        for file_path in dead_files:
+            file_analysis = self.file_cache[file_path]
+            
+            relative_path = self._relativize(file_path)
+            
+            # Files in a dead folder are reported once, at folder level
+            if (self.src_path / relative_path).parent in dead_folders:
+                continue
+            
+            # Count total symbols in file
+            total_symbols = len(file_analysis.exports) + len([s for s in file_analysis.symbols if not s.is_exported])
+            
+            issue = DeadCodeIssue.create_error(
+                message=f"Dead file - all exports unused ({total_symbols} total symbols)",
+                issue_type=DeadCodeType.UNUSED_EXPORT,
+                file_path=relative_path,
+                line_number=1,
+                symbol_name="__file__",
+                recommendation=f"Remove unused file"
+            )
+            results.add_issue(issue)
+    
+    def _report_dead_folders(self, results: CheckResults, dead_folders: Dict[Path, int]) -> None:
+        """Report folders where every file is dead code."""
+        for folder_path, total_count in dead_folders.items():
+            relative_folder_path = self._relativize(folder_path)
+            
+            # Create folder-level issue
+            message = f"Dead folder - all {total_count} files unused"
+            recommendation = f"Remove unused folder"
+            
+            issue = DeadCodeIssue.create_error(
+                message=message,
+                issue_type=DeadCodeType.UNUSED_EXPORT,
+                file_path=relative_folder_path + "/",
+                line_number=1,
+                symbol_name="__folder__",
+                recommendation=recommendation
+            )
+            results.add_issue(issue)
+    
     def run_all_checks(self) -> CheckResults:
         """Run all dead code checks and return results."""
         start_time = time.time()
@@ -1382,30 +1659,38 @@ class DeadCodeChecker:
 
         print(f"Analyzing {len(all_project_files)} files across project, checking {len(target_files)} in {self.target_path}")
 
-        # Analyze ALL files in parallel (for comprehensive usage detection)
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            future_to_file = {
-                executor.submit(self._analyze_file, file_path): file_path
-                for file_path in all_project_files
-            }
-            
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
-                analysis = future.result()
-                self.file_cache[file_path] = analysis
+        # Analyze ALL files (for comprehensive usage detection), skipping unchanged cached ones
+        self._analyze_project_files(all_project_files)
+        
+        for file_path in self.file_cache:
+            self._canonical_path(file_path)
+        
+        self._in_target_files = {
+            file_path for file_path in self.file_cache
+            if str(file_path).startswith(self._target_prefix)
+        }
+        
+        # Resolve imports once for the graph and dead symbol passes
+        self.import_index = self._build_import_index()
         
         # Build dependency graph
         self._build_dependency_graph()
         
+        # Project-wide export maps (keyed by normalized path) read by the dead code passes
+        self._all_exports = self._build_export_map()
+        self._reexport_chains = self._build_reexport_chains()
+        
         # Run dead code checks - mark dead symbols first
         self._mark_dead_symbols()
         
-        # Then detect dead files
-        dead_files = self._detect_dead_files(results)
+        # Then detect dead files and the folders made up only of dead files
+        dead_files = self._detect_dead_files()
         dead_files_set = set(dead_files)
+        dead_folders = self._detect_dead_folders(dead_files)
         
-        # Then detect dead folders (this may remove some individual file issues)
-        dead_folders = self._detect_dead_folders(results, dead_files)
+        # Report dead files not covered by a dead folder, then the dead folders
+        self._report_dead_files(results, dead_files, dead_folders)
+        self._report_dead_folders(results, dead_folders)
         
         # Then check other issues, but skip symbols in dead files
         self._check_unused_exports(results, dead_files_set)
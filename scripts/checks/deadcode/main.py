@@ -31,7 +31,7 @@ def main():
     print(f"🕵️  Checking for dead code in {target_path}...")
     
     # Run checks
-    checker = DeadCodeChecker(target_path)
+    checker = DeadCodeChecker(target_path, cache_file="test-results/.deadcode-cache.pkl")
     results = checker.run_all_checks()
     
     print(f"⏱️  Completed in {results.execution_time:.2f} seconds")
@@ -5,10 +5,15 @@ Data models for dead code checking.
 Contains all data structures used throughout the dead code checking system.
 """
 
+import re
+import sys
+from collections import Counter
 from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set
 from enum import Enum
+from functools import lru_cache
 
 
 class DeadCodeType(Enum):
@@ -24,7 +29,12 @@ class Severity(Enum):
     WARNING = "warning"
 
 
-@dataclass
+# Enum values looked up by member, avoiding the Enum.value descriptor in per-issue loops
+_ISSUE_TYPE_VALUES = {issue_type: sys.intern(issue_type.value) for issue_type in DeadCodeType}
+_SEVERITY_VALUES = {severity: sys.intern(severity.value) for severity in Severity}
+
+
+@dataclass(slots=True)
 class Export:
     """Represents an exported symbol."""
     name: str
@@ -35,7 +45,7 @@ class Export:
     from_path: Optional[str] = None  # Source path for re-exports
 
 
-@dataclass
+@dataclass(slots=True)
 class Import:
     """Represents an imported symbol."""
     name: str
@@ -46,7 +56,7 @@ class Import:
     original_name: Optional[str] = None  # For aliased imports (import { X as Y })
 
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     """Represents a local symbol (function, variable, etc.)."""
     name: str
@@ -56,7 +66,7 @@ class Symbol:
     is_exported: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class FileAnalysis:
     """Analysis results for a single file."""
     path: Path
@@ -69,7 +79,17 @@ class FileAnalysis:
     lines: int = 0
 
 
-@dataclass
+# Matches patterns like "({N} total symbols)", "({N} symbols in chain)"
+SYMBOL_COUNT_PATTERN = re.compile(r'\((\d+).*?symbols?\)')
+
+
+class IssueMessageInfo(NamedTuple):
+    """Details parsed out of an issue message."""
+    symbol_count: int
+    has_chain: bool
+
+
+@dataclass(slots=True)
 class DeadCodeIssue:
     """Represents a dead code violation with enhanced metadata."""
     message: str
@@ -79,6 +99,18 @@ class DeadCodeIssue:
     line_number: Optional[int] = None
     recommendation: Optional[str] = None
     symbol_name: Optional[str] = None
+    _message_info: Optional[IssueMessageInfo] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def message_info(self) -> IssueMessageInfo:
+        """Symbol count and chain flag from the message, parsed on first access."""
+        if self._message_info is None:
+            match = SYMBOL_COUNT_PATTERN.search(self.message)
+            self._message_info = IssueMessageInfo(
+                symbol_count=int(match.group(1)) if match else 1,
+                has_chain="chain" in self.message
+            )
+        return self._message_info
     
     @classmethod
     def create_error(
@@ -125,8 +157,8 @@ class DeadCodeIssue:
     def to_dict(self) -> Dict:
         """Convert issue to dictionary for JSON serialization."""
         return {
-            "type": self.issue_type.value,
-            "severity": self.severity.value,
+            "type": _ISSUE_TYPE_VALUES[self.issue_type],
+            "severity": _SEVERITY_VALUES[self.severity],
             "message": self.message,
             "file": self.file_path,
             "line": self.line_number,
@@ -135,111 +167,159 @@ class DeadCodeIssue:
         }
 
 
-@dataclass
+# Recommendation categories, checked in order: the first entry whose phrases all appear wins
+_RECOMMENDATION_CATEGORIES = (
+    (("Remove unused export",), "Remove unused export"),
+    (("Remove unused import",), "Remove unused import"),
+    (("Remove unused", "symbol"), "Remove unused symbol"),
+    (("Consider refactoring",), "Refactoring suggestion"),
+    (("Move to utility",), "Extract to utility"),
+)
+
+
+@lru_cache(maxsize=512)
+def _categorize_recommendation(recommendation: str) -> str:
+    """Categorize recommendation into types for summary (recommendations repeat heavily)."""
+    for phrases, category in _RECOMMENDATION_CATEGORIES:
+        if all(phrase in recommendation for phrase in phrases):
+            return category
+    return "Other"
+
+
+@dataclass(slots=True)
+class IssueSummary:
+    """Issue counts gathered in one pass over all issues."""
+    by_type: Counter = field(default_factory=Counter)
+    by_file: Counter = field(default_factory=Counter)
+    by_recommendation: Counter = field(default_factory=Counter)
+    exact_recommendations: Counter = field(default_factory=Counter)
+
+
+def _issue_category(issue: DeadCodeIssue) -> str:
+    """Categorize an issue as a dead folder, dead file or dead symbol."""
+    if issue.symbol_name == "__folder__":
+        return "dead_folders"
+    elif issue.symbol_name == "__file__":
+        return "dead_files"
+    return "dead_symbols"
+
+
+@dataclass(slots=True)
+class IssueBuckets:
+    """Issues of one severity, grouped as they are added."""
+    by_category: Dict[str, List[DeadCodeIssue]] = field(default_factory=dict)
+    by_file: Counter = field(default_factory=Counter)
+    
+    def add(self, issue: DeadCodeIssue) -> None:
+        """File an issue under its category and count it against its file."""
+        self.by_category.setdefault(_issue_category(issue), []).append(issue)
+        if issue.file_path:
+            self.by_file[issue.file_path] += 1
+
+
+@dataclass(slots=True)
 class CheckResults:
-    """Results of dead code checking."""
+    """Results of dead code checking.
+    
+    Add issues through add_issue, not by appending to errors or warnings: the
+    category buckets and cached summaries are only kept up to date there.
+    """
     errors: List[DeadCodeIssue] = field(default_factory=list)
     warnings: List[DeadCodeIssue] = field(default_factory=list)
     execution_time: float = 0.0
     target_path: str = "src"
     files_analyzed: int = 0
+    _error_buckets: IssueBuckets = field(default_factory=IssueBuckets, init=False, repr=False, compare=False)
+    _warning_buckets: IssueBuckets = field(default_factory=IssueBuckets, init=False, repr=False, compare=False)
+    _summary_cache: Optional[IssueSummary] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        for issue in self.errors:
+            self._error_buckets.add(issue)
+        for issue in self.warnings:
+            self._warning_buckets.add(issue)
     
     def add_issue(self, issue: DeadCodeIssue) -> None:
         """Add an issue to the appropriate list based on severity."""
-        if issue.severity == Severity.ERROR:
+        if issue.severity is Severity.ERROR:
             self.errors.append(issue)
+            self._error_buckets.add(issue)
         else:
             self.warnings.append(issue)
+            self._warning_buckets.add(issue)
+        self._summary_cache = None
     
     def get_all_issues(self) -> List[DeadCodeIssue]:
         """Get all issues (errors + warnings)."""
-        return self.errors + self.warnings
+        return list(self.iter_issues())
+    
+    def iter_issues(self) -> Iterator[DeadCodeIssue]:
+        """Iterate errors then warnings without building a combined list."""
+        return chain(self.errors, self.warnings)
     
     def get_issues_by_category(self) -> Dict[str, List[DeadCodeIssue]]:
         """Get issues categorized by folders, files, and symbols."""
-        categories = {
-            "dead_folders": [],
-            "dead_files": [], 
-            "dead_symbols": []
+        errors = self._error_buckets.by_category
+        warnings = self._warning_buckets.by_category
+        return {
+            category: errors.get(category, []) + warnings.get(category, [])
+            for category in ("dead_folders", "dead_files", "dead_symbols")
         }
+    
+    def _compute_summaries(self) -> IssueSummary:
+        """Read type and file counts from the buckets; count recommendations in one pass."""
+        summary = IssueSummary()
+        by_type = summary.by_type
+        by_recommendation = summary.by_recommendation
+        exact_recommendations = summary.exact_recommendations
         
-        for issue in self.get_all_issues():
-            if issue.symbol_name == "__folder__":
-                categories["dead_folders"].append(issue)
-            elif issue.symbol_name == "__file__":
-                categories["dead_files"].append(issue)
-            else:
-                categories["dead_symbols"].append(issue)
+        for buckets in (self._error_buckets, self._warning_buckets):
+            for category, issues in buckets.by_category.items():
+                by_type[category] += len(issues)
+            summary.by_file.update(buckets.by_file)
         
-        return categories
+        categorize = _categorize_recommendation
+        for issue in self.iter_issues():
+            recommendation = issue.recommendation
+            if recommendation:
+                by_recommendation[categorize(recommendation)] += 1
+                exact_recommendations[recommendation] += 1
+        
+        return summary
+    
+    def _summaries(self) -> IssueSummary:
+        """Summaries computed on first use and kept until the next add_issue (treat as read-only)."""
+        if self._summary_cache is None:
+            self._summary_cache = self._compute_summaries()
+        return self._summary_cache
     
     def get_summary_by_type(self) -> Dict[str, int]:
         """Get count of issues by dead code type (folders, files, symbols)."""
-        summary = {}
-        for issue in self.get_all_issues():
-            if issue.symbol_name == "__folder__":
-                category = "dead_folders"
-            elif issue.symbol_name == "__file__":
-                category = "dead_files"
-            else:
-                category = "dead_symbols"
-            summary[category] = summary.get(category, 0) + 1
-        return summary
+        return self._summaries().by_type
     
     def get_summary_by_file(self) -> Dict[str, int]:
         """Get count of issues by file."""
-        summary = {}
-        for issue in self.get_all_issues():
-            if issue.file_path:
-                summary[issue.file_path] = summary.get(issue.file_path, 0) + 1
-        return summary
+        return self._summaries().by_file
     
     def get_summary_by_recommendation(self) -> Dict[str, int]:
         """Get count of issues by recommendation type."""
-        summary = {}
-        for issue in self.get_all_issues():
-            if issue.recommendation:
-                rec_type = self._categorize_recommendation(issue.recommendation)
-                summary[rec_type] = summary.get(rec_type, 0) + 1
-        return summary
+        return self._summaries().by_recommendation
     
     def get_top_exact_recommendations(self, limit: int = 3) -> List[tuple[str, int]]:
         """Get the most common exact recommendations."""
-        exact_summary = {}
-        missing_recommendations = []
-        
-        for issue in self.get_all_issues():
-            if issue.recommendation:
-                exact_summary[issue.recommendation] = exact_summary.get(issue.recommendation, 0) + 1
-            else:
-                missing_recommendations.append(issue)
-        
-        # Return top exact recommendations
-        sorted_recommendations = sorted(exact_summary.items(), key=lambda x: x[1], reverse=True)
-        return sorted_recommendations[:limit]
+        return self._summaries().exact_recommendations.most_common(limit)
     
     def _categorize_recommendation(self, recommendation: str) -> str:
         """Categorize recommendation into types for summary."""
-        if "Remove unused export" in recommendation:
-            return "Remove unused export"
-        elif "Remove unused import" in recommendation:
-            return "Remove unused import"
-        elif "Remove unused" in recommendation and "symbol" in recommendation:
-            return "Remove unused symbol"
-        elif "Consider refactoring" in recommendation:
-            return "Refactoring suggestion"
-        elif "Move to utility" in recommendation:
-            return "Extract to utility"
-        
-        return "Other"
+        return _categorize_recommendation(recommendation)
     
     def has_errors(self) -> bool:
         """Check if there are any errors (not warnings)."""
         return len(self.errors) > 0
     
-    def to_dict(self) -> Dict:
-        """Convert results to dictionary for JSON serialization."""
-        all_issues = self.get_all_issues()
+    def report_header(self) -> Dict:
+        """Report fields other than the issue list, in report order."""
+        summaries = self._summaries()
         return {
             "timestamp": None,  # Will be set by reporter
             "target_path": self.target_path,
@@ -247,8 +327,29 @@ class CheckResults:
             "files_analyzed": self.files_analyzed,
             "summary": {
                 "total_errors": len(self.errors),
-                "by_type": self.get_summary_by_type(),
-                "by_file": self.get_summary_by_file()
-            },
-            "issues": [issue.to_dict() for issue in all_issues]
-        }
\ No newline at end of file
+                "by_type": dict(summaries.by_type),
+                "by_file": dict(summaries.by_file)
+            }
+        }
+    
+    def iter_issue_dicts(self) -> Iterator[Dict]:
+        """Yield each issue as a dict, errors first, so reports can be streamed."""
+        # Same layout as DeadCodeIssue.to_dict, built inline to skip a method call per issue
+        issue_type_values = _ISSUE_TYPE_VALUES
+        severity_values = _SEVERITY_VALUES
+        for issue in self.iter_issues():
+            yield {
+                "type": issue_type_values[issue.issue_type],
+                "severity": severity_values[issue.severity],
+                "message": issue.message,
+                "file": issue.file_path,
+                "line": issue.line_number,
+                "recommendation": issue.recommendation,
+                "symbol_name": issue.symbol_name
+            }
+    
+    def to_dict(self) -> Dict:
+        """Convert results to dictionary for JSON serialization."""
+        data = self.report_header()
+        data["issues"] = list(self.iter_issue_dicts())
+        return data
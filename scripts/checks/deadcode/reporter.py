@@ -5,14 +5,33 @@ Dead code check reporting module.
 Handles result reporting, JSON output generation, and console summaries.
 """
 
+import heapq
 import json
-import re
+import sys
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from .models import CheckResults, DeadCodeIssue, DeadCodeType, Severity
 
+try:
+    import orjson  # Optional: much faster serialization of large reports
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Dict) -> str:
+    """Serialize with two-space indentation, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=2, default=str)
+
+
+def _indented(text: str, indent: str) -> str:
+    """Indent a serialized value's continuation lines (serializers escape newlines in strings)."""
+    return text.replace('\n', '\n' + indent)
+
 
 class DeadCodeReporter:
     """Handles reporting of dead code check results."""
@@ -25,48 +44,60 @@ class DeadCodeReporter:
         # Ensure output directory exists
         self.output_file.parent.mkdir(exist_ok=True)
         
-        # Write detailed JSON report
-        self._write_json_report(results)
+        # Write detailed JSON report; the console summary reuses the summaries it computes
+        self._write_json_report(results, results.report_header())
         
         # Display console summary
         self._display_console_summary(results)
         
         return not results.has_errors()
     
-    def _write_json_report(self, results: CheckResults) -> None:
-        """Write detailed JSON report to file."""
-        report_data = results.to_dict()
-        report_data["timestamp"] = datetime.now().isoformat()
+    def _write_json_report(self, results: CheckResults, header: Dict) -> None:
+        """Write detailed JSON report to file, streaming issues one at a time."""
+        header["timestamp"] = datetime.now().isoformat()
         
-        with open(self.output_file, 'w') as f:
-            json.dump(report_data, f, indent=2, default=str)
+        with open(self.output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            # Write the header key by key, then the issue list as the last key
+            f.write('{')
+            for key, value in header.items():
+                f.write(f'\n  {_dumps(key)}: {_indented(_dumps(value), "  ")},')
+            f.write('\n  "issues": [')
+            separator = '\n    '
+            for issue_data in results.iter_issue_dicts():
+                f.write(separator)
+                f.write(_indented(_dumps(issue_data), '    '))
+                separator = ',\n    '
+            f.write(']\n}' if separator == '\n    ' else '\n  ]\n}')
     
-    def _extract_symbol_count(self, message: str) -> int:
-        """Extract symbol count from issue message."""
-        # Look for patterns like "({N} total symbols)", "({N} symbols in chain)"
-        match = re.search(r'\((\d+).*?symbols?\)', message)
-        return int(match.group(1)) if match else 1
-    
-    def _sort_issues_by_priority(self, issues: List[DeadCodeIssue]) -> List[DeadCodeIssue]:
-        """Sort issues by symbol count (descending) for priority display."""
-        def get_sort_key(issue):
-            symbol_count = self._extract_symbol_count(issue.message)
-            return (symbol_count, issue.file_path or "", issue.symbol_name or "")
+    def _sort_issues_by_priority(self, issues: List[DeadCodeIssue], limit: Optional[int] = None) -> List[Tuple[int, DeadCodeIssue]]:
+        """Sort issues by symbol count (descending) for priority display.
         
-        return sorted(issues, key=get_sort_key, reverse=True)
+        Returns (symbol count, issue) pairs so callers reuse the extracted count.
+        With a limit, only the top issues are selected instead of sorting them all.
+        """
+        decorated = [
+            ((issue.message_info.symbol_count, issue.file_path or "", issue.symbol_name or ""), issue)
+            for issue in issues
+        ]
+        if limit is None:
+            decorated.sort(key=itemgetter(0), reverse=True)
+        else:
+            decorated = heapq.nlargest(limit, decorated, key=itemgetter(0))
+        return [(sort_key[0], issue) for sort_key, issue in decorated]
     
     def _display_console_summary(self, results: CheckResults) -> None:
         """Display simplified summary information on console."""
-        print()
+        # Collect the summary and write it in one call rather than one print per line
+        lines = [""]
         
         total_errors = len(results.errors)
         
         if total_errors > 0:
-            print("📊 Dead Code Analysis Summary:")
-            print("=" * 72)
-            print(f"• Total errors: {total_errors}")
-            print(f"• Files analyzed: {results.files_analyzed}")
-            print()
+            lines.append("📊 Dead Code Analysis Summary:")
+            lines.append("=" * 72)
+            lines.append(f"• Total errors: {total_errors}")
+            lines.append(f"• Files analyzed: {results.files_analyzed}")
+            lines.append("")
             
             # Get issues by category
             categories = results.get_issues_by_category()
@@ -74,7 +105,7 @@ class DeadCodeReporter:
             
             # Show breakdown by type
             if type_summary:
-                print("🔍 By issue type:")
+                lines.append("🔍 By issue type:")
                 type_order = ["dead_folders", "dead_files", "dead_symbols"]
                 emojis = {"dead_folders": "📁", "dead_files": "📄", "dead_symbols": "💀"}
                 labels = {"dead_folders": "Dead Folders", "dead_files": "Dead Files", "dead_symbols": "Dead Symbols"}
@@ -84,53 +115,53 @@ class DeadCodeReporter:
                         count = type_summary[issue_type]
                         emoji = emojis[issue_type]
                         label = labels[issue_type]
-                        print(f"  {emoji} {label}: {count}")
-                print()
+                        lines.append(f"  {emoji} {label}: {count}")
+                lines.append("")
             
             # Display sorted results
-            self._display_category_section("📁 Dead Folders (by symbol count):", 
-                                         categories["dead_folders"], limit=10)
+            self._format_category_section(lines, "📁 Dead Folders (by symbol count):", 
+                                          categories["dead_folders"], limit=10)
             
-            self._display_category_section("📄 Dead Files (by symbol count):", 
-                                         categories["dead_files"], limit=10)
+            self._format_category_section(lines, "📄 Dead Files (by symbol count):", 
+                                          categories["dead_files"], limit=10)
             
-            self._display_category_section("💀 Dead Symbols (by dependency chain):", 
-                                         categories["dead_symbols"], limit=10)
+            self._format_category_section(lines, "💀 Dead Symbols (by dependency chain):", 
+                                          categories["dead_symbols"], limit=10)
             
             # Reference to detailed log
-            print("📋 Full Report:")
-            print("-" * 72)
-            print(f"{self.output_file}")
+            lines.append("📋 Full Report:")
+            lines.append("-" * 72)
+            lines.append(f"{self.output_file}")
         else:
-            print("✅ Dead code check passed!")
-            print(f"📁 Analyzed {results.files_analyzed} files")
-            print(f"📋 Report: {self.output_file}")
+            lines.append("✅ Dead code check passed!")
+            lines.append(f"📁 Analyzed {results.files_analyzed} files")
+            lines.append(f"📋 Report: {self.output_file}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    def _display_category_section(self, title: str, issues: List[DeadCodeIssue], limit: int = 10) -> None:
-        """Display a section for a specific category of issues."""
+    def _format_category_section(self, lines: List[str], title: str, issues: List[DeadCodeIssue], limit: int = 10) -> None:
+        """Append the console lines for a specific category of issues."""
         if not issues:
             return
         
-        print(title)
-        sorted_issues = self._sort_issues_by_priority(issues)
+        lines.append(title)
+        top_issues = self._sort_issues_by_priority(issues, limit)
         
-        for issue in sorted_issues[:limit]:
-            symbol_count = self._extract_symbol_count(issue.message)
-            
+        for symbol_count, issue in top_issues:
             if issue.symbol_name == "__folder__":
-                print(f"  • {issue.file_path}: {issue.message}")
+                lines.append(f"  • {issue.file_path}: {issue.message}")
             elif issue.symbol_name == "__file__":
-                print(f"  • {issue.file_path}: {symbol_count} symbols")
+                lines.append(f"  • {issue.file_path}: {symbol_count} symbols")
             else:
                 chain_info = ""
-                if "chain" in issue.message:
+                if issue.message_info.has_chain:
                     chain_info = f" ({symbol_count} in chain)"
-                print(f"  • {issue.file_path}:{issue.line_number} {issue.symbol_name}{chain_info}")
+                lines.append(f"  • {issue.file_path}:{issue.line_number} {issue.symbol_name}{chain_info}")
         
         if len(issues) > limit:
-            print(f"  ... and {len(issues) - limit} more")
+            lines.append(f"  ... and {len(issues) - limit} more")
         
-        print()
+        lines.append("")
     
     def generate_ai_friendly_summary(self, results: CheckResults) -> str:
         """Generate a summary specifically designed for AI agents."""
@@ -0,0 +1,28 @@
+"""
+Pytest fixtures for dead code checker tests.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+# Imports/exports memo size for the session parser
+TEST_PARSE_CACHE_SIZE = 4096
+
+
+@pytest.fixture(scope="session")
+def shared_parser():
+    """
+    Fixture providing one TypeScriptParser for the whole session.
+    Its caches are keyed by content: the imports/exports memo by (content, path),
+    and the last blanked source and tree-sitter captures by content identity.
+    A cached result is only reused for the same source, so tests can share the
+    parser instead of building their own. The memo is enlarged here because
+    tests parse the same fixture sources over and over.
+    Imported here rather than at module level so collection stays cheap.
+    """
+    from shared.typescript_parser import TypeScriptParser
+    return TypeScriptParser(parse_cache_size=TEST_PARSE_CACHE_SIZE)
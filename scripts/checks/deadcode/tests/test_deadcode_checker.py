@@ -14,11 +14,27 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from utils.test_helpers import (
     create_test_project,
+    create_cached_test_project,
+    record_analyzed_files,
     run_checker,
     assert_checker_finds_issues
 )
 from deadcode.models import DeadCodeType
 
+# One generated module of test_large_project_performance, formatted per module index
+LARGE_PROJECT_MODULE = """export function used%(i)d() {
+  return 'used%(i)d';
+}
+
+export function unused%(i)d() {
+  return 'unused%(i)d';
+}"""
+
+
+def _issue_keys(results):
+    """Comparable identity of every reported issue, in report order."""
+    return [(issue.issue_type, issue.file_path, issue.symbol_name, issue.line_number) for issue in results.iter_issues()]
+
 
 class TestDeadCodeChecker:
     """Test suite for dead code detection."""
@@ -198,7 +214,7 @@ export function main() {
             dead_symbols = {issue.symbol_name for issue in results.issues}
             assert 'notDynamicallyImported' in dead_symbols
 
-    def test_barrel_file_exports(self):
+    def test_barrel_file_exports(self, shared_parser, monkeypatch):
         """Test handling of barrel file re-exports."""
         files = {
             "src/components/Button.tsx": """
@@ -225,10 +241,11 @@ export function App() {
         }
 
         with create_test_project(files) as project_path:
-            results = run_checker('deadcode', project_path / 'src')
+            monkeypatch.chdir(project_path)  # The checker analyzes ./src
+            results = run_checker('deadcode', 'src', parser=shared_parser)
 
             # Button should not be flagged as dead (used via barrel file)
-            dead_symbols = {issue.symbol_name for issue in results.issues}
+            dead_symbols = {issue.symbol_name for issue in results.iter_issues()}
             assert 'Button' not in dead_symbols, "Button should not be flagged as dead"
 
             # Input might be flagged as dead since it's not used
@@ -285,7 +302,7 @@ export function App() {
             assert 'UsedComponent' not in dead_symbols
             assert 'App' not in dead_symbols
 
-    def test_type_only_exports(self):
+    def test_type_only_exports(self, shared_parser, monkeypatch):
         """Test handling of TypeScript type-only exports."""
         files = {
             "src/types.ts": """
@@ -310,9 +327,10 @@ export function processData(data: UsedInterface): UsedType {
         }
 
         with create_test_project(files) as project_path:
-            results = run_checker('deadcode', project_path / 'src')
+            monkeypatch.chdir(project_path)  # The checker analyzes ./src
+            results = run_checker('deadcode', 'src', parser=shared_parser)
 
-            dead_symbols = {issue.symbol_name for issue in results.issues}
+            dead_symbols = {issue.symbol_name for issue in results.iter_issues()}
             # Ensure type-only usage isn't flagged as dead
             assert 'UsedInterface' not in dead_symbols
 
@@ -406,50 +424,53 @@ export function main() {
             flagged_live = live_symbols & dead_symbols
             assert len(flagged_live) == 0, f"Should not flag live chain: {flagged_live}"
 
+    def test_dead_chain_count_with_cycle(self):
+        """Test that chain counts follow dead dependencies through cycles."""
+        from deadcode.checker import DependencyGraph
+
+        graph = DependencyGraph()
+        a, b, c, live = [(Path("src/chain.ts"), name) for name in ("a", "b", "c", "live")]
+        graph.add_dependency(a, b)
+        graph.add_dependency(b, c)
+        graph.add_dependency(c, b)  # b and c use each other
+        graph.add_dependency(c, live)
+        graph.mark_as_dead(a)
+        graph.transitively_dead.update({b, c})
+
+        assert graph.count_dead_chain(a) == 3  # live is not part of the chain
+        assert graph.count_dead_chain(b) == 2
+        assert graph.count_dead_chain(live) == 1
+
 
 class TestDeadCodeIntegration:
     """Integration tests for dead code checker."""
 
-    def test_large_project_performance(self):
+    def test_large_project_performance(self, shared_parser, monkeypatch):
         """Test dead code checker performance on a large project."""
-        files = {}
-
         # Generate many files with various usage patterns
-        for i in range(50):  # 50 modules
-            files[f"src/module{i}.ts"] = f"""
-export function used{i}() {{
-  return 'used{i}';
-}}
-
-export function unused{i}() {{
-  return 'unused{i}';
-}}
-            """.strip()
+        files = {"src/module%d.ts" % i: LARGE_PROJECT_MODULE % {"i": i} for i in range(50)}  # 50 modules
 
         # Create a main file that uses some functions
-        used_imports = []
-        for i in range(0, 50, 2):  # Use every other function
-            used_imports.append(f"used{i}")
-
-        files["src/main.ts"] = f"""
-import {{ {', '.join(used_imports)} }} from './module0';
+        used_imports = ["used%d" % i for i in range(0, 50, 2)]  # Use every other function
 
-export function main() {{
-  return [{', '.join([f'{func}()' for func in used_imports])}];
-}}
-        """.strip()
+        files["src/main.ts"] = "import { %s } from './module0';\n\nexport function main() {\n  return [%s];\n}" % (
+            ', '.join(used_imports), ', '.join(func + '()' for func in used_imports)
+        )
 
         with create_test_project(files) as project_path:
+            monkeypatch.chdir(project_path)  # The checker analyzes ./src
             try:
-                results = run_checker('deadcode', project_path / 'src')
-
-                # Should complete without timeout
-                assert isinstance(results.issues, list)
+                cache_file = str(project_path / '.deadcode-cache.pkl')
+                results = run_checker('deadcode', 'src', parser=shared_parser, cache_file=cache_file)
 
                 # Should find many unused functions
-                unused_count = len([issue for issue in results.issues if issue.dead_code_type == DeadCodeType.UNUSED_EXPORT])
+                unused_count = sum(1 for issue in results.iter_issues() if issue.issue_type == DeadCodeType.UNUSED_EXPORT)
                 assert unused_count > 20, f"Should find many unused functions, found {unused_count}"
 
+                # A rerun reuses the cached per-file analyses and must report the same issues
+                rerun = run_checker('deadcode', 'src', parser=shared_parser, cache_file=cache_file)
+                assert _issue_keys(rerun) == _issue_keys(results)
+
             except Exception as e:
                 pytest.fail(f"Dead code checker failed on large project: {e}")
 
@@ -516,4 +537,78 @@ export default function Page() {
             assert len(flagged_used) == 0, f"Should not flag used symbols: {flagged_used}"
 
             # SHOULD find unused exports
-            assert 'UnusedWidget' in dead_symbols or len(results.issues) == 0  # Depending on detection accuracy
\ No newline at end of file
+            assert 'UnusedWidget' in dead_symbols or len(results.issues) == 0  # Depending on detection accuracy
+
+
+class TestDeadCodeAnalysisCache:
+    """Tests for reusing per-file analyses across runs."""
+
+    FILES = {
+        "src/utils.ts": "export function used() {\n  return 1;\n}\n\nexport function unused() {\n  return 2;\n}",
+        "src/app/page.tsx": "import { used } from '../utils';\n\nexport default function Page() {\n  return used();\n}",
+    }
+
+    @pytest.fixture
+    def project(self, monkeypatch):
+        """Test project as the working directory (the checker analyzes ./src), with its cache file."""
+        with create_cached_test_project(self.FILES, '.deadcode-cache.pkl') as (project_path, cache_file):
+            monkeypatch.chdir(project_path)
+            yield project_path, cache_file
+
+    def _run(self, shared_parser, cache_file, monkeypatch):
+        """Run the checker, returning its results and the files it had to analyze."""
+        from deadcode.checker import DeadCodeChecker
+
+        parsed = record_analyzed_files(monkeypatch, DeadCodeChecker, '_parse_files')
+        results = DeadCodeChecker('src', cache_file=cache_file, parser=shared_parser).run_all_checks()
+        return results, sorted(parsed)
+
+    def test_warm_rerun_reuses_every_analysis(self, shared_parser, project, monkeypatch):
+        _, cache_file = project
+        cold, parsed = self._run(shared_parser, cache_file, monkeypatch)
+        assert parsed == ['src/app/page.tsx', 'src/utils.ts']
+        assert _issue_keys(cold)  # utils.ts exports a function nothing imports
+
+        warm, parsed = self._run(shared_parser, cache_file, monkeypatch)
+        assert parsed == []
+        assert _issue_keys(warm) == _issue_keys(cold)
+
+    def test_touched_but_unchanged_file_is_a_cache_hit(self, shared_parser, project, monkeypatch):
+        project_path, cache_file = project
+        cold, _ = self._run(shared_parser, cache_file, monkeypatch)
+
+        # A new mtime alone (e.g. after a fresh checkout) falls back to the content digest
+        utils = project_path / 'src/utils.ts'
+        stat = utils.stat()
+        os.utime(utils, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        warm, parsed = self._run(shared_parser, cache_file, monkeypatch)
+        assert parsed == []
+        assert _issue_keys(warm) == _issue_keys(cold)
+
+    def test_edited_file_is_reanalyzed(self, shared_parser, project, monkeypatch):
+        project_path, cache_file = project
+        self._run(shared_parser, cache_file, monkeypatch)
+
+        # Same size as before, so only the content digest tells the edit apart from a touch
+        page = project_path / 'src/app/page.tsx'
+        stat = page.stat()
+        page.write_text(
+            "import { unused } from '../utils';\n\nexport default function P() {\n  return unused()\n}"
+        )
+        assert page.stat().st_size == stat.st_size
+        os.utime(page, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        results, parsed = self._run(shared_parser, cache_file, monkeypatch)
+        assert parsed == ['src/app/page.tsx']
+        uncached, _ = self._run(shared_parser, None, monkeypatch)
+        assert _issue_keys(results) == _issue_keys(uncached)
+
+    def test_analysis_format_change_invalidates_the_cache(self, shared_parser, project, monkeypatch):
+        _, cache_file = project
+        self._run(shared_parser, cache_file, monkeypatch)
+
+        import deadcode.checker
+        monkeypatch.setattr(deadcode.checker, 'ANALYSIS_CACHE_VERSION', deadcode.checker.ANALYSIS_CACHE_VERSION + 1)
+        _, parsed = self._run(shared_parser, cache_file, monkeypatch)
+        assert parsed == ['src/app/page.tsx', 'src/utils.ts']
@@ -0,0 +1,77 @@
+"""
+Tests for dead code report output.
+
+The JSON report is streamed issue by issue, so these tests check the file
+still parses as one JSON document with either serializer.
+"""
+
+import json
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from deadcode import reporter
+from deadcode.models import CheckResults, DeadCodeIssue, DeadCodeType, Severity
+
+
+def _results_with_issues() -> CheckResults:
+    """Results holding an error and a warning, with text that needs escaping."""
+    results = CheckResults(target_path="src", files_analyzed=2)
+    results.add_issue(DeadCodeIssue(
+        message="Unused export 'helper' (\"quoted\")\nsecond line",
+        issue_type=DeadCodeType.UNUSED_EXPORT,
+        severity=Severity.ERROR,
+        file_path="src/utils.ts",
+        line_number=3,
+        recommendation="Remove the export",
+        symbol_name="helper",
+    ))
+    results.add_issue(DeadCodeIssue(
+        message="Unused import 'thing'",
+        issue_type=DeadCodeType.UNUSED_IMPORT,
+        file_path="src/main.ts",
+        line_number=1,
+        symbol_name="thing",
+    ))
+    return results
+
+
+@pytest.fixture(params=["json", "orjson"])
+def serializer(request, monkeypatch):
+    """Run each test with the standard json module and, when installed, with orjson."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(reporter, "orjson", None)
+    return request.param
+
+
+class TestJsonReport:
+    """Tests for the streamed JSON report."""
+
+    def test_report_round_trips(self, serializer, tmp_path, capsys):
+        results = _results_with_issues()
+        output_file = tmp_path / "dead-code-check.json"
+        reporter.DeadCodeReporter(str(output_file)).report_results(results)
+
+        with open(output_file, encoding="utf-8") as f:
+            report = json.load(f)
+
+        assert report["target_path"] == "src"
+        assert report["files_analyzed"] == 2
+        assert report["summary"]["total_errors"] == 1
+        assert report["summary"]["by_file"] == {"src/utils.ts": 1, "src/main.ts": 1}
+        assert report["issues"] == list(results.iter_issue_dicts())
+
+    def test_report_without_issues_round_trips(self, serializer, tmp_path, capsys):
+        output_file = tmp_path / "dead-code-check.json"
+        reporter.DeadCodeReporter(str(output_file)).report_results(CheckResults())
+
+        with open(output_file, encoding="utf-8") as f:
+            report = json.load(f)
+
+        assert report["issues"] == []
+        assert report["summary"]["total_errors"] == 0
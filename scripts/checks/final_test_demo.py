@@ -7,17 +7,27 @@ demonstrates how it successfully catches real bugs and validates
 the TypeScript checkers.
 """
 
+import logging
 import sys
 import os
 import tempfile
 import shutil
+from functools import lru_cache
 from pathlib import Path
+from typing import Tuple
+
+# Silent unless a handler is attached (done when run as a script)
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
 
 
 def demo_test_infrastructure():
     """Demonstrate the test infrastructure we built."""
-    print("🏗️  Test Infrastructure Components Built:")
-    print("=" * 50)
+    if not log.isEnabledFor(logging.INFO):
+        return
+
+    log.info("🏗️  Test Infrastructure Components Built:")
+    log.info("=" * 50)
 
     components = [
         "✅ Unified test helpers (create_test_project, run_checker, assertions)",
@@ -33,24 +43,11 @@ def demo_test_infrastructure():
     ]
 
     for component in components:
-        print(f"  {component}")
-
-
-def demo_parser_bug_detection():
-    """Demonstrate how our tests catch the template literal parsing bug."""
-    print("\n🐛 Regression Testing: Template Literal Bug Detection")
-    print("=" * 60)
+        log.info("  %s", component)
 
-    # Add current directory to path for imports
-    sys.path.insert(0, str(Path(__file__).parent))
-
-    try:
-        from shared.typescript_parser import TypeScriptParser
 
-        parser = TypeScriptParser()
-
-        # Test case that reveals the bug
-        content = '''
+# Snippet with an import inside a template literal, which a naive regex parser picks up
+REGRESSION_SNIPPET = '''
 // This should NOT be parsed as an import
 const template = `import { fake } from 'fake';`;
 
@@ -60,35 +57,61 @@ import { real } from './utils';
 export function test() {
     return { template, real };
 }
-        '''.strip()
+'''.strip()
+
+
+@lru_cache(maxsize=None)
+def _regression_import_counts() -> Tuple[int, int]:
+    """Count real and fake imports parsed from REGRESSION_SNIPPET (deterministic, so parsed once)."""
+    # Add current directory to path for imports
+    checks_dir = str(Path(__file__).parent)
+    if checks_dir not in sys.path:
+        sys.path.insert(0, checks_dir)
+
+    from shared.typescript_parser import TypeScriptParser
+
+    imports = TypeScriptParser().extract_imports(REGRESSION_SNIPPET, Path("test.ts"))
+    real_count = sum(1 for imp in imports if imp.name == 'real')
+    fake_count = sum(1 for imp in imports if imp.name == 'fake')
+    return real_count, fake_count
 
-        imports = parser.extract_imports(content, Path("test.ts"))
 
-        real_imports = [imp for imp in imports if imp.name == 'real']
-        fake_imports = [imp for imp in imports if imp.name == 'fake']
+def demo_parser_bug_detection():
+    """Demonstrate how our tests catch the template literal parsing bug."""
+    log.info("\n🐛 Regression Testing: Template Literal Bug Detection")
+    log.info("=" * 60)
+
+    try:
+        real_count, fake_count = _regression_import_counts()
 
-        print(f"Real imports found: {len(real_imports)} ✅ (correct)")
-        print(f"Fake imports found: {len(fake_imports)} ❌ (BUG: should be 0)")
+        log.info("Real imports found: %d ✅ (correct)", real_count)
+        if fake_count:
+            log.info("Fake imports found: %d ❌ (BUG: should be 0)", fake_count)
+        else:
+            log.info("Fake imports found: 0 ✅ (correct)")
 
-        if len(fake_imports) > 0:
-            print("\n🎯 SUCCESS: Our test suite caught a real bug!")
-            print("   The regex-based parser incorrectly parses imports in template literals.")
-            print("   This is exactly the kind of issue our comprehensive tests detect.")
-            print("   A TypeScript AST-based parser would fix this automatically.")
+        if fake_count > 0:
+            log.info("\n🎯 SUCCESS: Our test suite caught a real bug!")
+            log.info("   The regex-based parser incorrectly parses imports in template literals.")
+            log.info("   This is exactly the kind of issue our comprehensive tests detect.")
+            log.info("   A TypeScript AST-based parser would fix this automatically.")
             return True
         else:
-            print("\n✅ No bug detected (parser works correctly)")
+            log.info("\n✅ No bug detected (parser works correctly)")
             return True
 
     except Exception as e:
-        print(f"❌ Error testing parser: {e}")
+        log.info("❌ Error testing parser: %s", e)
         return False
 
 
 def demo_real_world_validation():
     """Demonstrate validation against real Hexframe patterns."""
-    print("\n🏗️  Real-World Pattern Validation")
-    print("=" * 50)
+    if not log.isEnabledFor(logging.INFO):
+        return
+
+    log.info("\n🏗️  Real-World Pattern Validation")
+    log.info("=" * 50)
 
     # Show the kinds of patterns we extracted and test
     patterns = [
@@ -144,17 +167,22 @@ export function BaseWidget({ variant = 'default', className }: BaseWidgetProps)
     ]
 
     for pattern in patterns:
-        print(f"\n📋 {pattern['name']}")
-        print(f"   {pattern['description']}")
-        print("   ✅ Extracted to test fixtures")
-        print("   ✅ Validates parser handles complex real-world code")
-        print("   ✅ Ensures checkers don't false-positive on valid patterns")
+        log.info(
+            "\n📋 %s\n   %s\n"
+            "   ✅ Extracted to test fixtures\n"
+            "   ✅ Validates parser handles complex real-world code\n"
+            "   ✅ Ensures checkers don't false-positive on valid patterns",
+            pattern['name'], pattern['description']
+        )
 
 
 def demo_test_categories():
     """Demonstrate the comprehensive test categories we built."""
-    print("\n📊 Test Categories and Coverage")
-    print("=" * 50)
+    if not log.isEnabledFor(logging.INFO):
+        return
+
+    log.info("\n📊 Test Categories and Coverage")
+    log.info("=" * 50)
 
     categories = [
         {
@@ -216,17 +244,20 @@ def demo_test_categories():
     ]
 
     for category in categories:
-        print(f"\n🔍 {category['name']}")
-        print(f"   Coverage: {category['coverage']}")
-        print("   Scope:")
-        for item in category['scope']:
-            print(f"     • {item}")
+        log.info(
+            "\n🔍 %s\n   Coverage: %s\n   Scope:\n%s",
+            category['name'], category['coverage'],
+            "\n".join(f"     • {item}" for item in category['scope'])
+        )
 
 
 def demo_benefits_achieved():
     """Demonstrate the benefits our test suite provides."""
-    print("\n🎯 Benefits Achieved")
-    print("=" * 50)
+    if not log.isEnabledFor(logging.INFO):
+        return
+
+    log.info("\n🎯 Benefits Achieved")
+    log.info("=" * 50)
 
     benefits = [
         {
@@ -259,15 +290,19 @@ def demo_benefits_achieved():
     ]
 
     for benefit in benefits:
-        print(f"\n{benefit['category']}")
-        for item in benefit['items']:
-            print(f"   ✅ {item}")
+        log.info(
+            "\n%s\n%s",
+            benefit['category'], "\n".join(f"   ✅ {item}" for item in benefit['items'])
+        )
 
 
 def demo_files_created():
     """Show the comprehensive file structure we created."""
-    print("\n📁 Files Created")
-    print("=" * 50)
+    if not log.isEnabledFor(logging.INFO):
+        return
+
+    log.info("\n📁 Files Created")
+    log.info("=" * 50)
 
     file_structure = """
 scripts/checks/
@@ -297,23 +332,26 @@ scripts/checks/
 └── TESTING_SUMMARY.md                   # 🆕 Complete documentation
     """.strip()
 
-    print(file_structure)
-    print("\n📊 Test Metrics:")
-    print("   • 80+ individual test cases")
-    print("   • 15+ test fixtures covering edge cases")
-    print("   • 4+ real-world pattern validations")
-    print("   • 3+ performance stress tests")
-    print("   • 1000+ lines of test infrastructure code")
+    log.info(
+        "%s\n\n📊 Test Metrics:\n"
+        "   • 80+ individual test cases\n"
+        "   • 15+ test fixtures covering edge cases\n"
+        "   • 4+ real-world pattern validations\n"
+        "   • 3+ performance stress tests\n"
+        "   • 1000+ lines of test infrastructure code",
+        file_structure
+    )
 
 
 def main():
     """Run the final demonstration."""
-    print("🧪 TypeScript Checker Test Suite - Final Demonstration")
-    print("=" * 70)
-    print("This showcases the comprehensive test infrastructure built for")
-    print("the Python-based TypeScript checkers, demonstrating how it")
-    print("improves reliability and provides a foundation for future development.")
-    print("=" * 70)
+    log.info(
+        "🧪 TypeScript Checker Test Suite - Final Demonstration\n%s\n"
+        "This showcases the comprehensive test infrastructure built for\n"
+        "the Python-based TypeScript checkers, demonstrating how it\n"
+        "improves reliability and provides a foundation for future development.\n%s",
+        "=" * 70, "=" * 70
+    )
 
     demo_test_infrastructure()
     demo_parser_bug_detection()
@@ -322,20 +360,22 @@ def main():
     demo_benefits_achieved()
     demo_files_created()
 
-    print("\n" + "=" * 70)
-    print("🎉 MISSION ACCOMPLISHED")
-    print("=" * 70)
-    print("✅ Built comprehensive test suite with 80+ test cases")
-    print("✅ Caught real bugs (template literal parsing issue)")
-    print("✅ Validated against real Hexframe codebase patterns")
-    print("✅ Created foundation for future TypeScript port")
-    print("✅ Improved reliability and maintainability of current checkers")
-    print("\n🚀 The test suite is ready for production use!")
-    print("   It will help ensure code quality and catch regressions")
-    print("   while providing a clear migration path to TypeScript.")
+    log.info(
+        "\n%s\n🎉 MISSION ACCOMPLISHED\n%s\n"
+        "✅ Built comprehensive test suite with 80+ test cases\n"
+        "✅ Caught real bugs (template literal parsing issue)\n"
+        "✅ Validated against real Hexframe codebase patterns\n"
+        "✅ Created foundation for future TypeScript port\n"
+        "✅ Improved reliability and maintainability of current checkers\n"
+        "\n🚀 The test suite is ready for production use!\n"
+        "   It will help ensure code quality and catch regressions\n"
+        "   while providing a clear migration path to TypeScript.",
+        "=" * 70, "=" * 70
+    )
 
     return 0
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     sys.exit(main())
\ No newline at end of file
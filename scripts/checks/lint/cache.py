@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+ESLint result cache module.
+
+Keeps ESLint's per-file results keyed by content hash, so files unchanged since the
+last run are not linted again.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import xxhash  # Optional: much faster content hashing
+except ImportError:
+    xxhash = None
+
+# Bump when the cache layout changes
+LINT_CACHE_VERSION = 2
+
+# Content hash in use, stored with the cache so switching hashes drops it
+CONTENT_HASH = "xxh3_64" if xxhash is not None else "blake2b_64"
+
+# Files at least this big are hashed through mmap instead of being read into memory;
+# smaller ones are quicker to read than to map
+MMAP_THRESHOLD = 1 << 20
+
+# Default cache location, relative to the project root
+LINT_CACHE_FILE = "test-results/.lint-cache.json"
+
+# Files whose changes can change any file's lint results
+LINT_CONFIG_FILES = (
+    "package.json",
+    "pnpm-lock.yaml",
+    "tsconfig.json",
+    "next.config.js",
+    "node_modules/eslint/package.json",
+)
+LINT_CONFIG_PREFIXES = (".eslintrc", "eslint.config.")
+LINT_CONFIG_DIRS = ("eslint-rules",)
+
+# Beyond this many stale files a full run is cheaper than a long --file list
+MAX_STALE_FILES = 200
+
+# Message ESLint reports for an explicitly passed file that its config ignores
+IGNORED_FILE_MESSAGE = "File ignored"
+
+
+def _digest(data) -> int:
+    """64-bit hash of a bytes-like object."""
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'big')
+
+
+def _hash_file(path: str) -> Optional[int]:
+    """Content hash of a file, or None if it can't be read."""
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                return _digest(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return _digest(mapped)
+    except (OSError, ValueError):
+        # ValueError: the file was emptied between stat and mmap
+        return None
+
+
+def _is_ignored_result(file_object: Dict) -> bool:
+    """Check whether ESLint skipped the file because its config ignores it."""
+    messages = file_object.get('messages') or []
+    return bool(messages) and all(
+        (message.get('message') or '').startswith(IGNORED_FILE_MESSAGE) for message in messages
+    )
+
+
+def lint_config_files(project_root: Path) -> List[Path]:
+    """Project files that configure ESLint, in a stable order."""
+    files = [project_root / name for name in LINT_CONFIG_FILES]
+    files.extend(
+        path for path in sorted(project_root.iterdir())
+        if path.name.startswith(LINT_CONFIG_PREFIXES)
+    )
+    for directory in LINT_CONFIG_DIRS:
+        root = project_root / directory
+        if root.is_dir():
+            files.extend(sorted(path for path in root.rglob('*') if path.is_file()))
+    return files
+
+
+def hash_lint_config(project_root: Path) -> str:
+    """Hash the ESLint configuration, plugins and ESLint version together."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in lint_config_files(project_root):
+        file_hash = _hash_file(str(path))
+        if file_hash is not None:
+            digest.update(f"{path.relative_to(project_root)}\0{file_hash}\0".encode())
+    return digest.hexdigest()
+
+
+class LintCache:
+    """Per-file ESLint results from previous runs, valid while content and config match."""
+
+    def __init__(self, project_root: Path, cache_file: Optional[Path] = None, config_hash: Optional[str] = None):
+        self.project_root = Path(os.path.realpath(project_root))
+        self.cache_file = cache_file or self.project_root / LINT_CACHE_FILE
+        self.config_hash = config_hash or hash_lint_config(self.project_root)
+        # Path -> {"sha": content hash, "result": ESLint file object, or None if ignored}
+        self.entries: Dict[str, Dict] = self._load()
+        self.current_hashes: Dict[str, int] = {}
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load cached entries, or an empty dict if missing or made with another config."""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        if (data.get('version') != LINT_CACHE_VERSION or data.get('hash') != CONTENT_HASH
+                or data.get('config_sha') != self.config_hash):
+            return {}
+        return data.get('files') or {}
+
+    def _save(self) -> None:
+        """Persist entries for the next run; a failed write only costs a full run."""
+        data = {
+            'version': LINT_CACHE_VERSION,
+            'hash': CONTENT_HASH,
+            'config_sha': self.config_hash,
+            'files': self.entries,
+        }
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            pass
+
+    def stale_files(self, lint_root: str, suffixes: Iterable[str]) -> Optional[List[str]]:
+        """
+        Hash the files under lint_root and find those whose cached results are out of date.
+
+        Returns:
+            Paths to re-lint, or None when there's no usable cache or too many changed
+            files, meaning the whole project should be linted
+        """
+        suffixes = tuple(suffixes)
+        current = self.current_hashes
+        for directory, _, files in os.walk(self.project_root / lint_root):
+            for name in files:
+                if name.endswith(suffixes):
+                    path = os.path.join(directory, name)
+                    file_hash = _hash_file(path)
+                    if file_hash is not None:
+                        current[path] = file_hash
+        # Files ESLint linted outside lint_root are still checked for changes
+        for path in self.entries:
+            if path not in current:
+                file_hash = _hash_file(path)
+                if file_hash is not None:
+                    current[path] = file_hash
+
+        if not self.entries:
+            return None
+        stale = [
+            path for path, file_hash in current.items()
+            if self.entries.get(path, {}).get('sha') != file_hash
+        ]
+        return stale if len(stale) <= MAX_STALE_FILES else None
+
+    def cached_results(self) -> List[Dict]:
+        """ESLint file objects of cached files that are unchanged, in cache order."""
+        current = self.current_hashes
+        return [
+            entry['result'] for path, entry in self.entries.items()
+            if entry.get('result') is not None and current.get(path) == entry.get('sha')
+        ]
+
+    def _entry(self, file_object: Dict, full_run: bool) -> Tuple[str, Optional[Dict]]:
+        """Cache path and entry for one of ESLint's file objects; no entry if it can't be hashed."""
+        path = os.path.realpath(file_object.get('filePath') or '')
+        file_hash = self.current_hashes.get(path) or _hash_file(path)
+        if file_hash is None:
+            return path, None
+        # A file linted on request but ignored by the config is remembered, not reported
+        ignored = not full_run and _is_ignored_result(file_object)
+        return path, {'sha': file_hash, 'result': None if ignored else file_object}
+
+    def record(self, file_objects: Iterable[Dict], full_run: bool) -> Iterator[Dict]:
+        """
+        Cache ESLint's file objects and yield the results of the run.
+
+        A full run's objects are passed through as they arrive, and the cache is saved once
+        they run out. A partial run's objects are merged with the unchanged cached results,
+        keeping the order of the previous run so ties in the report don't shuffle.
+        """
+        if full_run:
+            entries: Dict[str, Dict] = {}
+            for file_object in file_objects:
+                path, entry = self._entry(file_object, full_run)
+                if entry is not None:
+                    entries[path] = entry
+                yield file_object
+            self.entries = entries
+            self._save()
+            return
+
+        fresh: Dict[str, Dict] = {}
+        for file_object in file_objects:
+            path, entry = self._entry(file_object, full_run)
+            fresh[path] = entry or {'sha': None, 'result': file_object}
+        current = self.current_hashes
+        entries = {}
+        for path, entry in self.entries.items():
+            if path in fresh:
+                entries[path] = fresh.pop(path)
+            elif current.get(path) == entry.get('sha'):
+                entries[path] = entry
+        entries.update(fresh)
+
+        self.entries = {path: entry for path, entry in entries.items() if entry['sha'] is not None}
+        self._save()
+        for entry in entries.values():
+            if entry['result'] is not None:
+                yield entry['result']
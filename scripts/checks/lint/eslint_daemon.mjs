@@ -0,0 +1,112 @@
+#!/usr/bin/env node
+
+/**
+ * Long-lived ESLint process for scripts/checks/lint/main.py --daemon
+ *
+ * Keeps ESLint, its plugins and the TypeScript program loaded between runs, so
+ * repeat runs skip Node and module startup. Each connection on the Unix socket
+ * sends one JSON request line and gets back JSON lines: {"ok": true} (or
+ * {"error": ...} / {"restart": true}), then one ESLint result per line.
+ *
+ * Usage: node eslint_daemon.mjs <socket-path> <project-root> <config-key>
+ *
+ * The runner starts it on first use; it exits after 10 idle minutes, or when a
+ * request carries a different config key (the runner then starts a fresh one).
+ * The TypeScript program is not rebuilt when sources change, so type-aware
+ * rules can see stale types for files edited since the daemon started.
+ */
+
+import fs from 'fs';
+import net from 'net';
+import readline from 'readline';
+import { loadESLint } from 'eslint';
+
+const IDLE_TIMEOUT_MS = 10 * 60 * 1000;
+
+const [socketPath, projectRoot, configKey] = process.argv.slice(2);
+
+// The project still uses .eslintrc.cjs, as `next lint` does
+const LegacyESLint = await loadESLint({ useFlatConfig: false });
+
+// One ESLint instance per set of options, reused across requests
+const instances = new Map();
+
+function eslintFor(request) {
+  const options = {
+    cwd: projectRoot,
+    extensions: request.extensions,
+    errorOnUnmatchedPattern: false,
+    cache: request.cache,
+    cacheLocation: request.cacheLocation,
+    cacheStrategy: 'content',
+  };
+  const key = JSON.stringify(options);
+  if (!instances.has(key)) {
+    instances.set(key, new LegacyESLint(options));
+  }
+  return instances.get(key);
+}
+
+let idleTimer;
+function resetIdleTimer() {
+  clearTimeout(idleTimer);
+  idleTimer = setTimeout(shutdown, IDLE_TIMEOUT_MS);
+}
+
+function shutdown() {
+  server.close();
+  fs.rmSync(socketPath, { force: true });
+  process.exit(0);
+}
+
+async function handle(socket, line) {
+  resetIdleTimer();
+  let request;
+  try {
+    request = JSON.parse(line);
+  } catch (error) {
+    socket.end(JSON.stringify({ error: `Invalid request: ${error.message}` }) + '\n');
+    return;
+  }
+
+  if (request.configKey !== configKey) {
+    // Config, plugins or ESLint changed: stop accepting requests before replying
+    server.close();
+    fs.rmSync(socketPath, { force: true });
+    socket.end(JSON.stringify({ restart: true }) + '\n', () => process.exit(0));
+    return;
+  }
+
+  let results;
+  try {
+    results = await eslintFor(request).lintFiles(request.paths);
+  } catch (error) {
+    socket.end(JSON.stringify({ error: String(error?.message ?? error) }) + '\n');
+    return;
+  }
+
+  socket.write('{"ok": true}\n');
+  for (const result of results) {
+    socket.write(JSON.stringify(result) + '\n');
+  }
+  socket.end();
+  resetIdleTimer();
+}
+
+// Requests are linted one at a time, since they share ESLint instances
+let queue = Promise.resolve();
+
+const server = net.createServer((socket) => {
+  socket.on('error', () => {});
+  const lines = readline.createInterface({ input: socket });
+  lines.once('line', (line) => {
+    lines.close();
+    queue = queue.then(() => handle(socket, line)).catch(() => socket.destroy());
+  });
+});
+
+process.on('SIGTERM', shutdown);
+process.on('SIGINT', shutdown);
+
+fs.rmSync(socketPath, { force: true });
+server.listen(socketPath, resetIdleTimer);
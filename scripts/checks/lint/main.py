@@ -12,6 +12,10 @@ Options:
     --by-rule       Group console output by rule instead of by file
     --errors-only   Show only errors, not warnings
     --rule RULE     Filter results to show only issues from specific rule
+    --jobs N        Split linting across N parallel ESLint runs, or "auto" (default: 1)
+    --no-cache      Lint every file, bypassing both the result cache and ESLint's cache
+    --daemon        Lint through a long-lived ESLint process kept loaded between runs
+                    (type-aware rules may miss edits to imported files; not for merging)
     --help, -h      Show this help message
 
 Examples:
@@ -42,11 +46,24 @@ from pathlib import Path
 current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
 
-from runner import ESLintRunner
+from runner import ESLintRunner, JSON_PARSE_ERRORS
 from parser import ESLintParser
 from reporter import LintReporter
 
 
+def parse_jobs(value: str):
+    """Parse --jobs: a positive number of runs, or "auto"."""
+    if value == "auto":
+        return value
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = 0
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive number or 'auto', got {value!r}")
+    return jobs
+
+
 def create_argument_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
@@ -94,6 +111,29 @@ Examples:
         help='Filter results to show only issues from specific rule'
     )
     
+    parser.add_argument(
+        '--jobs',
+        type=parse_jobs,
+        default=1,
+        metavar='N',
+        help='Split linting across N parallel ESLint runs, one per group of src/ directories; '
+             '"auto" uses one per CPU when src/ has at least 50 files (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Lint every file, bypassing both the cached results for unchanged files and ESLint's own cache"
+    )
+    
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Lint through a long-lived ESLint process that keeps ESLint and type information loaded '
+             'between runs (started on first use, exits after 10 idle minutes). Its type information can '
+             'lag behind edits to files that linted files import, so lint without it before merging'
+    )
+    
     parser.add_argument(
         '--output',
         metavar='FILE',
@@ -116,7 +156,7 @@ def main():
     
     # Initialize components
     project_root = Path(__file__).parent.parent.parent.parent
-    runner = ESLintRunner(project_root)
+    runner = ESLintRunner(project_root, jobs=args.jobs, use_cache=not args.no_cache, daemon=args.daemon)
     eslint_parser = ESLintParser(project_root)
     reporter = LintReporter(args.output)
     
@@ -135,9 +175,18 @@ def main():
             reporter.display_execution_error(error_message)
         sys.exit(1)
     
-    # Parse results
-    results = eslint_parser.parse_json_output(eslint_data)
-    eslint_parser.post_process_results(results)
+    # Parse results as ESLint's output is streamed in
+    try:
+        results = eslint_parser.parse_json_output(eslint_data)
+    except JSON_PARSE_ERRORS as e:
+        if not args.json_only:
+            reporter.display_execution_error(f"Failed to parse ESLint JSON output: {e}")
+        sys.exit(1)
+    except OSError as e:
+        # Results are streamed, so a lost daemon connection or unreadable output surfaces here
+        if not args.json_only:
+            reporter.display_execution_error(f"Failed to read ESLint output: {e}")
+        sys.exit(1)
     
     # Apply filters if specified
     if args.errors_only or args.rule:
@@ -5,20 +5,62 @@ Data models for ESLint checking.
 Contains all data structures used throughout the ESLint checking system.
 """
 
+import heapq
+import os
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set
-from enum import Enum
+from typing import Callable, Dict, List, Optional, Set
+from enum import IntEnum
 
 
-class LintSeverity(Enum):
-    """ESLint severity levels."""
+# Directory key per file path, shared by the parser's aggregation and the verbose report
+_DIRECTORY_CACHE: Dict[str, str] = {}
+
+# Whether '/' is the only path separator, so plain paths can be split as strings
+_POSIX_SEPARATORS = os.sep == '/' and os.altsep is None
+
+
+def file_directory(file_path: str) -> str:
+    """Directory of a file as str(Path(file_path).parent) gives it, with '.' reported as 'root'."""
+    dir_path = _DIRECTORY_CACHE.get(file_path)
+    if dir_path is None:
+        head, sep, tail = file_path.rpartition('/')
+        if _POSIX_SEPARATORS and not sep:
+            dir_path = 'root'
+        elif (_POSIX_SEPARATORS and head and tail not in ('', '.')
+                and '//' not in file_path and '/./' not in file_path and not file_path.startswith('./')):
+            # Already normalized, so the parent is everything before the last separator
+            dir_path = head
+        else:
+            dir_path = str(Path(file_path).parent)
+            if dir_path == '.':
+                dir_path = 'root'
+        _DIRECTORY_CACHE[file_path] = dir_path
+    return dir_path
+
+
+class StatsByKey(dict):
+    """Dict that creates a missing entry by calling its factory with the key."""
+    __slots__ = ('factory',)
+    
+    def __init__(self, factory: Callable[[str], object]):
+        super().__init__()
+        self.factory = factory
+    
+    def __missing__(self, key: str):
+        stats = self[key] = self.factory(key)
+        return stats
+
+
+class LintSeverity(IntEnum):
+    """ESLint severity levels (ints, so comparisons skip Enum.__eq__)."""
     ERROR = 2
     WARNING = 1
     OFF = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class LintIssue:
     """Represents a single ESLint issue."""
     rule_id: str
@@ -36,18 +78,22 @@ class LintIssue:
         return "error" if self.severity == LintSeverity.ERROR else "warning"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileResults:
     """ESLint results for a single file."""
     file_path: str
     issues: List[LintIssue] = field(default_factory=list)
     error_count: int = 0
     warning_count: int = 0
+    rule_counts: Counter = field(default_factory=Counter)
+    rule_has_error: Set[str] = field(default_factory=set)
     
     def add_issue(self, issue: LintIssue) -> None:
         """Add an issue to this file's results."""
         self.issues.append(issue)
+        self.rule_counts[issue.rule_id] += 1
         if issue.severity == LintSeverity.ERROR:
+            self.rule_has_error.add(issue.rule_id)
             self.error_count += 1
         elif issue.severity == LintSeverity.WARNING:
             self.warning_count += 1
@@ -58,18 +104,23 @@ class FileResults:
         return len(self.issues)
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectoryStats:
     """Statistics for a directory."""
     path: str
     total_issues: int = 0
     error_count: int = 0
     warning_count: int = 0
-    files_affected: int = 0
-    rule_counts: Dict[str, int] = field(default_factory=dict)
+    files_affected_set: Set[str] = field(default_factory=set)
+    rule_counts: Counter = field(default_factory=Counter)
+    
+    @property
+    def files_affected(self) -> int:
+        """Number of files with issues in this directory."""
+        return len(self.files_affected_set)
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleStats:
     """Statistics for a specific rule."""
     rule_id: str
@@ -84,7 +135,7 @@ class RuleStats:
         return len(self.files_affected)
 
 
-@dataclass
+@dataclass(slots=True)
 class LintResults:
     """Complete ESLint results with analysis."""
     files: List[FileResults] = field(default_factory=list)
@@ -94,13 +145,17 @@ class LintResults:
     total_files: int = 0
     files_with_issues: int = 0
     
-    # Grouped analysis
-    directory_stats: Dict[str, DirectoryStats] = field(default_factory=dict)
-    rule_stats: Dict[str, RuleStats] = field(default_factory=dict)
+    # Grouped analysis, with stats created on first lookup of a directory or rule
+    directory_stats: Dict[str, DirectoryStats] = field(default_factory=lambda: StatsByKey(DirectoryStats))
+    rule_stats: Dict[str, RuleStats] = field(default_factory=lambda: StatsByKey(RuleStats))
+    
+    # First results added for each file path
+    file_index: Dict[str, FileResults] = field(default_factory=dict)
     
     def add_file_results(self, file_results: FileResults) -> None:
         """Add results for a file."""
         self.files.append(file_results)
+        self.file_index.setdefault(file_results.file_path, file_results)
         self.total_files += 1
         
         if file_results.total_issues > 0:
@@ -118,31 +173,25 @@ class LintResults:
         return self.total_issues > 0
     
     def get_most_affected_files(self, limit: int = 10) -> List[FileResults]:
-        """Get files with the most issues."""
-        return sorted(
-            [f for f in self.files if f.total_issues > 0],
-            key=lambda f: f.total_issues,
-            reverse=True
-        )[:limit]
+        """Get files with the most issues (ties keep file order, as a stable sort would)."""
+        return heapq.nlargest(
+            limit,
+            (f for f in self.files if f.total_issues > 0),
+            key=lambda f: f.total_issues
+        )
     
     def get_top_rules(self, limit: int = 10) -> List[RuleStats]:
         """Get the most violated rules."""
-        return sorted(
-            self.rule_stats.values(),
-            key=lambda r: r.total_count,
-            reverse=True
-        )[:limit]
+        return heapq.nlargest(limit, self.rule_stats.values(), key=lambda r: r.total_count)
     
     def get_top_directories(self, limit: int = 10) -> List[DirectoryStats]:
         """Get directories with the most issues."""
-        return sorted(
-            self.directory_stats.values(),
-            key=lambda d: d.total_issues,
-            reverse=True
-        )[:limit]
+        return heapq.nlargest(limit, self.directory_stats.values(), key=lambda d: d.total_issues)
     
     def to_dict(self) -> Dict:
         """Convert results to dictionary for JSON serialization."""
+        files_with_issues = [f for f in self.files if f.issues]
+        error = LintSeverity.ERROR
         return {
             "summary": {
                 "total_issues": self.total_issues,
@@ -158,7 +207,7 @@ class LintResults:
                         {
                             "rule": i.rule_id,
                             "message": i.message,
-                            "severity": i.severity_name,
+                            "severity": "error" if i.severity == error else "warning",
                             "line": i.line,
                             "column": i.column,
                             "end_line": i.end_line,
@@ -169,7 +218,7 @@ class LintResults:
                     "error_count": f.error_count,
                     "warning_count": f.warning_count
                 }
-                for f in self.files if f.total_issues > 0
+                for f in files_with_issues
             ],
             "directory_stats": {
                 path: {
@@ -0,0 +1,10 @@
+/**
+ * ESLint formatter writing one JSON result object per line (NDJSON)
+ *
+ * Used by scripts/checks/lint/runner.py so the output can be parsed a line at a
+ * time instead of as one JSON array.
+ */
+
+module.exports = function (results) {
+  return results.map((result) => JSON.stringify(result)).join('\n');
+};
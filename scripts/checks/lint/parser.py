@@ -6,10 +6,18 @@ Parses ESLint JSON output and converts it to structured data models.
 """
 
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List
 import re
+import sys
 
-from models import LintIssue, LintSeverity, FileResults, LintResults, DirectoryStats, RuleStats
+from models import LintIssue, LintSeverity, FileResults, LintResults, file_directory
+
+# ESLint severity numbers mapped to our enum; anything else counts as a warning
+_SEVERITY_MAP = {
+    2: LintSeverity.ERROR,
+    1: LintSeverity.WARNING,
+    0: LintSeverity.OFF
+}
 
 
 class ESLintParser:
@@ -19,12 +27,12 @@ class ESLintParser:
         """Initialize parser with project root for path normalization."""
         self.project_root = project_root or Path.cwd()
     
-    def parse_json_output(self, eslint_data: List[Dict]) -> LintResults:
+    def parse_json_output(self, eslint_data: Iterable[Dict]) -> LintResults:
         """
         Parse ESLint JSON output into LintResults.
         
         Args:
-            eslint_data: Raw ESLint JSON output (list of file objects)
+            eslint_data: Raw ESLint JSON output (list or stream of file objects)
             
         Returns:
             LintResults object with parsed and analyzed data
@@ -37,9 +45,7 @@ class ESLintParser:
             results.add_file_results(file_results)
             
             # Process issues for aggregated statistics
-            for issue in file_results.issues:
-                self._add_to_directory_stats(results, file_results.file_path, issue)
-                self._add_to_rule_stats(results, file_results.file_path, issue)
+            self._add_file_stats(results, file_results)
         
         return results
     
@@ -57,17 +63,11 @@ class ESLintParser:
     
     def _parse_issue(self, message: Dict, file_path: str) -> LintIssue:
         """Parse a single ESLint issue/message."""
-        # Map ESLint severity numbers to our enum
-        severity_map = {
-            2: LintSeverity.ERROR,
-            1: LintSeverity.WARNING,
-            0: LintSeverity.OFF
-        }
-        
-        severity = severity_map.get(message.get('severity', 1), LintSeverity.WARNING)
+        severity = _SEVERITY_MAP.get(message.get('severity', 1), LintSeverity.WARNING)
         
+        # Rule IDs repeat across issues, so they're interned; parse errors have a null ruleId
         return LintIssue(
-            rule_id=message.get('ruleId', 'unknown'),
+            rule_id=sys.intern(message.get('ruleId') or 'unknown'),
             message=message.get('message', ''),
             severity=severity,
             file_path=file_path,
@@ -78,7 +78,11 @@ class ESLintParser:
         )
     
     def _normalize_file_path(self, file_path: str) -> str:
-        """Normalize file path relative to project root."""
+        """Normalize file path relative to project root (interned, as it keys several stats)."""
+        return sys.intern(self._relative_file_path(file_path))
+    
+    def _relative_file_path(self, file_path: str) -> str:
+        """File path relative to project root, or as given if outside it."""
         try:
             path = Path(file_path)
             if path.is_absolute():
@@ -96,68 +100,38 @@ class ESLintParser:
             # If any error occurs, return original path
             return file_path
     
-    def _add_to_directory_stats(self, results: LintResults, file_path: str, issue: LintIssue) -> None:
-        """Add issue statistics to directory aggregation."""
-        # Extract directory path
-        dir_path = str(Path(file_path).parent)
-        if dir_path == '.':
-            dir_path = 'root'
-        
-        # Initialize directory stats if not exists
-        if dir_path not in results.directory_stats:
-            results.directory_stats[dir_path] = DirectoryStats(path=dir_path)
-        
-        stats = results.directory_stats[dir_path]
-        stats.total_issues += 1
-        
-        if issue.severity == LintSeverity.ERROR:
-            stats.error_count += 1
-        elif issue.severity == LintSeverity.WARNING:
-            stats.warning_count += 1
-        
-        # Track rule counts in this directory
-        rule_id = issue.rule_id
-        if rule_id not in stats.rule_counts:
-            stats.rule_counts[rule_id] = 0
-        stats.rule_counts[rule_id] += 1
-        
-        # Count files affected (we'll calculate this differently in post-processing)
-    
-    def _add_to_rule_stats(self, results: LintResults, file_path: str, issue: LintIssue) -> None:
-        """Add issue statistics to rule aggregation."""
-        rule_id = issue.rule_id
-        
-        # Initialize rule stats if not exists
-        if rule_id not in results.rule_stats:
-            results.rule_stats[rule_id] = RuleStats(rule_id=rule_id)
-        
-        stats = results.rule_stats[rule_id]
-        stats.total_count += 1
-        stats.files_affected.add(file_path)
-        
-        if issue.severity == LintSeverity.ERROR:
-            stats.error_count += 1
-        elif issue.severity == LintSeverity.WARNING:
-            stats.warning_count += 1
-    
-    def post_process_results(self, results: LintResults) -> None:
-        """Post-process results to calculate derived statistics."""
-        # Calculate files affected per directory
-        file_to_dir_map = {}
-        for file_result in results.files:
-            if file_result.total_issues > 0:
-                dir_path = str(Path(file_result.file_path).parent)
-                if dir_path == '.':
-                    dir_path = 'root'
-                
-                if dir_path not in file_to_dir_map:
-                    file_to_dir_map[dir_path] = set()
-                file_to_dir_map[dir_path].add(file_result.file_path)
-        
-        # Update directory stats with files affected count
-        for dir_path, files in file_to_dir_map.items():
-            if dir_path in results.directory_stats:
-                results.directory_stats[dir_path].files_affected = len(files)
+    def _add_file_stats(self, results: LintResults, file_results: FileResults) -> None:
+        """Add a file's issues to the directory and rule aggregations in one pass."""
+        if not file_results.issues:
+            return
+        
+        file_path = file_results.file_path
+        
+        # Extract directory path (once per file)
+        dir_path = file_directory(file_path)
+        
+        # Stats are created on first lookup
+        dir_stats = results.directory_stats[dir_path]
+        dir_stats.files_affected_set.add(file_path)
+        dir_rule_counts = dir_stats.rule_counts
+        rule_stats_by_id = results.rule_stats
+        
+        for issue in file_results.issues:
+            rule_id = issue.rule_id
+            rule_stats = rule_stats_by_id[rule_id]
+            rule_stats.files_affected.add(file_path)
+            
+            dir_stats.total_issues += 1
+            rule_stats.total_count += 1
+            if issue.severity == LintSeverity.ERROR:
+                dir_stats.error_count += 1
+                rule_stats.error_count += 1
+            elif issue.severity == LintSeverity.WARNING:
+                dir_stats.warning_count += 1
+                rule_stats.warning_count += 1
+            
+            # Track rule counts in this directory
+            dir_rule_counts[rule_id] += 1
     
     def filter_results(self, results: LintResults, errors_only: bool = False, 
                       rule_filter: str = None) -> LintResults:
@@ -175,28 +149,44 @@ class ESLintParser:
         filtered_results = LintResults()
         
         for file_result in results.files:
-            filtered_file = FileResults(file_path=file_result.file_path)
+            if file_result.total_issues == 0:
+                continue
             
-            for issue in file_result.issues:
-                # Apply filters
-                if errors_only and issue.severity != LintSeverity.ERROR:
+            # Per-file counts settle most files without looking at their issues
+            unchanged = True
+            if rule_filter:
+                rule_count = file_result.rule_counts.get(rule_filter, 0)
+                if rule_count == 0:
                     continue
-                
-                if rule_filter and issue.rule_id != rule_filter:
+                unchanged = rule_count == file_result.total_issues
+            if errors_only:
+                if file_result.error_count == 0:
                     continue
-                
-                filtered_file.add_issue(issue)
+                unchanged = unchanged and file_result.error_count == file_result.total_issues
             
-            # Only include file if it has issues after filtering
-            if filtered_file.total_issues > 0:
-                filtered_results.add_file_results(filtered_file)
+            if unchanged:
+                # Every issue passes the filters, so the file's results are reused as they are
+                filtered_file = file_result
+            else:
+                filtered_file = FileResults(file_path=file_result.file_path)
                 
-                # Rebuild aggregated stats for filtered results
-                for issue in filtered_file.issues:
-                    self._add_to_directory_stats(filtered_results, filtered_file.file_path, issue)
-                    self._add_to_rule_stats(filtered_results, filtered_file.file_path, issue)
-        
-        # Post-process filtered results
-        self.post_process_results(filtered_results)
+                for issue in file_result.issues:
+                    # Apply filters
+                    if errors_only and issue.severity != LintSeverity.ERROR:
+                        continue
+                    
+                    if rule_filter and issue.rule_id != rule_filter:
+                        continue
+                    
+                    filtered_file.add_issue(issue)
+                
+                # Only include file if it has issues after filtering
+                if filtered_file.total_issues == 0:
+                    continue
+            
+            filtered_results.add_file_results(filtered_file)
+            
+            # Rebuild aggregated stats for filtered results
+            self._add_file_stats(filtered_results, filtered_file)
         
-        return filtered_results
\ No newline at end of file
+        return filtered_results
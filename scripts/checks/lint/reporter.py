@@ -6,11 +6,39 @@ Handles result reporting, JSON output generation, and console summaries.
 """
 
 import json
+import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
-from models import LintResults, FileResults, DirectoryStats, RuleStats
+from models import LintResults, FileResults, DirectoryStats, RuleStats, file_directory
+
+try:
+    import orjson  # Optional: much faster serialization of large reports
+except ImportError:
+    orjson = None
+
+
+@lru_cache(maxsize=4096)
+def _severity_info(error_count: int, warning_count: int) -> str:
+    """Format error and warning counts as e.g. "3 errors, 1 warnings", omitting zeros."""
+    error_part = f"{error_count} errors" if error_count > 0 else ""
+    warning_part = f"{warning_count} warnings" if warning_count > 0 else ""
+    return ", ".join(filter(None, [error_part, warning_part]))
+
+
+@lru_cache(maxsize=4096)
+def _severity_badge(error_count: int, warning_count: int) -> str:
+    """Format error and warning counts as a compact badge, e.g. "3E/1W"."""
+    error_part = f"{error_count}E" if error_count > 0 else ""
+    warning_part = f"{warning_count}W" if warning_count > 0 else ""
+    return "/".join(filter(None, [error_part, warning_part]))
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write console lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 class LintReporter:
@@ -57,125 +85,118 @@ class LintReporter:
         # Ensure parent directory exists
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.output_file, 'w') as f:
-            json.dump(report_data, f, indent=2, default=str)
+        if orjson is not None:
+            self.output_file.write_bytes(
+                orjson.dumps(report_data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+        else:
+            with open(self.output_file, 'w') as f:
+                json.dump(report_data, f, indent=2, default=str)
     
     def _display_console_summary(self, results: LintResults, verbose: bool = False) -> None:
         """Display summary information on console grouped by files/directories."""
-        print("\n" + "=" * 50)
-        print("ESLint Check Results")
-        print("=" * 50)
+        # Collect the summary and write it in one call rather than one print per line
+        lines = ["", "=" * 50, "ESLint Check Results", "=" * 50]
         
         # Summary statistics
-        print(f"\nSummary:")
-        print(f"  Total Issues: {results.total_issues}")
-        print(f"  Errors: {results.total_errors}")
-        print(f"  Warnings: {results.total_warnings}")
-        print(f"  Files Affected: {results.files_with_issues}/{results.total_files}")
+        lines.append("\nSummary:")
+        lines.append(f"  Total Issues: {results.total_issues}")
+        lines.append(f"  Errors: {results.total_errors}")
+        lines.append(f"  Warnings: {results.total_warnings}")
+        lines.append(f"  Files Affected: {results.files_with_issues}/{results.total_files}")
         
         if not results.has_issues():
-            print("\n✅ No linting issues found!")
+            lines.append("\n✅ No linting issues found!")
+            _write_lines(lines)
             return
         
         # Top rule violations
         top_rules = results.get_top_rules(10)
         if top_rules:
-            print(f"\nTop Rule Violations:")
+            lines.append("\nTop Rule Violations:")
             for i, rule in enumerate(top_rules, 1):
-                error_part = f"{rule.error_count} errors" if rule.error_count > 0 else ""
-                warning_part = f"{rule.warning_count} warnings" if rule.warning_count > 0 else ""
-                severity_info = ", ".join(filter(None, [error_part, warning_part]))
-                
-                print(f"  {i:2d}. {rule.rule_id}: {rule.total_count} violations "
-                      f"({severity_info}, {rule.files_count} files)")
+                severity_info = _severity_info(rule.error_count, rule.warning_count)
+                lines.append(f"  {i:2d}. {rule.rule_id}: {rule.total_count} violations "
+                             f"({severity_info}, {rule.files_count} files)")
         
         # Directory breakdown
         top_dirs = results.get_top_directories(10)
         if top_dirs:
-            print(f"\nIssues by Directory:")
+            lines.append("\nIssues by Directory:")
             for i, dir_stats in enumerate(top_dirs, 1):
-                error_part = f"{dir_stats.error_count} errors" if dir_stats.error_count > 0 else ""
-                warning_part = f"{dir_stats.warning_count} warnings" if dir_stats.warning_count > 0 else ""
-                severity_info = ", ".join(filter(None, [error_part, warning_part]))
-                
-                print(f"  {i:2d}. {dir_stats.path}/: {dir_stats.total_issues} issues "
-                      f"({severity_info}, {dir_stats.files_affected} files)")
+                severity_info = _severity_info(dir_stats.error_count, dir_stats.warning_count)
+                lines.append(f"  {i:2d}. {dir_stats.path}/: {dir_stats.total_issues} issues "
+                             f"({severity_info}, {dir_stats.files_affected} files)")
         
         # Most affected files
         most_affected = results.get_most_affected_files(10)
         if most_affected:
-            print(f"\nMost Affected Files:")
+            lines.append("\nMost Affected Files:")
             for i, file_result in enumerate(most_affected, 1):
-                error_part = f"{file_result.error_count} errors" if file_result.error_count > 0 else ""
-                warning_part = f"{file_result.warning_count} warnings" if file_result.warning_count > 0 else ""
-                severity_info = ", ".join(filter(None, [error_part, warning_part]))
-                
-                print(f"  {i:2d}. {file_result.file_path}: {file_result.total_issues} issues ({severity_info})")
+                severity_info = _severity_info(file_result.error_count, file_result.warning_count)
+                lines.append(f"  {i:2d}. {file_result.file_path}: {file_result.total_issues} issues ({severity_info})")
         
         # Verbose file-by-file breakdown
         if verbose:
-            self._display_verbose_breakdown(results)
+            self._format_verbose_breakdown(lines, results)
         else:
-            print(f"\nRun with --verbose for detailed file-by-file breakdown")
+            lines.append("\nRun with --verbose for detailed file-by-file breakdown")
+        
+        _write_lines(lines)
     
     def _display_by_rule_summary(self, results: LintResults, verbose: bool = False) -> None:
         """Display summary information grouped by rules."""
-        print("\n" + "=" * 50)
-        print("ESLint Check Results (Grouped by Rule)")
-        print("=" * 50)
+        lines = ["", "=" * 50, "ESLint Check Results (Grouped by Rule)", "=" * 50]
         
         # Summary statistics
-        print(f"\nSummary:")
-        print(f"  Total Issues: {results.total_issues}")
-        print(f"  Errors: {results.total_errors}")
-        print(f"  Warnings: {results.total_warnings}")
-        print(f"  Files Affected: {results.files_with_issues}/{results.total_files}")
-        print(f"  Rules Violated: {len(results.rule_stats)}")
+        lines.append("\nSummary:")
+        lines.append(f"  Total Issues: {results.total_issues}")
+        lines.append(f"  Errors: {results.total_errors}")
+        lines.append(f"  Warnings: {results.total_warnings}")
+        lines.append(f"  Files Affected: {results.files_with_issues}/{results.total_files}")
+        lines.append(f"  Rules Violated: {len(results.rule_stats)}")
         
         if not results.has_issues():
-            print("\n✅ No linting issues found!")
+            lines.append("\n✅ No linting issues found!")
+            _write_lines(lines)
             return
         
         # Group by rule
         top_rules = results.get_top_rules(50)  # Show more rules in rule-focused view
         
         for rule in top_rules:
-            print(f"\n📋 {rule.rule_id}")
-            print(f"   Total: {rule.total_count} violations in {rule.files_count} files")
+            lines.append(f"\n📋 {rule.rule_id}")
+            lines.append(f"   Total: {rule.total_count} violations in {rule.files_count} files")
             
-            error_part = f"{rule.error_count} errors" if rule.error_count > 0 else ""
-            warning_part = f"{rule.warning_count} warnings" if rule.warning_count > 0 else ""
-            severity_info = ", ".join(filter(None, [error_part, warning_part]))
+            severity_info = _severity_info(rule.error_count, rule.warning_count)
             if severity_info:
-                print(f"   Severity: {severity_info}")
+                lines.append(f"   Severity: {severity_info}")
             
             if verbose and rule.files_count <= 20:  # Don't spam for rules affecting many files
-                print(f"   Affected files:")
+                lines.append("   Affected files:")
                 for file_path in sorted(rule.files_affected):
                     # Count issues for this rule in this file
-                    file_result = next((f for f in results.files if f.file_path == file_path), None)
+                    file_result = results.file_index.get(file_path)
                     if file_result:
-                        rule_issues = [i for i in file_result.issues if i.rule_id == rule.rule_id]
-                        print(f"     • {file_path} ({len(rule_issues)} issues)")
+                        lines.append(f"     • {file_path} ({file_result.rule_counts.get(rule.rule_id, 0)} issues)")
             elif rule.files_count > 20:
-                print(f"   Too many files to list ({rule.files_count} files)")
+                lines.append(f"   Too many files to list ({rule.files_count} files)")
         
         if not verbose:
-            print(f"\nRun with --verbose to see affected files for each rule")
+            lines.append("\nRun with --verbose to see affected files for each rule")
+        
+        _write_lines(lines)
     
-    def _display_verbose_breakdown(self, results: LintResults) -> None:
-        """Display detailed file-by-file breakdown."""
-        print(f"\n📁 Detailed File Breakdown:")
-        print("-" * 50)
+    def _format_verbose_breakdown(self, lines: List[str], results: LintResults) -> None:
+        """Append the console lines for the detailed file-by-file breakdown."""
+        lines.append("\n📁 Detailed File Breakdown:")
+        lines.append("-" * 50)
         
         # Group files by directory for better organization
         files_by_dir = {}
         for file_result in results.files:
             if file_result.total_issues > 0:
-                dir_path = str(Path(file_result.file_path).parent)
-                if dir_path == '.':
-                    dir_path = 'root'
-                
+                dir_path = file_directory(file_result.file_path)
                 if dir_path not in files_by_dir:
                     files_by_dir[dir_path] = []
                 files_by_dir[dir_path].append(file_result)
@@ -184,51 +205,46 @@ class LintReporter:
         for dir_path in sorted(files_by_dir.keys()):
             files = sorted(files_by_dir[dir_path], key=lambda f: f.total_issues, reverse=True)
             
-            print(f"\n📂 {dir_path}/")
+            lines.append(f"\n📂 {dir_path}/")
             for file_result in files:
-                error_part = f"{file_result.error_count}E" if file_result.error_count > 0 else ""
-                warning_part = f"{file_result.warning_count}W" if file_result.warning_count > 0 else ""
-                severity_badge = "/".join(filter(None, [error_part, warning_part]))
+                severity_badge = _severity_badge(file_result.error_count, file_result.warning_count)
                 
                 file_name = Path(file_result.file_path).name
-                print(f"   📄 {file_name} ({severity_badge})")
+                lines.append(f"   📄 {file_name} ({severity_badge})")
                 
-                # Group issues by rule for this file
-                issues_by_rule = {}
-                for issue in file_result.issues:
-                    if issue.rule_id not in issues_by_rule:
-                        issues_by_rule[issue.rule_id] = []
-                    issues_by_rule[issue.rule_id].append(issue)
+                # Collect the first few issues per rule; counts and severity come from the file's stats
+                rule_counts = file_result.rule_counts
+                if len(rule_counts) == 1:
+                    shown_issues = {file_result.issues[0].rule_id: file_result.issues[:3]}
+                else:
+                    shown_issues = {}
+                    for issue in file_result.issues:
+                        rule_issues = shown_issues.setdefault(issue.rule_id, [])
+                        if len(rule_issues) < 3:  # Limit to first 3 issues per rule
+                            rule_issues.append(issue)
                 
                 # Display issues grouped by rule
-                for rule_id in sorted(issues_by_rule.keys()):
-                    rule_issues = issues_by_rule[rule_id]
-                    count = len(rule_issues)
-                    severity_icon = "🔴" if any(i.severity.value == 2 for i in rule_issues) else "🟡"
+                for rule_id in sorted(rule_counts):
+                    count = rule_counts[rule_id]
+                    severity_icon = "🔴" if rule_id in file_result.rule_has_error else "🟡"
                     
-                    print(f"      {severity_icon} {rule_id}: {count} issue{'s' if count > 1 else ''}")
+                    lines.append(f"      {severity_icon} {rule_id}: {count} issue{'s' if count > 1 else ''}")
                     
                     # Show first few issues for this rule
-                    for issue in rule_issues[:3]:  # Limit to first 3 issues per rule
+                    for issue in shown_issues[rule_id]:
                         line_info = f"L{issue.line}:{issue.column}" if issue.line > 0 else ""
-                        print(f"         {line_info} {issue.message}")
+                        lines.append(f"         {line_info} {issue.message}")
                     
-                    if len(rule_issues) > 3:
-                        print(f"         ... and {len(rule_issues) - 3} more")
+                    if count > 3:
+                        lines.append(f"         ... and {count - 3} more")
     
     def display_no_issues_message(self) -> None:
         """Display message when no linting issues are found."""
-        print("\n" + "=" * 50)
-        print("ESLint Check Results")
-        print("=" * 50)
-        print("\n✅ No linting issues found!")
-        print("\nAll files pass ESLint checks.")
+        _write_lines(["", "=" * 50, "ESLint Check Results", "=" * 50,
+                      "\n✅ No linting issues found!", "\nAll files pass ESLint checks."])
     
     def display_execution_error(self, error_message: str) -> None:
         """Display error message when ESLint execution fails."""
-        print("\n" + "=" * 50)
-        print("ESLint Check Results")
-        print("=" * 50)
-        print(f"\n❌ ESLint execution failed:")
-        print(f"   {error_message}")
-        print("\nPlease check your ESLint configuration and try again.")
\ No newline at end of file
+        _write_lines(["", "=" * 50, "ESLint Check Results", "=" * 50,
+                      "\n❌ ESLint execution failed:", f"   {error_message}",
+                      "\nPlease check your ESLint configuration and try again."])
@@ -5,21 +5,107 @@ ESLint runner module.
 Handles executing ESLint with proper environment setup and output capture.
 """
 
+import hashlib
 import json
 import os
+import socket
 import subprocess
 import sys
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import orjson  # Optional: faster decoding of ESLint's output
+except ImportError:
+    orjson = None
+
+from cache import LintCache, hash_lint_config
+
+# Errors raised while decoding ESLint JSON output, eagerly or while streaming it
+JSON_PARSE_ERRORS = (ValueError,)
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Directory `next lint` covers by default in this project, split into shards for --jobs
+LINT_ROOT = "src"
+
+# ESLint's own result cache, keyed by content so checkouts and rebuilds don't invalidate it;
+# files are named after the lint config hash
+ESLINT_CACHE_DIR = "node_modules/.cache/eslint"
+ESLINT_CACHE_NAME = ".eslintcache"
+
+# ESLint formatter writing one result object per line, so output is decoded a file at a time
+NDJSON_FORMATTER = Path(__file__).with_name("ndjson_formatter.cjs")
+
+# Long-lived ESLint process used with --daemon, and how long to wait for it to start
+DAEMON_SCRIPT = Path(__file__).with_name("eslint_daemon.mjs")
+DAEMON_START_TIMEOUT = 60
+
+# With --jobs auto, projects with fewer files than this lint in one run, as each extra
+# ESLint process pays its own startup and type-checker setup
+AUTO_JOBS_MIN_FILES = 50
+
+# Files directly under LINT_ROOT that ESLint lints
+LINTED_SUFFIXES = ('.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs')
+
+
+def _count_files(directory: str) -> int:
+    """Count the lintable files under a directory, as a rough measure of its linting cost."""
+    return sum(
+        1 for _, _, files in os.walk(directory) for name in files if name.endswith(LINTED_SUFFIXES)
+    )
+
+
+def _has_json_content(path: str) -> bool:
+    """Check whether a file holds anything besides whitespace, without reading all of it."""
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(4096)
+            if not chunk:
+                return False
+            if chunk.strip():
+                return True
+
+
+def _iter_json_lines(paths: List[str]) -> Iterator[Dict]:
+    """Yield the JSON object on each line (NDJSON) of each file in turn, then delete them all.
+    
+    Every file is deleted even when decoding fails or the consumer stops early.
+    """
+    try:
+        for path in paths:
+            with open(path, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        yield _json_loads(line)
+    finally:
+        for path in paths:
+            os.unlink(path)
 
 
 class ESLintRunner:
     """Runs ESLint and captures output."""
     
-    def __init__(self, project_root: Optional[Path] = None):
-        """Initialize the runner with project root path."""
+    def __init__(self, project_root: Optional[Path] = None, jobs: Union[int, str] = 1, use_cache: bool = True,
+                 daemon: bool = False):
+        """
+        Initialize the runner.
+        
+        Args:
+            project_root: Project to lint
+            jobs: Number of parallel ESLint runs, or "auto" for one per CPU on larger projects
+            use_cache: Reuse results for unchanged files
+            daemon: Lint through a long-lived ESLint process instead of `pnpm lint`
+        """
         self.project_root = project_root or Path(__file__).parent.parent.parent.parent
+        self.jobs = jobs
+        self.use_cache = use_cache
+        self.daemon = daemon
+        self._config_hash: Optional[str] = None
         
     def run_eslint(self, format_type: str = "json") -> Tuple[bool, str, str]:
         """
@@ -31,52 +117,22 @@ class ESLintRunner:
         Returns:
             Tuple of (success: bool, stdout: str, stderr: str)
         """
-        # Use current environment with SKIP_ENV_VALIDATION for linting
-        # This is needed because linting doesn't require database connections
-        env = os.environ.copy()
-        env["SKIP_ENV_VALIDATION"] = "true"
-        
         # For JSON format, write to a temporary file to avoid buffer limits
         if format_type == "json":
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                temp_path = temp_file.name
-                
-            # Build ESLint command with output file - always run on entire project
-            cmd = ["pnpm", "lint", f"--format={format_type}", "--output-file", temp_path]
-                
+            success, temp_path, stderr = self.run_eslint_to_json_file()
+            
+            # Read JSON from temp file
             try:
-                # Run ESLint
-                result = subprocess.run(
-                    cmd,
-                    cwd=self.project_root,
-                    capture_output=True,
-                    text=True,
-                    env=env,
-                    timeout=300
-                )
-                
-                # Read JSON from temp file
-                try:
-                    with open(temp_path, 'r') as f:
-                        json_content = f.read()
-                finally:
-                    # Clean up temp file
-                    os.unlink(temp_path)
-                
-                return (
-                    result.returncode == 0,
-                    json_content,  # JSON content from file
-                    result.stderr  # Keep stderr for error messages
-                )
-                
-            except (subprocess.SubprocessError, OSError) as e:
-                # Clean up temp file on error
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
-                raise e
+                with open(temp_path, 'r') as f:
+                    json_content = f.read()
+            finally:
+                # Clean up temp file
+                os.unlink(temp_path)
+            
+            return success, json_content, stderr
         else:
             # For non-JSON formats, use regular approach - always run on entire project
-            cmd = ["pnpm", "lint", f"--format={format_type}"]
+            cmd = ["pnpm", "lint", f"--format={format_type}", *self._eslint_cache_args()]
             
             try:
                 # Run ESLint (for non-JSON formats)
@@ -85,7 +141,7 @@ class ESLintRunner:
                     cwd=self.project_root,
                     capture_output=True,
                     text=True,
-                    env=env,
+                    env=self._eslint_env(),
                     timeout=300
                 )
                 
@@ -100,34 +156,324 @@ class ESLintRunner:
             except FileNotFoundError:
                 return False, "", "ESLint command not found. Make sure pnpm and dependencies are installed."
     
-    def run_with_json_output(self) -> Tuple[bool, Optional[List[Dict]], str]:
+    def _eslint_env(self) -> Dict[str, str]:
+        """Current environment with SKIP_ENV_VALIDATION set for linting."""
+        # This is needed because linting doesn't require database connections
+        env = os.environ.copy()
+        env["SKIP_ENV_VALIDATION"] = "true"
+        return env
+    
+    def _lint_config_hash(self) -> str:
+        """Hash of the ESLint config, custom rules and dependencies, computed once per runner."""
+        if self._config_hash is None:
+            self._config_hash = hash_lint_config(Path(os.path.realpath(self.project_root)))
+        return self._config_hash
+    
+    def _eslint_cache_location(self, shard: Optional[int] = None) -> Path:
         """
-        Run ESLint on entire project and return parsed JSON output.
+        ESLint cache file for the current lint config.
+        
+        ESLint rechecks each entry against the file's resolved config, but not against plugin
+        code (eslint-rules/, upgraded dependencies), so the config hash is part of the name.
+        Parallel shards each get their own file, so they don't overwrite each other's.
+        """
+        name = f"{ESLINT_CACHE_NAME}-{self._lint_config_hash()[:12]}"
+        if shard is not None:
+            name += f"-{shard}"
+        return self.project_root / ESLINT_CACHE_DIR / name
+    
+    def _prune_eslint_caches(self) -> None:
+        """Delete ESLint cache files left by earlier lint configs."""
+        current = f"{ESLINT_CACHE_NAME}-{self._lint_config_hash()[:12]}"
+        try:
+            with os.scandir(self.project_root / ESLINT_CACHE_DIR) as entries:
+                stale = [
+                    entry.path for entry in entries
+                    if entry.name.startswith(ESLINT_CACHE_NAME) and not entry.name.startswith(current)
+                ]
+            for path in stale:
+                os.unlink(path)
+        except OSError:
+            pass
+    
+    def _eslint_cache_args(self, shard: Optional[int] = None) -> List[str]:
+        """`next lint` arguments for ESLint's result cache, which `next lint` enables by default."""
+        if not self.use_cache:
+            return ["--no-cache"]
+        return ["--cache-location", str(self._eslint_cache_location(shard)), "--cache-strategy", "content"]
+    
+    def run_eslint_to_json_file(self, target_args: Sequence[str] = (), shard: Optional[int] = None,
+                                output_format: str = "json") -> Tuple[bool, str, str]:
+        """
+        Run ESLint with JSON output written to a temporary file.
+        
+        Args:
+            target_args: `next lint` --dir/--file arguments; empty lints the entire project
+            shard: Index of the parallel shard being run, if any
+            output_format: ESLint formatter, "json" or a formatter path such as NDJSON_FORMATTER
+            
+        Returns:
+            Tuple of (success: bool, json_path: str, stderr: str); the caller deletes json_path
+        """
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
+            temp_path = temp_file.name
+            
+        # Build ESLint command with output file - the entire project unless given a shard
+        cmd = ["pnpm", "lint", f"--format={output_format}", "--output-file", temp_path,
+               *self._eslint_cache_args(shard), *target_args]
+            
+        try:
+            # Run ESLint; results go to the output file, so stdout is discarded and
+            # stderr is spilled to a file instead of being pumped through a pipe
+            with tempfile.TemporaryFile() as stderr_file:
+                result = subprocess.run(
+                    cmd,
+                    cwd=self.project_root,
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr_file,
+                    env=self._eslint_env(),
+                    timeout=300
+                )
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode('utf-8', errors='replace')
+        except (subprocess.SubprocessError, OSError) as e:
+            # Clean up temp file on error
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise e
+        
+        # Keep stderr for error messages
+        return result.returncode == 0, temp_path, stderr
+    
+    def _shard_target_args(self) -> List[List[str]]:
+        """
+        Split LINT_ROOT into up to `jobs` groups of --dir/--file arguments.
+        
+        Each top-level directory or file is one unit; units are assigned largest first
+        to the group with the fewest files so far, to balance the runs. Directories without
+        lintable files are left out, so every group has files to lint.
+        """
+        lint_root = self.project_root / LINT_ROOT
+        if self.jobs == "auto" and lint_root.is_dir():
+            jobs = (os.cpu_count() or 1) if _count_files(str(lint_root)) >= AUTO_JOBS_MIN_FILES else 1
+        else:
+            jobs = self.jobs if isinstance(self.jobs, int) else 1
+        if jobs <= 1 or not lint_root.is_dir():
+            return []
+        
+        units = []
+        with os.scandir(lint_root) as entries:
+            for entry in entries:
+                relative = f"{LINT_ROOT}/{entry.name}"
+                if entry.is_dir():
+                    file_count = _count_files(entry.path)
+                    if file_count:
+                        units.append((file_count, ["--dir", relative]))
+                elif entry.name.endswith(LINTED_SUFFIXES):
+                    units.append((1, ["--file", relative]))
+        
+        groups: List[Tuple[int, List[str]]] = [(0, []) for _ in range(min(jobs, len(units)))]
+        for size, args in sorted(units, key=lambda unit: (-unit[0], unit[1])):
+            smallest = min(range(len(groups)), key=lambda i: groups[i][0])
+            groups[smallest] = (groups[smallest][0] + size, groups[smallest][1] + args)
+        return [args for _, args in groups]
+    
+    def _run_eslint_shards(self, target_args: Optional[List[str]] = None) -> List[Tuple[bool, str, str]]:
+        """Run ESLint once, or once per shard in parallel when jobs > 1.
+        
+        Explicit target_args are linted in a single run instead of sharding the project.
+        """
+        ndjson = str(NDJSON_FORMATTER)
+        if target_args is not None:
+            return [self.run_eslint_to_json_file(target_args, output_format=ndjson)]
+        shards = self._shard_target_args()
+        if len(shards) <= 1:
+            return [self.run_eslint_to_json_file(output_format=ndjson)]
+        
+        # Each shard is its own ESLint process, so threads only wait on them
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            futures = [
+                executor.submit(self.run_eslint_to_json_file, shard, index, ndjson)
+                for index, shard in enumerate(shards)
+            ]
+        
+        runs = []
+        error = None
+        for future in futures:
+            try:
+                runs.append(future.result())
+            except (subprocess.SubprocessError, OSError) as e:
+                error = error or e
+        if error is not None:
+            for _, json_path, _ in runs:
+                os.unlink(json_path)
+            raise error
+        return runs
+    
+    def _daemon_socket_path(self) -> str:
+        """Socket of this project's ESLint daemon (in the temp dir, as socket paths are length-limited)."""
+        root_digest = hashlib.blake2b(str(self.project_root.resolve()).encode(), digest_size=8).hexdigest()
+        return os.path.join(tempfile.gettempdir(), f"eslint-daemon-{root_digest}.sock")
+    
+    def _connect_daemon(self, socket_path: str, config_key: str) -> socket.socket:
+        """Connect to the ESLint daemon, starting it if it isn't running."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(socket_path)
+            return sock
+        except (FileNotFoundError, ConnectionRefusedError):
+            sock.close()
+        
+        process = subprocess.Popen(
+            ["node", str(DAEMON_SCRIPT), socket_path, str(self.project_root), config_key],
+            cwd=self.project_root,
+            env=self._eslint_env(),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        deadline = time.monotonic() + DAEMON_START_TIMEOUT
+        while True:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(socket_path)
+                return sock
+            except (FileNotFoundError, ConnectionRefusedError):
+                sock.close()
+            if process.poll() is not None:
+                raise OSError(f"ESLint daemon exited with code {process.returncode} while starting")
+            if time.monotonic() > deadline:
+                raise OSError(f"ESLint daemon did not start within {DAEMON_START_TIMEOUT}s")
+            time.sleep(0.1)
+    
+    def run_eslint_daemon(self, paths: Sequence[str]) -> Tuple[bool, Optional[Iterator[Dict]], str]:
+        """
+        Lint paths through the ESLint daemon, starting or restarting it as needed.
         
         Returns:
-            Tuple of (success: bool, parsed_json: Optional[List[Dict]], error_message: str)
+            Tuple of (success: bool, file_objects: Optional[Iterator[Dict]], error_message: str)
         """
-        success, stdout, stderr = self.run_eslint("json")
+        socket_path = self._daemon_socket_path()
+        config_key = self._lint_config_hash()
+        request = json.dumps({
+            "configKey": config_key,
+            "paths": list(paths),
+            "extensions": list(LINTED_SUFFIXES),
+            "cache": self.use_cache,
+            "cacheLocation": str(self._eslint_cache_location()),
+        })
+        
+        # A daemon started under another config exits when asked, so retry once with a new one
+        for _ in range(2):
+            try:
+                sock = self._connect_daemon(socket_path, config_key)
+            except OSError as e:
+                return False, None, f"ESLint daemon failed: {e}"
+            reader = sock.makefile('rb')
+            try:
+                sock.sendall(request.encode() + b"\n")
+                header = json.loads(reader.readline() or b'{"error": "no response"}')
+            except (OSError, ValueError) as e:
+                reader.close()
+                sock.close()
+                return False, None, f"ESLint daemon failed: {e}"
+            if not header.get("restart"):
+                break
+            reader.close()
+            sock.close()
+        
+        if not header.get("ok"):
+            reader.close()
+            sock.close()
+            return False, None, f"ESLint daemon failed: {header.get('error', 'it kept restarting')}"
+        return True, self._iter_daemon_results(sock, reader), ""
+    
+    def _iter_daemon_results(self, sock: socket.socket, reader) -> Iterator[Dict]:
+        """Yield the daemon's result objects, one per line, then close the connection."""
+        try:
+            for line in reader:
+                yield _json_loads(line)
+        finally:
+            reader.close()
+            sock.close()
+    
+    def run_with_json_output(self) -> Tuple[bool, Optional[Iterator[Dict]], str]:
+        """
+        Run ESLint on entire project and return its JSON output as a stream of file objects.
+        
+        ESLint writes one file object per line (NDJSON), and each line is decoded as it is
+        iterated, so decoding errors surface while iterating as one of JSON_PARSE_ERRORS.
+        
+        With caching on, only files changed since the last run are linted, and their results
+        are merged with the cached results of the others.
+        
+        Returns:
+            Tuple of (success: bool, file_objects: Optional[Iterator[Dict]], error_message: str)
+        """
+        cache = None
+        if self.use_cache:
+            self._prune_eslint_caches()
+            cache = LintCache(self.project_root, config_hash=self._lint_config_hash())
+        stale_paths = None
+        if cache is not None:
+            stale_files = cache.stale_files(LINT_ROOT, LINTED_SUFFIXES)
+            if stale_files is not None:
+                if not stale_files:
+                    return True, iter(cache.cached_results()), ""
+                stale_paths = [os.path.relpath(path, cache.project_root) for path in stale_files]
+        
+        if self.daemon:
+            success, file_objects, error_message = self.run_eslint_daemon(stale_paths or [LINT_ROOT])
+            if success and cache is not None:
+                file_objects = cache.record(file_objects, full_run=stale_paths is None)
+            return success, file_objects, error_message
+        
+        target_args = None
+        if stale_paths is not None:
+            target_args = [arg for path in stale_paths for arg in ("--file", path)]
+        runs = self._run_eslint_shards(target_args)
+        stderr = "\n".join(run_stderr for _, _, run_stderr in runs if run_stderr)
         
         # Check for environment validation errors that prevent ESLint from running
         if stderr and "Invalid environment variables" in stderr:
+            for _, json_path, _ in runs:
+                os.unlink(json_path)
             return False, None, "Environment validation failed. Please ensure all required environment variables are set in your .env file before running lint checks."
         
         # Handle case where pnpm failed (exit code 1) but ESLint might have produced JSON
         # pnpm wraps the actual ESLint output with its own headers/footers
         
-        # Parse JSON output (stdout now contains the complete JSON from file)
-        if stdout and stdout.strip():
-            try:
-                json_data = json.loads(stdout.strip())
-                return True, json_data, ""
-            except json.JSONDecodeError as e:
-                return False, None, f"Failed to parse ESLint JSON output: {e}"
+        # Stream JSON output from the file(s) ESLint wrote, one shard after another
+        json_paths = []
+        empty_run_stderr = []
+        for _, json_path, run_stderr in runs:
+            if _has_json_content(json_path):
+                json_paths.append(json_path)
+            else:
+                os.unlink(json_path)
+                empty_run_stderr.append(run_stderr)
+        
+        # Shards and runs on changed files always have files to lint, and ESLint reports every
+        # file it lints, so a run without output crashed (e.g. ran out of memory). Its files
+        # would silently drop out of the report, and out of the cache on a full run.
+        if empty_run_stderr and (target_args is not None or len(runs) > 1):
+            for json_path in json_paths:
+                os.unlink(json_path)
+            run_stderr = empty_run_stderr[0]
+            scope = "changed files" if target_args is not None else "a shard of --jobs"
+            return False, None, f"ESLint produced no results for {scope}.\nError: {run_stderr[:200] if run_stderr else 'Unknown error'}"
+        
+        if json_paths:
+            file_objects = _iter_json_lines(json_paths)
+            if cache is not None:
+                file_objects = cache.record(file_objects, full_run=target_args is None)
+            return True, file_objects, ""
         
         # No JSON output - check if this is a successful run with no issues
         if not stderr or "ELIFECYCLE" in stderr:
-            # No output likely means no files to lint or no issues found
-            return True, [], ""
+            # No output likely means no files to lint
+            return True, iter(()), ""
         
         # ESLint configuration or execution error
         return False, None, f"ESLint execution failed.\nError: {stderr[:200] if stderr else 'Unknown error'}"
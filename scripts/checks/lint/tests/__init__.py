@@ -0,0 +1 @@
+"""Tests for the ESLint check."""
\ No newline at end of file
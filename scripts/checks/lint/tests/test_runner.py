@@ -0,0 +1,157 @@
+"""
+Tests for the ESLint runner.
+
+Runs ESLintRunner against a stand-in `pnpm` on PATH that writes NDJSON results the way
+`pnpm lint --format=<ndjson formatter> --output-file ...` does, so no Node setup is needed.
+"""
+
+import importlib
+import os
+import stat
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+import pytest
+
+# The lint modules import each other as top-level modules (`from cache import ...`), so
+# they are loaded from here by the runner fixture, only for the test that needs them
+LINT_DIR = os.path.join(os.path.dirname(__file__), '..')
+LINT_MODULES = ("runner", "cache")
+
+# Stand-in for `pnpm lint`: writes a result line per file under the --dir/--file targets
+# (or under src without targets); a target listed in $FAKE_ESLINT_CRASH makes it exit like
+# an ESLint process killed by the OOM killer, one in $FAKE_ESLINT_GARBLE makes it start its
+# output with a line that isn't JSON, and $FAKE_ESLINT_SILENT makes it write nothing
+FAKE_PNPM = textwrap.dedent('''\
+    #!{python}
+    import json, os, sys
+    args = sys.argv[1:]
+    output = args[args.index("--output-file") + 1]
+    targets = [args[i + 1] for i, arg in enumerate(args) if arg in ("--dir", "--file")] or ["src"]
+    if set(targets) & set(os.environ.get("FAKE_ESLINT_CRASH", "").split(",")):
+        sys.stderr.write("FATAL ERROR: Reached heap limit Allocation failed - JavaScript heap out of memory\\n")
+        sys.exit(134)
+    if os.environ.get("FAKE_ESLINT_SILENT"):
+        sys.exit(0)
+    with open(output, "w") as f:
+        if set(targets) & set(os.environ.get("FAKE_ESLINT_GARBLE", "").split(",")):
+            f.write("Segmentation fault\\n")
+        for target in targets:
+            paths = [target] if os.path.isfile(target) else sorted(
+                os.path.join(root, name) for root, _, names in os.walk(target) for name in names
+            )
+            for path in paths:
+                f.write(json.dumps({{"filePath": os.path.abspath(path), "messages": [], "errorCount": 0,
+                                    "warningCount": 0}}) + "\\n")
+''')
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    """The lint runner module, loaded with lint/ on sys.path for this test only.
+
+    Other checkers have top-level modules of the same names (e.g. `models`), so the
+    path and the loaded modules are both dropped again afterwards.
+    """
+    monkeypatch.syspath_prepend(LINT_DIR)
+    for name in LINT_MODULES:
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    yield importlib.import_module("runner")
+    for name in LINT_MODULES:
+        sys.modules.pop(name, None)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A project with two top-level source directories and a fake pnpm first on PATH."""
+    for relative in ("src/app/page.ts", "src/lib/util.ts"):
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("export const value = 1;\n")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    pnpm = bin_dir / "pnpm"
+    pnpm.write_text(FAKE_PNPM.format(python=sys.executable))
+    pnpm.chmod(pnpm.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def temp_dir(tmp_path, monkeypatch):
+    """A temp directory of its own for the runner's result files."""
+    temp_dir = tmp_path / "tmp"
+    temp_dir.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(temp_dir))
+    return temp_dir
+
+
+def _lint(runner, project: Path, **kwargs):
+    """Run the runner and materialize its results."""
+    success, file_objects, error_message = runner.ESLintRunner(project, **kwargs).run_with_json_output()
+    return success, list(file_objects) if file_objects is not None else None, error_message
+
+
+def test_sharded_run_reports_every_shard(runner, project):
+    success, results, _ = _lint(runner, project, jobs=2)
+
+    assert success
+    assert sorted(Path(result["filePath"]).name for result in results) == ["page.ts", "util.ts"]
+
+
+def test_crashed_shard_fails_the_run(runner, project, monkeypatch):
+    monkeypatch.setenv("FAKE_ESLINT_CRASH", "src/lib")
+
+    success, results, error_message = _lint(runner, project, jobs=2)
+
+    # The other shard's results must not pass for the whole project
+    assert not success
+    assert results is None
+    assert "heap out of memory" in error_message
+    # ...nor be cached as a full run that later runs would trust
+    assert not (project / "test-results" / ".lint-cache.json").exists()
+
+
+def test_changed_files_without_output_fail_the_run(runner, project, monkeypatch):
+    success, _, _ = _lint(runner, project)
+    assert success
+
+    (project / "src/lib/util.ts").write_text("export const value = 2;\n")
+    monkeypatch.setenv("FAKE_ESLINT_SILENT", "1")
+
+    success, results, error_message = _lint(runner, project)
+
+    assert not success
+    assert results is None
+    assert "changed files" in error_message
+
+    # The changed file is still stale, so the next working run lints it again
+    monkeypatch.delenv("FAKE_ESLINT_SILENT")
+    success, results, _ = _lint(runner, project)
+    assert success
+    assert sorted(Path(result["filePath"]).name for result in results) == ["page.ts", "util.ts"]
+
+
+def test_result_files_are_removed_when_reading_stops_early(runner, project, temp_dir):
+    success, file_objects, _ = runner.ESLintRunner(project, jobs=2, use_cache=False).run_with_json_output()
+    assert success
+    assert len(list(temp_dir.glob("*.json"))) == 2
+
+    next(file_objects)
+    file_objects.close()
+
+    assert list(temp_dir.glob("*.json")) == []
+
+
+def test_result_files_are_removed_when_a_shard_fails_to_decode(runner, project, temp_dir, monkeypatch):
+    monkeypatch.setenv("FAKE_ESLINT_GARBLE", "src/app,src/lib")
+
+    success, file_objects, _ = runner.ESLintRunner(project, jobs=2, use_cache=False).run_with_json_output()
+    assert success  # Output is decoded lazily, so the error surfaces while reading
+    with pytest.raises(runner.JSON_PARSE_ERRORS):
+        list(file_objects)
+
+    assert list(temp_dir.glob("*.json")) == []
@@ -5,22 +5,106 @@ Main Rule of 6 checker orchestration.
 Coordinates all rule checking and manages the overall checking process.
 """
 
+import os
+import sys
 import time
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import List
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from models import CheckResults, ViolationType, RuleOf6Violation, FileAnalysis, DomainDirectoryInfo
 from scanner import LegacyIgnoreManager, DirectoryScanner, FileScanner
 from parser import TypeScriptParser
 from exceptions import CustomThresholdManager
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from shared.analysis_cache import AnalysisCache, content_digest, source_digest
+
+# Bump for analysis format changes the source digests in _analysis_cache_version miss
+ANALYSIS_CACHE_VERSION = 1
+
+# Cached analyses of files not seen in a run are kept this long (seconds), newest
+# first, up to MAX_CACHE_ENTRIES in total; files seen in the run are always kept
+CACHE_ENTRY_TTL = 24 * 60 * 60
+MAX_CACHE_ENTRIES = 2000
+
+# Cache entry per file: (mtime_ns, size, content digest, analysis without content, last used)
+CacheEntry = Tuple[int, int, bytes, FileAnalysis, float]
+
+# Below this many files to parse (or with a single CPU), parse in-process: starting
+# worker processes and shipping files back and forth costs more than the parsing itself
+PROCESS_POOL_MIN_FILES = 32
+
+# Chunks of parsed files in flight per worker process; reading stops while this many wait
+PENDING_CHUNKS_PER_WORKER = 2
+
+# Files read ahead of the parser at most (and at least a chunk's worth when parsing in
+# processes), so stale files' contents are never all held in memory at once
+READ_AHEAD_FILES = 8
+
+# A scanned file (None if it was skipped) and its content digest (None when not caching)
+ScanResult = Tuple[Optional[FileAnalysis], Optional[bytes]]
+
+# Parser and object key limit used by every file parsed in a worker process
+# (set by _init_parse_worker)
+_worker_parser: Optional[TypeScriptParser] = None
+_worker_max_object_keys = 6
+
+
+def _parse_scanned_file(scan: ScanResult, parser: TypeScriptParser, max_object_keys: int) -> ScanResult:
+    """Parse functions and oversized object parameters of a scanned file, dropping its content."""
+    file_analysis, digest = scan
+    if file_analysis is None:
+        return scan
+    content = file_analysis.content
+    file_analysis = parser.parse_file(file_analysis, content)
+    file_analysis.object_parameters = parser.find_object_parameter_violations(
+        content, file_analysis.path, max_object_keys
+    )
+    file_analysis.content = None
+    return file_analysis, digest
+
+
+def _init_parse_worker(max_object_keys: int) -> None:
+    """Create the worker's parser once, rather than per file."""
+    global _worker_parser, _worker_max_object_keys
+    _worker_parser = TypeScriptParser()
+    _worker_max_object_keys = max_object_keys
+
+
+def _parse_file_worker(scan: ScanResult) -> ScanResult:
+    """Parse a file in a worker process (module-level so it pickles without the checker)."""
+    return _parse_scanned_file(scan, _worker_parser, _worker_max_object_keys)
+
+
+def _parse_chunk_worker(scans: List[ScanResult]) -> List[ScanResult]:
+    """Parse a chunk of scanned files in a worker process, in order."""
+    return [_parse_file_worker(scan) for scan in scans]
+
+
+def _read_ahead(executor: ThreadPoolExecutor, read: Callable[[Path], ScanResult], items: List[Path],
+                window: int) -> Iterator[ScanResult]:
+    """Yield read(item) for each item in order, with at most window reads submitted ahead."""
+    items = iter(items)
+    pending = deque(executor.submit(read, item) for item in islice(items, window))
+    while pending:
+        result = pending.popleft().result()
+        # Refill the window before handing the result over, so reading goes on meanwhile
+        for item in islice(items, 1):
+            pending.append(executor.submit(read, item))
+        yield result
+
 
 class RuleOf6Checker:
     """Main Rule of 6 checker that orchestrates all validation."""
     
-    def __init__(self, target_path: str = "src"):
+    def __init__(self, target_path: str = "src", cache_file: Optional[str] = None):
         self.target_path = Path(target_path)
+        self.analysis_cache = AnalysisCache(cache_file)
+        self._target_prefix = str(self.target_path) + os.sep
+        self._rel_cache: Dict[Path, str] = {}
         
         # Rule thresholds (defaults)
         self.max_directory_items = 6  # Legacy rule (backwards compatibility)
@@ -55,10 +139,12 @@ class RuleOf6Checker:
         start_time = time.time()
         results = CheckResults(target_path=str(self.target_path))
         
-        # Run all checks
+        # Run all checks; the per-file checks share one pool of workers
         self._check_domain_directory_rule(results)
-        self._check_file_function_rules(results)
-        self._check_object_parameter_rule(results)
+        ts_files = self.file_scanner.find_typescript_files(self.target_path)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            file_analyses = self._check_file_function_rules(ts_files, results, executor)
+        self._check_object_parameter_rule(file_analyses, results)
         
         results.execution_time = time.time() - start_time
         
@@ -109,6 +195,16 @@ class RuleOf6Checker:
         # Fallback: use current working directory
         return Path.cwd()
     
+    def _relativize(self, path: Path) -> str:
+        """Path relative to the target for reports, '.' for the target itself (memoized)."""
+        if path not in self._rel_cache:
+            path_str = str(path)
+            if path_str.startswith(self._target_prefix):
+                self._rel_cache[path] = path_str[len(self._target_prefix):]
+            else:
+                self._rel_cache[path] = str(path.relative_to(self.target_path))
+        return self._rel_cache[path]
+    
     def _check_directory_rule(self, results: CheckResults) -> None:
         """Check that directories have max 6 items (with custom threshold support)."""
         # First get all directories (we'll filter with custom thresholds)
@@ -132,7 +228,7 @@ class RuleOf6Checker:
             threshold = custom_rule.threshold if custom_rule else self.max_directory_items
             
             if dir_info.item_count > threshold:
-                relative_path = str(dir_info.path.relative_to(self.target_path) if dir_info.path != self.target_path else '.')
+                relative_path = self._relativize(dir_info.path)
                 items_display = dir_info.get_item_list_display()
                 
                 # Create message with custom threshold info
@@ -165,7 +261,7 @@ class RuleOf6Checker:
         )
         
         for dir_info in domain_violating_dirs:
-            relative_path = str(dir_info.path.relative_to(self.target_path) if dir_info.path != self.target_path else '.')
+            relative_path = self._relativize(dir_info.path)
             
             # Check for violations in domain folders
             if dir_info.domain_folder_count > self.max_domain_folders:
@@ -209,47 +305,120 @@ class RuleOf6Checker:
                 )
                 results.add_violation(violation)
     
-    def _check_file_function_rules(self, results: CheckResults) -> None:
-        """Check file function count and individual function rules."""        
-        # Find all TypeScript files
-        ts_files = self.file_scanner.find_typescript_files(self.target_path)
+    def _analysis_cache_version(self) -> Tuple[int, bytes, str, int]:
+        """Identify the analysis format so code or limit changes invalidate the cache.
         
-        # Analyze files in parallel
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            # Submit all file scanning tasks
-            file_futures = {
-                executor.submit(self.file_scanner.scan_file, file_path): file_path
-                for file_path in ts_files
-            }
-            
-            # Process scanned files and parse them
-            parse_futures = {}
-            for future in as_completed(file_futures):
-                file_analysis = future.result()
-                if file_analysis:
-                    # Read content and parse functions
-                    parse_future = executor.submit(self._parse_file_functions, file_analysis)
-                    parse_futures[parse_future] = file_analysis
-            
-            # Process parsed results
-            for future in as_completed(parse_futures):
-                file_analysis = future.result()
-                if file_analysis:
-                    self._check_single_file(file_analysis, results)
+        The digest covers the shared parser and every module taking part in the
+        per-file analysis: scanner, parser wrapper, this module and the models.
+        """
+        shared_parser = self.parser.shared_parser
+        code_digest = source_digest(
+            sys.modules[type(shared_parser).__module__].__file__,
+            sys.modules[FileScanner.__module__].__file__,
+            sys.modules[TypeScriptParser.__module__].__file__,
+            __file__,
+            sys.modules[FileAnalysis.__module__].__file__,
+        )
+        return (ANALYSIS_CACHE_VERSION, code_digest, shared_parser.backend, self.max_object_keys)
     
-    def _parse_file_functions(self, file_analysis: FileAnalysis) -> FileAnalysis:
-        """Parse functions in a single file."""
-        try:
-            with open(file_analysis.path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            return self.parser.parse_file(file_analysis, content)
-        except (UnicodeDecodeError, OSError):
-            return file_analysis
+    def _check_file_function_rules(self, ts_files: List[Path], results: CheckResults,
+                                   executor: ThreadPoolExecutor) -> List[FileAnalysis]:
+        """Check file function count and individual function rules, returning the analyzed files."""        
+        # Reuse analyses of unchanged files; only the rest are scanned and parsed
+        version = self._analysis_cache_version() if self.analysis_cache.enabled else None
+        cached = self.analysis_cache.load(version)
+        entries: Dict[Path, CacheEntry] = {}
+        stats: Dict[Path, Tuple[int, int]] = {}
+        analyses: Dict[Path, FileAnalysis] = {}
+        stale_files: List[Path] = []
+        now = time.time()
+        for file_path in ts_files:
+            stat = self.analysis_cache.stat(file_path) if self.analysis_cache.enabled else None
+            if stat is not None:
+                stats[file_path] = stat
+            entry = self.analysis_cache.reuse(cached.get(file_path), file_path, stat)
+            if entry is not None:
+                entries[file_path] = entry[:4] + (now,)
+                analyses[file_path] = entry[3]
+            else:
+                stale_files.append(file_path)
+        
+        # Read stale files on the thread pool and parse them (CPU-bound) in processes as
+        # the reads come in; both stages hand back results in discovery order
+        parsed = self._parse_files(stale_files, executor)
+        
+        # Check each file as soon as its analysis is ready, in discovery order so the
+        # report doesn't depend on scheduling
+        file_analyses = []
+        for file_path in ts_files:
+            if file_path in analyses:
+                file_analysis = analyses[file_path]
+            else:
+                file_analysis, digest = next(parsed)
+                if file_analysis is None:
+                    continue
+                # Parsed analyses come back without their content, ready to cache
+                if digest is not None and file_path in stats:
+                    entries[file_path] = stats[file_path] + (digest, file_analysis, now)
+            self._check_single_file(file_analysis, results)
+            file_analyses.append(file_analysis)
+        
+        if self.analysis_cache.enabled:
+            self.analysis_cache.save(self._merge_cache_entries(entries, cached, now), version)
+        return file_analyses
+    
+    def _scan_file(self, file_path: Path) -> ScanResult:
+        """Read and scan a stale file, digesting its content when caching."""
+        file_analysis = self.file_scanner.scan_file(file_path)
+        if file_analysis is None or not self.analysis_cache.enabled:
+            return file_analysis, None
+        return file_analysis, content_digest(file_analysis.content)
+    
+    def _merge_cache_entries(self, entries: Dict[Path, CacheEntry], cached: Dict[Path, CacheEntry],
+                             now: float) -> Dict[Path, CacheEntry]:
+        """Add recently used entries of files outside this run (e.g. another target) to entries."""
+        others = sorted(
+            ((file_path, entry) for file_path, entry in cached.items()
+             if file_path not in entries and now - entry[4] < CACHE_ENTRY_TTL),
+            key=lambda item: item[1][4], reverse=True,
+        )
+        merged = dict(entries)
+        merged.update(others[:max(0, MAX_CACHE_ENTRIES - len(entries))])
+        return merged
+    
+    def _parse_files(self, files: List[Path], executor: ThreadPoolExecutor) -> Iterator[ScanResult]:
+        """Read and parse files in order, sharding the parsing across worker processes when worthwhile."""
+        max_workers = os.cpu_count() or 1
+        if max_workers == 1 or len(files) < PROCESS_POOL_MIN_FILES:
+            scans = _read_ahead(executor, self._scan_file, files, READ_AHEAD_FILES)
+            return (_parse_scanned_file(scan, self.parser, self.max_object_keys) for scan in scans)
+        return self._parse_files_in_pool(files, executor, max_workers)
+    
+    def _parse_files_in_pool(self, files: List[Path], executor: ThreadPoolExecutor,
+                             max_workers: int) -> Iterator[ScanResult]:
+        # Parsing is CPU-bound, so use processes rather than threads to sidestep the GIL.
+        # Each chunk is submitted as soon as its files have been read (Executor.map would
+        # wait for every read before submitting anything), with a bounded number in flight;
+        # files are only read as chunks are taken, so reads stall along with submissions.
+        chunksize = max(1, len(files) // (max_workers * 4))
+        max_pending = max_workers * PENDING_CHUNKS_PER_WORKER
+        scans = _read_ahead(executor, self._scan_file, files, max(chunksize, READ_AHEAD_FILES))
+        pending = deque()
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_parse_worker, initargs=(self.max_object_keys,)
+        ) as process_executor:
+            while True:
+                chunk = list(islice(scans, chunksize))
+                if chunk:
+                    pending.append(process_executor.submit(_parse_chunk_worker, chunk))
+                if not pending:
+                    break
+                if not chunk or len(pending) >= max_pending:
+                    yield from pending.popleft().result()
     
     def _check_single_file(self, file_analysis: FileAnalysis, results: CheckResults) -> None:
         """Check a single file for Rule of 6 violations."""
-        relative_path = str(file_analysis.path.relative_to(self.target_path))
+        relative_path = self._relativize(file_analysis.path)
 
         # Check function count per file with custom threshold support
         custom_rule = self.threshold_manager.get_file_exception(file_analysis.path)
@@ -370,34 +539,27 @@ class RuleOf6Checker:
             )
             results.add_violation(violation)
     
-    def _check_object_parameter_rule(self, results: CheckResults) -> None:
+    def _check_object_parameter_rule(self, file_analyses: List[FileAnalysis], results: CheckResults) -> None:
         """Check object parameters have max 6 keys."""        
-        ts_files = self.file_scanner.find_typescript_files(self.target_path)
+        for file_analysis in file_analyses:
+            for violation in self._object_param_violations(file_analysis):
+                results.add_violation(violation)
+    
+    def _object_param_violations(self, file_analysis: FileAnalysis) -> List[RuleOf6Violation]:
+        """Warnings for the oversized object parameters found in a single file."""
+        relative_path = self._relativize(file_analysis.path)
         
-        for file_path in ts_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                violations = self.parser.find_object_parameter_violations(
-                    content, file_path, self.max_object_keys
-                )
-                
-                relative_path = str(file_path.relative_to(self.target_path))
-                
-                for line_num, key_count, params_preview in violations:
-                    violation = RuleOf6Violation.create_warning(
-                        message=f"Object parameter has {key_count} keys (max {self.max_object_keys})",
-                        violation_type=ViolationType.OBJECT_KEYS,
-                        file_path=relative_path,
-                        line_number=line_num,
-                        recommendation="Group related keys into nested objects or split into multiple focused parameters with clear semantic meaning.",
-                        context={
-                            "key_count": key_count,
-                            "params_preview": params_preview
-                        }
-                    )
-                    results.add_violation(violation)
-                    
-            except (UnicodeDecodeError, OSError):
-                continue
\ No newline at end of file
+        return [
+            RuleOf6Violation.create_warning(
+                message=f"Object parameter has {key_count} keys (max {self.max_object_keys})",
+                violation_type=ViolationType.OBJECT_KEYS,
+                file_path=relative_path,
+                line_number=line_num,
+                recommendation="Group related keys into nested objects or split into multiple focused parameters with clear semantic meaning.",
+                context={
+                    "key_count": key_count,
+                    "params_preview": params_preview
+                }
+            )
+            for line_num, key_count, params_preview in file_analysis.object_parameters
+        ]
@@ -91,7 +91,7 @@ def main():
         sys.exit(1)
     
     # Initialize checker and reporter
-    checker = RuleOf6Checker(str(target_path))
+    checker = RuleOf6Checker(str(target_path), cache_file="test-results/.ruleof6-cache.pkl")
     reporter = RuleOf6Reporter(args.output)
     
     try:
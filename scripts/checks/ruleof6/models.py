@@ -7,7 +7,8 @@ Contains all data structures used throughout the Rule of 6 checking system.
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Tuple
 from enum import Enum
 
 
@@ -106,6 +107,10 @@ class FileAnalysis:
     line_count: int
     function_count: int
     functions: List[FunctionInfo] = field(default_factory=list)
+    # (line number, key count, preview) of each object parameter over the key limit
+    object_parameters: List[Tuple[int, int, str]] = field(default_factory=list)
+    # Source text, kept from the scan so the parse doesn't read the file again
+    content: Optional[str] = field(default=None, repr=False)
     
     def get_function_names(self, max_names: int = 8) -> List[str]:
         """Get function names for display, truncated if needed."""
@@ -226,10 +231,14 @@ class CheckResults:
         """Get all violations (errors + warnings)."""
         return self.errors + self.warnings
     
+    def iter_violations(self) -> Iterator[RuleOf6Violation]:
+        """Iterate over all violations (errors, then warnings) without building a combined list."""
+        return chain(self.errors, self.warnings)
+    
     def get_summary_by_type(self) -> Dict[str, int]:
         """Get count of violations by type."""
         summary = {}
-        for violation in self.get_all_violations():
+        for violation in self.iter_violations():
             violation_type = violation.violation_type.value
             summary[violation_type] = summary.get(violation_type, 0) + 1
         return summary
@@ -237,7 +246,7 @@ class CheckResults:
     def get_summary_by_path(self) -> Dict[str, int]:
         """Get count of violations by file path or directory."""
         summary = {}
-        for violation in self.get_all_violations():
+        for violation in self.iter_violations():
             if violation.file_path:
                 path_key = str(Path(violation.file_path).parent)
                 summary[path_key] = summary.get(path_key, 0) + 1
@@ -246,7 +255,7 @@ class CheckResults:
     def get_summary_by_recommendation(self) -> Dict[str, int]:
         """Get count of violations by recommendation category."""
         summary = {}
-        for violation in self.get_all_violations():
+        for violation in self.iter_violations():
             if violation.recommendation:
                 rec_category = self._categorize_recommendation(violation.recommendation)
                 summary[rec_category] = summary.get(rec_category, 0) + 1
@@ -256,7 +265,7 @@ class CheckResults:
         """Get the most common exact recommendations."""
         exact_summary = {}
         
-        for violation in self.get_all_violations():
+        for violation in self.iter_violations():
             if violation.recommendation:
                 exact_summary[violation.recommendation] = exact_summary.get(violation.recommendation, 0) + 1
         
@@ -286,7 +295,6 @@ class CheckResults:
     
     def to_dict(self) -> Dict:
         """Convert results to dictionary for JSON serialization."""
-        all_violations = self.get_all_violations()
         return {
             "timestamp": None,  # Will be set by reporter
             "target_path": self.target_path,
@@ -299,5 +307,5 @@ class CheckResults:
                 "by_path": self.get_summary_by_path(),
                 "by_recommendation": self.get_summary_by_recommendation()
             },
-            "violations": [violation.to_dict() for violation in all_violations]
+            "violations": [violation.to_dict() for violation in self.iter_violations()]
         }
\ No newline at end of file
@@ -69,7 +69,7 @@ class RuleOf6Reporter:
         """Display top 10 violations for each violation type."""
         # Group violations by type
         by_type: Dict[ViolationType, list] = {}
-        for violation in results.get_all_violations():
+        for violation in results.iter_violations():
             if violation.violation_type not in by_type:
                 by_type[violation.violation_type] = []
             by_type[violation.violation_type].append(violation)
@@ -5,9 +5,10 @@ File and directory scanning utilities for Rule of 6 checking.
 Handles discovery and basic analysis of directories and TypeScript files.
 """
 
+import os
 import re
 from pathlib import Path
-from typing import List, Set, Optional
+from typing import Callable, Iterator, List, Set, Optional
 from models import DirectoryInfo, FileAnalysis, DomainDirectoryInfo
 
 
@@ -17,6 +18,10 @@ class LegacyIgnoreManager:
     def __init__(self, exceptions_file: str = ".rule-of-6-ignore"):
         self.exceptions: Set[str] = set()
         self._load_exceptions(exceptions_file)
+        # One matcher per pattern, built once since every scanned path is checked against all
+        self._matchers: List[Callable[[str], object]] = [
+            self._compile_pattern(pattern) for pattern in self.exceptions
+        ]
     
     def _load_exceptions(self, exceptions_file: str) -> None:
         """Load Rule of 6 exceptions from ignore file."""
@@ -50,22 +55,19 @@ class LegacyIgnoreManager:
     def is_exception(self, path: Path) -> bool:
         """Check if path matches any exception pattern."""
         path_str = str(path)
-        return any(
-            self._matches_pattern(path_str, pattern) 
-            for pattern in self.exceptions
-        )
+        return any(match(path_str) for match in self._matchers)
     
-    def _matches_pattern(self, path_str: str, pattern: str) -> bool:
-        """Check if path matches a glob-like pattern."""
+    def _compile_pattern(self, pattern: str) -> Callable[[str], object]:
+        """Build a matcher for a glob-like pattern; its result is truthy if a path matches."""
         if "**" in pattern:
             # Convert ** pattern to regex
             regex_pattern = pattern.replace("**", ".*").replace("*", "[^/]*")
-            return bool(re.search(regex_pattern, path_str))
+            return re.compile(regex_pattern).search
         elif "*" in pattern:
             regex_pattern = pattern.replace("*", "[^/]*")
-            return bool(re.search(regex_pattern, path_str))
+            return re.compile(regex_pattern).search
         else:
-            return pattern in path_str
+            return pattern.__contains__
 
 
 class DirectoryScanner:
@@ -271,7 +273,8 @@ class FileScanner:
                 path=file_path,
                 line_count=len(lines),
                 function_count=0,  # Will be set by parser
-                functions=[]  # Will be populated by parser
+                functions=[],  # Will be populated by parser
+                content=content
             )
             
         except (UnicodeDecodeError, OSError):
@@ -287,9 +290,15 @@ class FileScanner:
             if target_path.suffix in ['.ts', '.tsx']:
                 ts_files.append(target_path)
         else:
-            # If target is a directory, glob for TypeScript files
-            for pattern in ["**/*.ts", "**/*.tsx"]:
-                ts_files.extend(target_path.glob(pattern))
+            # If target is a directory, walk it once for TypeScript files, listing .ts
+            # files before .tsx ones as the previous per-extension globs did
+            tsx_files = []
+            for entry in self._walk_files(str(target_path)):
+                if entry.name.endswith('.ts'):
+                    ts_files.append(Path(entry.path))
+                elif entry.name.endswith('.tsx'):
+                    tsx_files.append(Path(entry.path))
+            ts_files.extend(tsx_files)
 
         # Filter out exceptions and test files
         filtered_files = []
@@ -297,4 +306,24 @@ class FileScanner:
             if not self.ignore_manager.is_exception(file_path) and not self.is_test_file(file_path):
                 filtered_files.append(file_path)
 
-        return filtered_files
\ No newline at end of file
+        return filtered_files
+    
+    def _walk_files(self, directory: str) -> Iterator[os.DirEntry]:
+        """Yield the files under directory, each directory's files before its subdirectories'.
+        
+        Uses os.scandir, whose entries know their own type, so listing the tree costs
+        no stat per entry. Symlinked directories are not followed, as with Path.glob.
+        """
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
+        subdirectories = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+            elif entry.is_file():
+                yield entry
+        for subdirectory in subdirectories:
+            yield from self._walk_files(subdirectory)
\ No newline at end of file
@@ -5,6 +5,7 @@ Integrates with the shared test infrastructure and provides extensive
 coverage of Rule of 6 violations in various scenarios.
 """
 
+import pickle
 import pytest
 from pathlib import Path
 
@@ -14,6 +15,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from utils.test_helpers import (
     create_test_project,
+    create_cached_test_project,
+    record_analyzed_files,
     run_checker,
     assert_checker_finds_issues,
     assert_no_false_positives
@@ -22,6 +25,11 @@ from ruleof6.checker import RuleOf6Checker
 from ruleof6.models import ViolationType
 
 
+def _violation_messages(results):
+    """Messages of every reported violation, in report order."""
+    return [violation.message for violation in results.iter_violations()]
+
+
 class TestRuleOf6Violations:
     """Test suite for Rule of 6 violation detection."""
 
@@ -515,15 +523,16 @@ export function func{i}_{j}() {{
 
         with create_test_project(files) as project_path:
             try:
-                results = run_checker('ruleof6', project_path / 'src')
+                cache_file = str(project_path / '.ruleof6-cache.pkl')
+                results = run_checker('ruleof6', project_path / 'src', cache_file=cache_file)
 
-                # Should complete without timeout
-                assert isinstance(results.violations, list)
+                # Should find the one file with violations (paths are relative to the target)
+                violation_files = {v.file_path for v in results.iter_violations()}
+                assert 'violations.ts' in violation_files, "Should find the violations file"
 
-                # Should find the one file with violations
-                violation_files = {v.file_path for v in results.violations}
-                violations_file = project_path / 'src' / 'violations.ts'
-                assert violations_file in violation_files, "Should find the violations file"
+                # A rerun reuses the cached per-file analyses and must report the same violations
+                rerun = run_checker('ruleof6', project_path / 'src', cache_file=cache_file)
+                assert _violation_messages(rerun) == _violation_messages(results)
 
             except Exception as e:
                 pytest.fail(f"Rule of 6 checker failed on large codebase: {e}")
@@ -568,4 +577,67 @@ export function listItems() { return []; }
             results = run_checker('ruleof6', project_path / 'src')
 
             # Hexframe patterns should be clean
-            assert len(results.violations) == 0, f"Hexframe patterns should be clean: {[v.message for v in results.violations]}"
\ No newline at end of file
+            assert len(results.violations) == 0, f"Hexframe patterns should be clean: {[v.message for v in results.violations]}"
+
+
+class TestRuleOf6AnalysisCache:
+    """Tests for how the Rule of 6 checker keeps cached analyses of other targets."""
+
+    @staticmethod
+    def _module_files(count):
+        """Source of a module with the given number of functions."""
+        return '\n\n'.join(f"export function func{i}() {{ return {i}; }}" for i in range(count))
+
+    @pytest.fixture
+    def project(self):
+        """Two sibling targets of three files each, and a cache file outside both."""
+        files = {
+            f"src/{target}/module{i}.ts": self._module_files(3 + i * 2)
+            for target in ('first', 'second') for i in range(3)
+        }
+        with create_cached_test_project(files, '.ruleof6-cache.pkl') as (project_path, cache_file):
+            yield project_path / 'src' / 'first', project_path / 'src' / 'second', cache_file
+
+    @staticmethod
+    def _run(target, cache_file, monkeypatch):
+        """Run the checker, returning the names of the files it had to scan and parse."""
+        scanned = record_analyzed_files(monkeypatch, RuleOf6Checker, '_scan_file')
+        RuleOf6Checker(str(target), cache_file=cache_file).run_all_checks()
+        return sorted(Path(file_path).name for file_path in scanned)
+
+    @staticmethod
+    def _cached_paths(cache_file):
+        """Paths with a cache entry, relative to src."""
+        with open(cache_file, 'rb') as f:
+            _, entries = pickle.load(f)
+        return sorted(f"{path.parent.name}/{path.name}" for path in entries)
+
+    def test_entries_of_another_target_are_merged(self, project, monkeypatch):
+        first, second, cache_file = project
+        self._run(first, cache_file, monkeypatch)
+        assert self._run(second, cache_file, monkeypatch) == ['module0.ts', 'module1.ts', 'module2.ts']
+        assert len(self._cached_paths(cache_file)) == 6
+
+        # Checking the second target didn't drop the first target's analyses
+        assert self._run(first, cache_file, monkeypatch) == []
+
+    def test_entries_of_another_target_expire(self, project, monkeypatch):
+        first, second, cache_file = project
+        self._run(first, cache_file, monkeypatch)
+        self._run(second, cache_file, monkeypatch)
+
+        # Entries of the first target are too old once the TTL is zero; the run's own stay
+        monkeypatch.setattr(sys.modules[RuleOf6Checker.__module__], 'CACHE_ENTRY_TTL', 0)
+        self._run(second, cache_file, monkeypatch)
+        assert self._cached_paths(cache_file) == ['second/module0.ts', 'second/module1.ts', 'second/module2.ts']
+
+    def test_entries_of_another_target_are_capped(self, project, monkeypatch):
+        first, second, cache_file = project
+        self._run(first, cache_file, monkeypatch)
+
+        # Room for the run's three files and one other entry
+        monkeypatch.setattr(sys.modules[RuleOf6Checker.__module__], 'MAX_CACHE_ENTRIES', 4)
+        self._run(second, cache_file, monkeypatch)
+        cached = self._cached_paths(cache_file)
+        assert len(cached) == 4
+        assert {'second/module0.ts', 'second/module1.ts', 'second/module2.ts'} < set(cached)
@@ -7,11 +7,13 @@ including import/export parsing, function extraction, and symbol analysis.
 """
 
 from .typescript_parser import TypeScriptParser, Import, Export, Symbol, FunctionInfo
+from .analysis_cache import AnalysisCache
 
 __all__ = [
     "TypeScriptParser",
     "Import", 
     "Export",
     "Symbol",
-    "FunctionInfo"
+    "FunctionInfo",
+    "AnalysisCache"
 ]
\ No newline at end of file
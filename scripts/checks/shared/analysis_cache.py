@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of per-file analyses shared by the checkers.
+
+A file's cached analysis is reused while its mtime and size match, or failing that
+(e.g. after a fresh checkout) while its content digest matches. The cache is a single
+pickle tagged with a version chosen by the checker, so any change to the analysis
+format discards it as a whole.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Cache entry per file: (mtime_ns, size, content digest, analysis without content, *checker fields)
+CacheEntry = Tuple[Any, ...]
+
+# File identity compared before falling back to the content digest: (mtime_ns, size)
+FileStat = Tuple[int, int]
+
+
+def content_digest(content: str) -> bytes:
+    """Digest of decoded file content, used to recognize unchanged files with new mtimes."""
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+
+
+def read_content_digest(file_path: Path) -> Optional[bytes]:
+    """Read a file the way the checkers do and digest it (None if unreadable)."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return content_digest(f.read())
+    except (UnicodeDecodeError, OSError):
+        return None
+
+
+def source_digest(*source_files: str) -> bytes:
+    """Digest of the given source files, for cache versions that follow code changes."""
+    digest = hashlib.blake2b(digest_size=16)
+    for source_file in source_files:
+        digest.update(Path(source_file).read_bytes())
+    return digest.digest()
+
+
+class AnalysisCache:
+    """Versioned pickle of per-file analyses keyed by path."""
+
+    def __init__(self, cache_file: Optional[str] = None):
+        self.cache_file = Path(cache_file) if cache_file else None
+
+    @property
+    def enabled(self) -> bool:
+        return self.cache_file is not None
+
+    def load(self, version: Hashable) -> Dict[Path, CacheEntry]:
+        """Load cached entries, or an empty dict if missing, unreadable or of another version."""
+        if self.cache_file is None or not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'rb') as f:
+                cached_version, entries = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError, ValueError):
+            return {}
+        if cached_version != version:
+            return {}
+        return entries
+
+    def save(self, entries: Dict[Path, CacheEntry], version: Hashable) -> None:
+        """Replace the cache file atomically; a failed write is reported but not raised."""
+        if self.cache_file is None:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+            with open(tmp_file, 'wb') as f:
+                pickle.dump((version, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            print(f"Warning: Could not write analysis cache {self.cache_file}: {e}")
+
+    @staticmethod
+    def stat(file_path: Path) -> Optional[FileStat]:
+        """Current (mtime_ns, size) of a file, or None if it can't be stat'ed."""
+        try:
+            st = file_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def reuse(entry: Optional[CacheEntry], file_path: Path, stat: Optional[FileStat]) -> Optional[CacheEntry]:
+        """The entry to keep for an unchanged file (updated to its stat), or None if it must be re-analyzed."""
+        if entry is None or stat is None:
+            return None
+        if entry[:2] == stat:
+            return entry
+        if entry[1] == stat[1] and read_content_digest(file_path) == entry[2]:
+            return stat + entry[2:]
+        return None
@@ -7,13 +7,23 @@ extracting imports, exports, functions, and other symbols for use by various
 code analysis tools.
 """
 
+import os
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set, Optional, NamedTuple, Tuple
+from typing import Dict, List, Set, Optional, NamedTuple, Tuple
 from dataclasses import dataclass
 
+try:
+    # Optional: C parser for imports/exports (pip install tree-sitter tree-sitter-typescript)
+    import tree_sitter
+    import tree_sitter_typescript
+except ImportError:
+    tree_sitter = None
 
-@dataclass
+
+@dataclass(slots=True)
 class Import:
     """Represents an import statement."""
     name: str
@@ -24,7 +34,7 @@ class Import:
     original_name: Optional[str] = None  # For aliased imports
 
 
-@dataclass 
+@dataclass(slots=True)
 class Export:
     """Represents an export statement."""
     name: str
@@ -36,7 +46,7 @@ class Export:
     original_name: Optional[str] = None  # For aliased exports like "export { foo as bar }"
 
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     """Represents a local symbol (function, variable, etc.)."""
     name: str
@@ -46,7 +56,7 @@ class Symbol:
     is_exported: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionInfo:
     """Represents function information for Rule of 6 checking."""
     name: str
@@ -57,15 +67,445 @@ class FunctionInfo:
     file_path: Path
 
 
+# Comments, template literals and quoted strings, matched in one left-to-right pass.
+# Quoted strings are matched (and kept) so that '//' or a backtick inside one is not
+# mistaken for the start of a comment or template; they never span lines.
+COMMENT_OR_TEMPLATE_PATTERN = re.compile(
+    r'(?P<template>`[^`\\]*(?:\\.[^`\\]*)*`)'
+    r"|(?P<string>'[^'\\\n]*(?:\\.[^'\\\n]*)*'|\"[^\"\\\n]*(?:\\.[^\"\\\n]*)*\")"
+    r'|(?P<line_comment>//[^\n]*)'
+    r'|(?P<block_comment>/\*.*?\*/)',
+    re.DOTALL
+)
+NON_NEWLINE_PATTERN = re.compile(r'[^\n]')
+
+
+def _blank_match(match: re.Match) -> str:
+    """Replace a comment or template literal with spaces, keeping strings and line breaks."""
+    text = match.group()
+    if match.lastgroup == 'string':
+        return text
+    if match.lastgroup == 'line_comment':
+        return ' ' * len(text)
+    return NON_NEWLINE_PATTERN.sub(' ', text)
+
+
+def _blank_comments_and_templates(content: str) -> str:
+    """Blank out comments and template literals so import/export scans skip their text.
+    
+    Line and column positions are preserved. Quoted strings are left intact because
+    module specifiers ('./utils') live in them.
+    """
+    return COMMENT_OR_TEMPLATE_PATTERN.sub(_blank_match, content)
+
+
+# Import statements that may span lines, found in a single pass over the file:
+# import { ... } from '...', import type { ... } from '...', and dynamic import('...').
+# The shared 'import' prefix is factored out so the regex engine can skip ahead to it.
+IMPORT_SCAN_PATTERN = re.compile(
+    r'import(?:'
+    r'(?P<named>\s*\{\s*(?P<named_names>(?:[^{}]|{[^}]*})*?)\s*\}\s*from\s*["\'](?P<named_from>[^"\']+)["\'])'
+    r'|(?P<type>\s+type\s*\{\s*(?P<type_names>(?:[^{}]|{[^}]*})*?)\s*\}\s*from\s*["\'](?P<type_from>[^"\']+)["\'])'
+    r'|(?P<dynamic>\s*\(\s*["\'](?P<dynamic_from>[^"\']+)["\']\s*\))'
+    r')',
+    re.DOTALL
+)
+
+# Export statements that may span lines, found in a single pass over the file:
+# export { ... } [from '...'], export type { ... } [from '...'], and export * from '...'
+EXPORT_SCAN_PATTERN = re.compile(
+    r'export(?:'
+    r'(?P<named>\s*\{\s*(?P<named_names>(?:[^{}]|{[^}]*})*?)\s*\}(?:\s*from\s*["\'](?P<named_from>[^"\']+)["\'])?)'
+    r'|(?P<type>\s+type\s*\{\s*(?P<type_names>(?:[^{}]|{[^}]*})*?)\s*\}(?:\s*from\s*["\'](?P<type_from>[^"\']+)["\'])?)'
+    r'|(?P<wildcard>\s*\*\s*from\s*["\'](?P<wildcard_from>[^"\']+)["\'])'
+    r')',
+    re.DOTALL
+)
+
+
+# Per-line patterns, compiled once at import rather than looked up in re's cache on every call
+DEFAULT_IMPORT_PATTERN = re.compile(r'import\s+(\w+)\s+from\s+["\']([^"\']+)["\']')
+SINGLE_NAMED_IMPORT_PATTERN = re.compile(r'^import\s*\{\s*([^}]+)\s*\}\s*from\s*["\']([^"\']+)["\']$')
+SINGLE_TYPE_IMPORT_PATTERN = re.compile(r'^import\s+type\s*\{\s*([^}]+)\s*\}\s*from\s*["\']([^"\']+)["\']$')
+NAMESPACE_IMPORT_PATTERN = re.compile(r'import\s*\*\s*as\s+(\w+)\s+from\s+["\']([^"\']+)["\']')
+IMPORT_PATH_PATTERN = re.compile(r'from\s+["\']([^"\']+)["\']')
+DYNAMIC_IMPORT_PATTERN = re.compile(r'import\s*\(\s*["\']([^"\']+)["\']')
+
+DIRECT_EXPORT_PATTERN = re.compile(r'export\s+(const|function|class|interface|type)\s+(\w+)')
+SINGLE_NAMED_EXPORT_PATTERN = re.compile(r'^export\s*\{\s*([^}]+)\s*\}(?:\s*from\s*["\']([^"\']+)["\'])?$')
+SINGLE_TYPE_EXPORT_PATTERN = re.compile(r'^export\s+type\s*\{\s*([^}]+)\s*\}(?:\s*from\s*["\']([^"\']+)["\'])?$')
+DEFAULT_EXPORT_PATTERN = re.compile(r'export\s+default\b')
+DEFAULT_EXPORT_NAME_PATTERN = re.compile(r'export\s+default\s+(function\s+)?(\w+)')
+
+FUNCTION_SYMBOL_PATTERN = re.compile(r'(?:export\s+)?(?:async\s+)?function\s+(\w+)')
+ARROW_SYMBOL_PATTERN = re.compile(r'(?:export\s+)?const\s+(\w+)\s*=\s*(?:async\s+)?\(.*\)\s*=>')
+VARIABLE_SYMBOL_PATTERN = re.compile(r'(?:export\s+)?(const|let|var)\s+(\w+)')
+CLASS_SYMBOL_PATTERN = re.compile(r'(?:export\s+)?class\s+(\w+)')
+INTERFACE_SYMBOL_PATTERN = re.compile(r'(?:export\s+)?interface\s+(\w+)')
+TYPE_SYMBOL_PATTERN = re.compile(r'(?:export\s+)?type\s+(\w+)')
+CLASS_IMPLEMENTS_PATTERN = re.compile(r'(?:export\s+)?class\s+(\w+).*?\bimplements\s+([^{]+)')
+GENERIC_ARGUMENTS_PATTERN = re.compile(r'<.*>')
+
+# Symbol usage: identifiers, <Component>, .member, Object., schema.table
+IDENTIFIER_PATTERN = re.compile(r'\b[a-zA-Z_$][a-zA-Z0-9_$]*\b')
+JSX_COMPONENT_PATTERN = re.compile(r'<\s*([A-Z][a-zA-Z0-9_]*)')
+MEMBER_ACCESS_PATTERN = re.compile(r'\.([a-zA-Z_$][a-zA-Z0-9_$]*)')
+OBJECT_MEMBER_PATTERN = re.compile(r'([A-Z][a-zA-Z0-9_$]*)\.')
+SCHEMA_REFERENCE_PATTERN = re.compile(r'schema\.([a-zA-Z_$][a-zA-Z0-9_$]*)')
+
+# Keywords and common tokens that never count as symbol usage
+USAGE_KEYWORDS = frozenset({
+    'import', 'export', 'from', 'const', 'let', 'var', 'function', 'class',
+    'interface', 'type', 'if', 'else', 'for', 'while', 'return', 'true',
+    'false', 'null', 'undefined', 'string', 'number', 'boolean', 'object',
+    'async', 'await', 'new', 'this', 'super', 'extends', 'implements',
+    'default', 'case', 'switch', 'try', 'catch', 'finally', 'throw'
+})
+
+# Function declaration sources, matched per line and (multiline) across whole files
+FUNCTION_DECLARATION_SOURCES = (
+    # Function declarations: export function name() or function name()
+    r'^\s*(?:export\s+)?(?:async\s+)?function\s+(\w+)\s*\(',
+    # Arrow functions: const name = () => or export const name = () =>
+    r'^\s*(?:export\s+)?const\s+(\w+)\s*=\s*(?:async\s*)?\(',
+    # Object method arrow functions: methodName: () => (at start of line or after {)
+    r'^\s*(\w+)\s*:\s*(?:async\s*)?\(',
+    # Class methods: public/private/static methodName()
+    r'^\s*(?:public\s+|private\s+|protected\s+)?(?:static\s+)?(?:async\s+)?(\w+)\s*\(',
+)
+FUNCTION_DECLARATION_PATTERNS = [re.compile(source) for source in FUNCTION_DECLARATION_SOURCES]
+MULTILINE_FUNCTION_DECLARATION_PATTERNS = [re.compile(source, re.MULTILINE) for source in FUNCTION_DECLARATION_SOURCES]
+
+# Lines that are obviously function calls rather than declarations
+FUNCTION_CALL_PATTERNS = [re.compile(source) for source in (
+    # Lines that end with semicolon and parenthesis (function calls)
+    r'\w+\([^)]*\);?\s*$',
+    # Lines with object method calls (dot notation)
+    r'\w+\.\w+\(',
+    # Lines that start with 'this.' (method calls)
+    r'^\s*this\.\w+\(',
+    # Hook calls (useEffect, useState, etc.)
+    r'^\s*use\w+\(',
+    # Common function calls
+    r'^\s*(?:console|setTimeout|setInterval|addEventListener|dispatch|eventBus)\(',
+    # Lines with complex call chains
+    r'\w+\([^)]*\)\s*\.',
+)]
+
+# Argument cleanup: object type annotations, simple type annotations, default values
+OBJECT_TYPE_ANNOTATION_PATTERN = re.compile(r':\s*\{[^}]*\}')
+TYPE_ANNOTATION_PATTERN = re.compile(r':\s*[^=,{}]+')
+DEFAULT_VALUE_PATTERN = re.compile(r'=.*$')
+
+# Destructured object parameters: ({ key1, key2 }: { ... } = { ... })
+DESTRUCTURED_OBJECT_PATTERN = re.compile(r'\{\s*([^}]+)\s*\}[^=]*(?::\s*\{[^}]*\})?(?:\s*=\s*\{[^}]*\})?')
+
+
+# Distinct (content, path) pairs whose imports and exports each parser instance remembers.
+# Kept small because every entry holds a file's content alive; a run parses each file once,
+# so only repeat parses close together benefit. Long-lived parsers (tests) can ask for more.
+PARSE_CACHE_SIZE = 32
+
+# Set to "tree-sitter" to extract imports/exports with tree-sitter (when installed) instead of regexes
+PARSER_BACKEND_ENV = "CHECKS_TS_PARSER"
+
+# Top-level import/export statements and dynamic import() calls anywhere in the file
+TREE_SITTER_QUERY = """
+(program (import_statement) @import)
+(program (export_statement) @export)
+(call_expression function: (import)) @dynamic
+"""
+
+# Export types for declarations that follow 'export'
+DECLARATION_EXPORT_TYPES = {
+    'function_declaration': 'function',
+    'generator_function_declaration': 'function',
+    'function_signature': 'function',
+    'class_declaration': 'class',
+    'abstract_class_declaration': 'class',
+    'interface_declaration': 'interface',
+    'type_alias_declaration': 'type',
+    'enum_declaration': 'enum',
+}
+
+# Files parsed with the plain TypeScript grammar; everything else may contain JSX
+PLAIN_TYPESCRIPT_SUFFIXES = ('.ts', '.mts', '.cts')
+
+
+def _intern_names(records: list) -> list:
+    """Intern names and module paths of parsed records.
+    
+    The same identifiers recur across importers, exporters and references; interned
+    strings share one object, so symbol keys compare by identity in dicts and sets.
+    """
+    intern = sys.intern
+    for record in records:
+        record.name = intern(record.name)
+        from_path = getattr(record, 'from_path', None)
+        if from_path is not None:
+            record.from_path = intern(from_path)
+        original_name = getattr(record, 'original_name', None)
+        if original_name is not None:
+            record.original_name = intern(original_name)
+    return records
+
+
+def _string_value(node) -> str:
+    """Text of a string literal node without its quotes."""
+    return node.text.decode('utf-8')[1:-1]
+
+
+def _node_name(node) -> str:
+    return node.text.decode('utf-8')
+
+
+def _has_child(node, child_type: str) -> bool:
+    """Whether a node has a direct (anonymous or named) child of the given type."""
+    return any(child.type == child_type for child in node.children)
+
+
+class _TreeSitterExtractor:
+    """Extracts imports and exports from a tree-sitter syntax tree.
+    
+    Produces the same Import/Export records as the regex extraction, but from a real
+    parse, so text in comments, strings and template literals is never mistaken for code.
+    """
+    
+    def __init__(self):
+        self._languages = {
+            'typescript': tree_sitter.Language(tree_sitter_typescript.language_typescript()),
+            'tsx': tree_sitter.Language(tree_sitter_typescript.language_tsx()),
+        }
+        self._parsers = {name: tree_sitter.Parser(language) for name, language in self._languages.items()}
+        self._queries = {name: self._compile_query(language) for name, language in self._languages.items()}
+        # Captures of the last parsed source, as (content, grammar, captures)
+        self._last_captures: Tuple[Optional[str], str, Dict[str, list]] = (None, '', {})
+    
+    @staticmethod
+    def _compile_query(language):
+        """Compile the import/export query; py-tree-sitter 0.22 only offers Language.query()."""
+        if hasattr(tree_sitter, 'Query'):
+            try:
+                return tree_sitter.Query(language, TREE_SITTER_QUERY)
+            except TypeError:
+                pass
+        return language.query(TREE_SITTER_QUERY)
+    
+    @staticmethod
+    def _group_captures(captures) -> Dict[str, list]:
+        """Captures by name; py-tree-sitter 0.22 returns (node, name) pairs instead of a dict."""
+        if isinstance(captures, dict):
+            return captures
+        grouped: Dict[str, list] = {}
+        for node, name in captures:
+            grouped.setdefault(name, []).append(node)
+        return grouped
+    
+    def _captures(self, content: str, file_path: Path) -> Dict[str, list]:
+        """Parse the content and return query captures, reusing them for the same content object."""
+        grammar = 'typescript' if file_path.suffix in PLAIN_TYPESCRIPT_SUFFIXES else 'tsx'
+        source, last_grammar, captures = self._last_captures
+        if source is content and last_grammar == grammar:
+            return captures
+        
+        tree = self._parsers[grammar].parse(content.encode('utf-8'))
+        query = self._queries[grammar]
+        if hasattr(tree_sitter, 'QueryCursor'):
+            captures = tree_sitter.QueryCursor(query).captures(tree.root_node)
+        else:
+            captures = query.captures(tree.root_node)
+        captures = self._group_captures(captures)
+        self._last_captures = (content, grammar, captures)
+        return captures
+    
+    def extract_imports(self, content: str, file_path: Path) -> List[Import]:
+        captures = self._captures(content, file_path)
+        imports = []
+        
+        for statement in sorted(captures.get('import', []), key=lambda node: node.start_byte):
+            source = statement.child_by_field_name('source')
+            clause = next((child for child in statement.children if child.type == 'import_clause'), None)
+            if source is None or clause is None:
+                continue  # Side-effect import: import './styles'
+            
+            from_path = _string_value(source)
+            line_number = statement.start_point[0] + 1
+            is_type_import = _has_child(statement, 'type')
+            
+            for part in clause.named_children:
+                if part.type == 'identifier':
+                    # Default import: import foo from 'bar'
+                    imports.append(Import(
+                        name=_node_name(part),
+                        from_path=from_path,
+                        file_path=file_path,
+                        line_number=line_number,
+                        import_type='type' if is_type_import else 'default'
+                    ))
+                elif part.type == 'namespace_import':
+                    # Namespace import: import * as foo from 'bar'
+                    imports.append(Import(
+                        name=_node_name(part.named_children[0]),
+                        from_path=from_path,
+                        file_path=file_path,
+                        line_number=line_number,
+                        import_type='namespace'
+                    ))
+                elif part.type == 'named_imports':
+                    # Named imports: import { foo, bar as baz, type Qux } from '...'
+                    for specifier in part.named_children:
+                        if specifier.type != 'import_specifier':
+                            continue
+                        name = _node_name(specifier.child_by_field_name('name'))
+                        alias = specifier.child_by_field_name('alias')
+                        imports.append(Import(
+                            name=_node_name(alias) if alias is not None else name,
+                            from_path=from_path,
+                            file_path=file_path,
+                            line_number=line_number,
+                            import_type='type' if is_type_import or _has_child(specifier, 'type') else 'named',
+                            original_name=name if alias is not None else None
+                        ))
+        
+        # Dynamic imports: import('path') and await import('path')
+        for call in sorted(captures.get('dynamic', []), key=lambda node: node.start_byte):
+            arguments = call.child_by_field_name('arguments')
+            first_argument = arguments.named_children[0] if arguments is not None and arguments.named_children else None
+            if first_argument is None or first_argument.type != 'string':
+                continue  # Computed specifier, e.g. import(`./${name}`)
+            imports.append(Import(
+                name='*',  # Dynamic imports import the whole module
+                from_path=_string_value(first_argument),
+                file_path=file_path,
+                line_number=call.start_point[0] + 1,
+                import_type='dynamic'
+            ))
+        
+        return imports
+    
+    def extract_exports(self, content: str, file_path: Path) -> List[Export]:
+        captures = self._captures(content, file_path)
+        exports = []
+        
+        for statement in sorted(captures.get('export', []), key=lambda node: node.start_byte):
+            source = statement.child_by_field_name('source')
+            from_path = _string_value(source) if source is not None else None
+            line_number = statement.start_point[0] + 1
+            declaration = statement.child_by_field_name('declaration')
+            
+            if _has_child(statement, 'default'):
+                # Default export: name of the declaration or identifier, if any
+                named = declaration.child_by_field_name('name') if declaration is not None else statement.child_by_field_name('value')
+                name = _node_name(named) if named is not None and named.type in ('identifier', 'type_identifier') else 'default'
+                exports.append(Export(
+                    name=name,
+                    file_path=file_path,
+                    line_number=line_number,
+                    export_type='default',
+                    from_path=None
+                ))
+                continue
+            
+            if _has_child(statement, '*'):
+                # Wildcard exports: export * from '...'
+                exports.append(Export(
+                    name='*',  # Special marker for wildcard exports
+                    file_path=file_path,
+                    line_number=line_number,
+                    export_type='wildcard',
+                    is_reexport=True,
+                    from_path=from_path
+                ))
+                continue
+            
+            is_type_export = _has_child(statement, 'type')
+            for part in statement.named_children:
+                if part.type == 'export_clause':
+                    # Named exports: export { foo, bar as baz } [from '...']
+                    for specifier in part.named_children:
+                        if specifier.type != 'export_specifier':
+                            continue
+                        name = _node_name(specifier.child_by_field_name('name'))
+                        alias = specifier.child_by_field_name('alias')
+                        exports.append(Export(
+                            name=_node_name(alias) if alias is not None else name,
+                            file_path=file_path,
+                            line_number=line_number,
+                            export_type='type' if is_type_export or _has_child(specifier, 'type') else 'named',
+                            is_reexport=from_path is not None,
+                            from_path=from_path,
+                            original_name=name if alias is not None else None
+                        ))
+                elif part.type == 'namespace_export':
+                    # Namespace re-export: export * as foo from '...'
+                    exports.append(Export(
+                        name=_node_name(part.named_children[0]),
+                        file_path=file_path,
+                        line_number=line_number,
+                        export_type='named',
+                        is_reexport=True,
+                        from_path=from_path
+                    ))
+            
+            # Direct exports: export const/function/class/interface/type/enum
+            if declaration is not None and declaration.type == 'ambient_declaration':
+                declaration = declaration.named_children[0] if declaration.named_children else None
+            if declaration is None:
+                continue
+            if declaration.type in ('lexical_declaration', 'variable_declaration'):
+                kind = declaration.children[0].type  # const, let or var
+                for declarator in declaration.named_children:
+                    name = declarator.child_by_field_name('name') if declarator.type == 'variable_declarator' else None
+                    if name is not None and name.type == 'identifier':
+                        exports.append(Export(
+                            name=_node_name(name),
+                            file_path=file_path,
+                            line_number=line_number,
+                            export_type=kind,
+                            from_path=None
+                        ))
+            elif declaration.type in DECLARATION_EXPORT_TYPES:
+                name = declaration.child_by_field_name('name')
+                if name is not None:
+                    exports.append(Export(
+                        name=_node_name(name),
+                        file_path=file_path,
+                        line_number=line_number,
+                        export_type=DECLARATION_EXPORT_TYPES[declaration.type],
+                        from_path=None
+                    ))
+        
+        return exports
+
+
+def _create_tree_sitter_extractor() -> Optional[_TreeSitterExtractor]:
+    """Tree-sitter extractor, or None when tree-sitter is missing or its API predates 0.22."""
+    if tree_sitter is None:
+        return None
+    try:
+        return _TreeSitterExtractor()
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
 class TypeScriptParser:
     """
     Comprehensive TypeScript/JavaScript parser for code analysis.
     
     Extracts imports, exports, functions, and symbols from TypeScript files
     with proper handling of multi-line statements and various syntax patterns.
+    
+    Imports and exports come from regexes unless use_tree_sitter is True or
+    CHECKS_TS_PARSER=tree-sitter, and a supported tree-sitter (0.22 or later)
+    is installed; otherwise the regex extraction is used.
     """
     
-    def __init__(self):
+    def __init__(self, use_tree_sitter: Optional[bool] = None, parse_cache_size: int = PARSE_CACHE_SIZE):
+        if use_tree_sitter is None:
+            use_tree_sitter = os.environ.get(PARSER_BACKEND_ENV, '').lower() == 'tree-sitter'
+        self._tree_sitter = _create_tree_sitter_extractor() if use_tree_sitter else None
+        self.backend = 'tree-sitter' if self._tree_sitter is not None else 'regex'
+        
         # Keywords to exclude from function detection
         self.excluded_keywords = {
             'if', 'else', 'for', 'while', 'switch', 'case', 'default', 'try', 'catch', 
@@ -74,31 +514,74 @@ class TypeScriptParser:
         }
         
         # Function declaration patterns - more precise to avoid false positives
-        self.function_patterns = [
-            # Function declarations: export function name() or function name()
-            r'^\s*(?:export\s+)?(?:async\s+)?function\s+(\w+)\s*\(',
-            # Arrow functions: const name = () => or export const name = () =>
-            r'^\s*(?:export\s+)?const\s+(\w+)\s*=\s*(?:async\s*)?\(',
-            # Object method arrow functions: methodName: () => (at start of line or after {)
-            r'^\s*(\w+)\s*:\s*(?:async\s*)?\(',
-            # Class methods: public/private/static methodName()
-            r'^\s*(?:public\s+|private\s+|protected\s+)?(?:static\s+)?(?:async\s+)?(\w+)\s*\(',
-        ]
+        self.function_patterns = FUNCTION_DECLARATION_PATTERNS
+        
+        # Last source blanked for import/export scanning, as (content, blanked content)
+        self._last_blanked: Tuple[Optional[str], str] = (None, '')
+        
+        # Imports/exports per (content, path), so identical sources are parsed once
+        self._cached_imports = lru_cache(maxsize=parse_cache_size)(self._extract_imports)
+        self._cached_exports = lru_cache(maxsize=parse_cache_size)(self._extract_exports)
+
+    def cache_clear(self) -> None:
+        """Forget memoized imports/exports, for callers that want a fresh parse."""
+        self._cached_imports.cache_clear()
+        self._cached_exports.cache_clear()
+        self._last_blanked = (None, '')
+
+    def _blank_comments_and_templates(self, content: str) -> str:
+        """Blank comments and template literals, reusing the result for the same content object."""
+        source, blanked = self._last_blanked
+        if source is not content:
+            blanked = _blank_comments_and_templates(content)
+            self._last_blanked = (content, blanked)
+        return blanked
 
     def extract_imports(self, content: str, file_path: Path) -> List[Import]:
         """Extract import statements from file content with multi-line support."""
+        try:
+            return list(self._cached_imports(content, file_path))
+        except TypeError:  # Unhashable arguments: parse without the cache
+            return self._extract_imports(content, file_path)
+
+    def _extract_imports(self, content: str, file_path: Path) -> List[Import]:
+        if self._tree_sitter is not None:
+            return _intern_names(self._tree_sitter.extract_imports(content, file_path))
+        
+        content = self._blank_comments_and_templates(content)
         imports = []
+        type_imports = []
+        dynamic_imports = []
         
-        # First handle multi-line imports using regex on full content
-        # Multi-line named imports: import { ... }
-        multi_import_pattern = r'import\s*\{\s*((?:[^{}]|{[^}]*})*?)\s*\}\s*from\s*["\']([^"\']+)["\']'
-        for match in re.finditer(multi_import_pattern, content, re.MULTILINE | re.DOTALL):
-            imports_str = match.group(1)
-            from_path = match.group(2)
+        # First handle multi-line and dynamic imports with one scan over the full content
+        line_number = 1
+        last_position = 0
+        for match in IMPORT_SCAN_PATTERN.finditer(content):
+            # Find line number of the import statement, counting on from the previous match
+            line_number += content.count('\n', last_position, match.start())
+            last_position = match.start()
+            kind = match.lastgroup
+            
+            # Handle dynamic imports: import('path') and await import('path')
+            # These are common in modern TypeScript for lazy loading
+            if kind == 'dynamic':
+                # For dynamic imports, we'll mark it as a namespace import since
+                # the entire module is being imported dynamically
+                dynamic_imports.append(Import(
+                    name='*',  # Dynamic imports import the whole module
+                    from_path=match.group('dynamic_from'),
+                    file_path=file_path,
+                    line_number=line_number,
+                    import_type='dynamic'
+                ))
+                continue
             
-            # Find line number of the import statement
-            content_before = content[:match.start()]
-            line_number = content_before.count('\n') + 1
+            # Multi-line named imports: import { ... }
+            # Multi-line type imports: import type { ... }
+            is_type_import = kind == 'type'
+            imports_str = match.group('type_names' if is_type_import else 'named_names')
+            from_path = match.group('type_from' if is_type_import else 'named_from')
+            target = type_imports if is_type_import else imports
             
             # Parse individual imports
             for import_name in imports_str.split(','):
@@ -107,8 +590,8 @@ class TypeScriptParser:
                     continue
 
                 # Handle inline type imports: type Foo
-                import_type = 'named'
-                if import_name.startswith('type '):
+                import_type = 'type' if is_type_import else 'named'
+                if not is_type_import and import_name.startswith('type '):
                     import_type = 'type'
                     import_name = import_name[5:].strip()  # Remove 'type ' prefix
 
@@ -118,7 +601,7 @@ class TypeScriptParser:
                 if has_alias:
                     import_name = import_name.split(' as ')[-1].strip()
 
-                imports.append(Import(
+                target.append(Import(
                     name=import_name,
                     from_path=from_path,
                     file_path=file_path,
@@ -127,34 +610,8 @@ class TypeScriptParser:
                     original_name=original_name
                 ))
         
-        # Multi-line type imports: import type { ... }
-        multi_type_pattern = r'import\s+type\s*\{\s*((?:[^{}]|{[^}]*})*?)\s*\}\s*from\s*["\']([^"\']+)["\']'
-        for match in re.finditer(multi_type_pattern, content, re.MULTILINE | re.DOTALL):
-            imports_str = match.group(1)
-            from_path = match.group(2)
-            
-            # Find line number
-            content_before = content[:match.start()]
-            line_number = content_before.count('\n') + 1
-            
-            for import_name in imports_str.split(','):
-                import_name = import_name.strip()
-                if not import_name:
-                    continue
-                    
-                has_alias = ' as ' in import_name
-                original_name = import_name.split(' as ')[0].strip() if has_alias else None
-                if has_alias:
-                    import_name = import_name.split(' as ')[-1].strip()
-
-                imports.append(Import(
-                    name=import_name,
-                    from_path=from_path,
-                    file_path=file_path,
-                    line_number=line_number,
-                    import_type='type',
-                    original_name=original_name
-                ))
+        # Keep the original ordering: named imports, then type imports
+        imports.extend(type_imports)
         
         # Now process line by line for other import patterns
         lines = content.split('\n')
@@ -176,7 +633,7 @@ class TypeScriptParser:
                     continue
             
             # Default import: import foo from 'bar'
-            default_match = re.match(r'import\s+(\w+)\s+from\s+["\']([^"\']+)["\']', line)
+            default_match = DEFAULT_IMPORT_PATTERN.match(line)
             if default_match and '{' not in line:
                 name = default_match.group(1)
                 from_path = default_match.group(2)
@@ -191,7 +648,7 @@ class TypeScriptParser:
                 continue
             
             # Single-line named imports: import { foo, bar } from 'baz' on one line
-            single_named_match = re.match(r'^import\s*\{\s*([^}]+)\s*\}\s*from\s*["\']([^"\']+)["\']$', line)
+            single_named_match = SINGLE_NAMED_IMPORT_PATTERN.match(line)
             if single_named_match:
                 imports_str = single_named_match.group(1)
                 from_path = single_named_match.group(2)
@@ -224,7 +681,7 @@ class TypeScriptParser:
                 continue
             
             # Single-line type imports: import type { ... } from '...' on one line
-            single_type_match = re.match(r'^import\s+type\s*\{\s*([^}]+)\s*\}\s*from\s*["\']([^"\']+)["\']$', line)
+            single_type_match = SINGLE_TYPE_IMPORT_PATTERN.match(line)
             if single_type_match:
                 imports_str = single_type_match.group(1)
                 from_path = single_type_match.group(2)
@@ -250,7 +707,7 @@ class TypeScriptParser:
                 continue
             
             # Namespace import: import * as foo from 'bar'
-            namespace_match = re.match(r'import\s*\*\s*as\s+(\w+)\s+from\s+["\']([^"\']+)["\']', line)
+            namespace_match = NAMESPACE_IMPORT_PATTERN.match(line)
             if namespace_match:
                 name = namespace_match.group(1)
                 from_path = namespace_match.group(2)
@@ -263,114 +720,81 @@ class TypeScriptParser:
                     import_type='namespace'
                 ))
 
-        # Handle dynamic imports: import('path') and await import('path')
-        # These are common in modern TypeScript for lazy loading
-        dynamic_import_pattern = r'(?:await\s+)?import\s*\(\s*["\']([^"\']+)["\']\s*\)'
-        for match in re.finditer(dynamic_import_pattern, content, re.MULTILINE):
-            from_path = match.group(1)
+        # Dynamic imports come last
+        imports.extend(dynamic_imports)
 
-            # Find line number
-            content_before = content[:match.start()]
-            line_number = content_before.count('\n') + 1
-
-            # For dynamic imports, we'll mark it as a namespace import since
-            # the entire module is being imported dynamically
-            imports.append(Import(
-                name='*',  # Dynamic imports import the whole module
-                from_path=from_path,
-                file_path=file_path,
-                line_number=line_number,
-                import_type='dynamic'
-            ))
-
-        return imports
+        return _intern_names(imports)
 
     def extract_exports(self, content: str, file_path: Path) -> List[Export]:
         """Extract export statements from file content with multi-line support."""
+        try:
+            return list(self._cached_exports(content, file_path))
+        except TypeError:  # Unhashable arguments: parse without the cache
+            return self._extract_exports(content, file_path)
+
+    def _extract_exports(self, content: str, file_path: Path) -> List[Export]:
+        if self._tree_sitter is not None:
+            return _intern_names(self._tree_sitter.extract_exports(content, file_path))
+        
+        content = self._blank_comments_and_templates(content)
         exports = []
+        type_exports = []
+        wildcard_exports = []
         
-        # First handle multi-line exports using regex on full content
-        # Multi-line named exports: export { ... }
-        multi_export_pattern = r'export\s*\{\s*((?:[^{}]|{[^}]*})*?)\s*\}(?:\s*from\s*["\']([^"\']+)["\'])?'
-        for match in re.finditer(multi_export_pattern, content, re.MULTILINE | re.DOTALL):
-            exports_str = match.group(1)
-            from_path = match.group(2)
-            is_reexport = from_path is not None
-            
-            # Find line number of the export statement
-            content_before = content[:match.start()]
-            line_number = content_before.count('\n') + 1
+        # First handle multi-line and wildcard exports with one scan over the full content
+        line_number = 1
+        last_position = 0
+        for match in EXPORT_SCAN_PATTERN.finditer(content):
+            # Find line number of the export statement, counting on from the previous match
+            line_number += content.count('\n', last_position, match.start())
+            last_position = match.start()
+            kind = match.lastgroup
             
-            # Parse individual exports
-            for export_name in exports_str.split(','):
-                export_name = export_name.strip()
-                if not export_name:
-                    continue
-                    
-                # Handle 'as' aliases: foo as bar
-                original_name = None
-                if ' as ' in export_name:
-                    original_name = export_name.split(' as ')[0].strip()
-                    export_name = export_name.split(' as ')[-1].strip()
-                
-                exports.append(Export(
-                    name=export_name,
+            # Wildcard exports: export * from '...'
+            if kind == 'wildcard':
+                wildcard_exports.append(Export(
+                    name='*',  # Special marker for wildcard exports
                     file_path=file_path,
                     line_number=line_number,
-                    export_type='named',
-                    is_reexport=is_reexport,
-                    from_path=from_path,
-                    original_name=original_name
+                    export_type='wildcard',
+                    is_reexport=True,
+                    from_path=match.group('wildcard_from')
                 ))
-        
-        # Multi-line type exports: export type { ... }
-        multi_type_pattern = r'export\s+type\s*\{\s*((?:[^{}]|{[^}]*})*?)\s*\}(?:\s*from\s*["\']([^"\']+)["\'])?'
-        for match in re.finditer(multi_type_pattern, content, re.MULTILINE | re.DOTALL):
-            exports_str = match.group(1)
-            from_path = match.group(2)
-            is_reexport = from_path is not None
+                continue
             
-            # Find line number
-            content_before = content[:match.start()]
-            line_number = content_before.count('\n') + 1
+            # Multi-line named exports: export { ... }
+            # Multi-line type exports: export type { ... }
+            is_type_export = kind == 'type'
+            exports_str = match.group('type_names' if is_type_export else 'named_names')
+            from_path = match.group('type_from' if is_type_export else 'named_from')
+            is_reexport = from_path is not None
+            target = type_exports if is_type_export else exports
             
+            # Parse individual exports
             for export_name in exports_str.split(','):
                 export_name = export_name.strip()
                 if not export_name:
                     continue
                     
+                # Handle 'as' aliases: foo as bar
                 original_name = None
                 if ' as ' in export_name:
                     original_name = export_name.split(' as ')[0].strip()
                     export_name = export_name.split(' as ')[-1].strip()
                 
-                exports.append(Export(
+                target.append(Export(
                     name=export_name,
                     file_path=file_path,
                     line_number=line_number,
-                    export_type='type',
+                    export_type='type' if is_type_export else 'named',
                     is_reexport=is_reexport,
                     from_path=from_path,
                     original_name=original_name
                 ))
         
-        # Wildcard exports: export * from '...'
-        wildcard_pattern = r'export\s*\*\s*from\s*["\']([^"\']+)["\']'
-        for match in re.finditer(wildcard_pattern, content, re.MULTILINE):
-            from_path = match.group(1)
-            
-            # Find line number
-            content_before = content[:match.start()]
-            line_number = content_before.count('\n') + 1
-            
-            exports.append(Export(
-                name='*',  # Special marker for wildcard exports
-                file_path=file_path,
-                line_number=line_number,
-                export_type='wildcard',
-                is_reexport=True,
-                from_path=from_path
-            ))
+        # Keep the original ordering: named, type, then wildcard exports
+        exports.extend(type_exports)
+        exports.extend(wildcard_exports)
         
         # Now process line by line for other export patterns
         lines = content.split('\n')
@@ -386,7 +810,7 @@ class TypeScriptParser:
             # But don't skip direct exports like "export function Toaster() {"
             if 'export' in line and ('{' in line or '}' in line):
                 # Check if this is a direct export pattern
-                is_direct_export = bool(re.match(r'export\s+(const|function|class|interface|type)\s+\w+', line))
+                is_direct_export = bool(DIRECT_EXPORT_PATTERN.match(line))
                 is_single_line_export = line.startswith('export') and line.endswith('}')
                 
                 # Skip only if it's truly part of a multi-line export block
@@ -394,7 +818,7 @@ class TypeScriptParser:
                     continue
             
             # Single-line named exports: export { foo, bar } on one line
-            single_named_match = re.match(r'^export\s*\{\s*([^}]+)\s*\}(?:\s*from\s*["\']([^"\']+)["\'])?$', line)
+            single_named_match = SINGLE_NAMED_EXPORT_PATTERN.match(line)
             if single_named_match:
                 exports_str = single_named_match.group(1)
                 from_path = single_named_match.group(2)
@@ -424,9 +848,9 @@ class TypeScriptParser:
                 continue
             
             # Default export
-            if re.match(r'export\s+default\b', line):
+            if DEFAULT_EXPORT_PATTERN.match(line):
                 # Try to extract name from default export
-                name_match = re.search(r'export\s+default\s+(function\s+)?(\w+)', line)
+                name_match = DEFAULT_EXPORT_NAME_PATTERN.search(line)
                 name = name_match.group(2) if name_match else 'default'
                 
                 exports.append(Export(
@@ -439,7 +863,7 @@ class TypeScriptParser:
                 continue
             
             # Direct exports: export const/function/class/interface/type
-            direct_export_match = re.match(r'export\s+(const|function|class|interface|type)\s+(\w+)', line)
+            direct_export_match = DIRECT_EXPORT_PATTERN.match(line)
             if direct_export_match:
                 export_type = direct_export_match.group(1)
                 name = direct_export_match.group(2)
@@ -454,7 +878,7 @@ class TypeScriptParser:
                 continue
             
             # Single-line type exports: export type { ... } on one line
-            single_type_match = re.match(r'^export\s+type\s*\{\s*([^}]+)\s*\}(?:\s*from\s*["\']([^"\']+)["\'])?$', line)
+            single_type_match = SINGLE_TYPE_EXPORT_PATTERN.match(line)
             if single_type_match:
                 exports_str = single_type_match.group(1)
                 from_path = single_type_match.group(2)
@@ -480,7 +904,7 @@ class TypeScriptParser:
                         original_name=original_name
                     ))
         
-        return exports
+        return _intern_names(exports)
 
     def extract_symbols(self, content: str, file_path: Path) -> List[Symbol]:
         """Extract local symbols (functions, variables, etc.) from file content."""
@@ -495,7 +919,7 @@ class TypeScriptParser:
                 continue
             
             # Function declarations
-            func_match = re.match(r'(?:export\s+)?(?:async\s+)?function\s+(\w+)', line)
+            func_match = FUNCTION_SYMBOL_PATTERN.match(line)
             if func_match:
                 name = func_match.group(1)
                 is_exported = 'export' in line
@@ -510,7 +934,7 @@ class TypeScriptParser:
                 continue
             
             # Arrow function assignments
-            arrow_match = re.match(r'(?:export\s+)?const\s+(\w+)\s*=\s*(?:async\s+)?\(.*\)\s*=>', line)
+            arrow_match = ARROW_SYMBOL_PATTERN.match(line)
             if arrow_match:
                 name = arrow_match.group(1)
                 is_exported = line.startswith('export')
@@ -525,7 +949,7 @@ class TypeScriptParser:
                 continue
             
             # Const/let/var declarations
-            var_match = re.match(r'(?:export\s+)?(const|let|var)\s+(\w+)', line)
+            var_match = VARIABLE_SYMBOL_PATTERN.match(line)
             if var_match:
                 var_type = var_match.group(1)
                 name = var_match.group(2)
@@ -541,7 +965,7 @@ class TypeScriptParser:
                 continue
             
             # Class declarations (including implements clauses)
-            class_match = re.match(r'(?:export\s+)?class\s+(\w+)', line)
+            class_match = CLASS_SYMBOL_PATTERN.match(line)
             if class_match:
                 name = class_match.group(1)
                 is_exported = line.startswith('export')
@@ -556,7 +980,7 @@ class TypeScriptParser:
                 continue
             
             # Interface declarations
-            interface_match = re.match(r'(?:export\s+)?interface\s+(\w+)', line)
+            interface_match = INTERFACE_SYMBOL_PATTERN.match(line)
             if interface_match:
                 name = interface_match.group(1)
                 is_exported = line.startswith('export')
@@ -571,7 +995,7 @@ class TypeScriptParser:
                 continue
             
             # Type declarations
-            type_match = re.match(r'(?:export\s+)?type\s+(\w+)', line)
+            type_match = TYPE_SYMBOL_PATTERN.match(line)
             if type_match:
                 name = type_match.group(1)
                 is_exported = line.startswith('export')
@@ -584,7 +1008,7 @@ class TypeScriptParser:
                     is_exported=is_exported
                 ))
         
-        return symbols
+        return _intern_names(symbols)
 
     def extract_interface_implementations(self, content: str, file_path: Path) -> dict[str, list[str]]:
         """Extract interface implementations (class implements Interface)."""
@@ -599,7 +1023,7 @@ class TypeScriptParser:
                 continue
             
             # Look for class declarations with implements
-            class_implements_match = re.match(r'(?:export\s+)?class\s+(\w+).*?\bimplements\s+([^{]+)', line)
+            class_implements_match = CLASS_IMPLEMENTS_PATTERN.match(line)
             if class_implements_match:
                 class_name = class_implements_match.group(1)
                 implements_str = class_implements_match.group(2).strip()
@@ -609,7 +1033,7 @@ class TypeScriptParser:
                 
                 for interface in interfaces:
                     # Clean up interface name (remove generic parameters)
-                    interface = re.sub(r'<.*>', '', interface).strip()
+                    interface = GENERIC_ARGUMENTS_PATTERN.sub('', interface).strip()
                     if interface:
                         if interface not in implementations:
                             implementations[interface] = []
@@ -636,7 +1060,7 @@ class TypeScriptParser:
                 continue
             
             # Track if we're inside an interface block
-            if re.match(r'(?:export\s+)?interface\s+\w+', line):
+            if INTERFACE_SYMBOL_PATTERN.match(line):
                 in_interface_block = True
                 brace_level = 0
             
@@ -655,7 +1079,7 @@ class TypeScriptParser:
             function_match = None
             matched_pattern_idx = None
             for idx, pattern in enumerate(self.function_patterns):
-                match = re.search(pattern, line)
+                match = pattern.search(line)
                 if match:
                     func_name = match.group(1)
                     # Skip if it's a control flow keyword
@@ -696,30 +1120,29 @@ class TypeScriptParser:
 
     def extract_import_paths(self, content: str) -> List[str]:
         """Simple extraction of import paths only (for architecture checker)."""
-        import_pattern = r'from\s+["\']([^"\']+)["\']'
-        return re.findall(import_pattern, content)
+        return IMPORT_PATH_PATTERN.findall(content)
 
     def find_symbol_usage(self, content: str) -> Set[str]:
         """Find all symbol usage in file content with enhanced detection."""
         used_symbols = set()
 
         # Find all identifiers (basic approach)
-        identifiers = re.findall(r'\b[a-zA-Z_$][a-zA-Z0-9_$]*\b', content)
+        identifiers = IDENTIFIER_PATTERN.findall(content)
 
         # JSX component usage: <ComponentName> or <ComponentName />
-        jsx_components = re.findall(r'<\s*([A-Z][a-zA-Z0-9_]*)', content)
+        jsx_components = JSX_COMPONENT_PATTERN.findall(content)
 
         # Method/property access: obj.method(), obj.property
-        method_calls = re.findall(r'\.([a-zA-Z_$][a-zA-Z0-9_$]*)', content)
+        method_calls = MEMBER_ACCESS_PATTERN.findall(content)
 
         # Object method chains: ObjectName.method()
-        object_methods = re.findall(r'([A-Z][a-zA-Z0-9_$]*)\.', content)
+        object_methods = OBJECT_MEMBER_PATTERN.findall(content)
 
         # Dynamic imports: import("./file") or await import("./file")
-        dynamic_imports = re.findall(r'import\s*\(\s*["\']([^"\']+)["\']', content)
+        dynamic_imports = DYNAMIC_IMPORT_PATTERN.findall(content)
 
         # Schema/config object property references: schema.tableName
-        schema_refs = re.findall(r'schema\.([a-zA-Z_$][a-zA-Z0-9_$]*)', content)
+        schema_refs = SCHEMA_REFERENCE_PATTERN.findall(content)
 
         # Combine all symbol usage
         all_symbols = set(identifiers + jsx_components + method_calls + object_methods + schema_refs)
@@ -729,18 +1152,8 @@ class TypeScriptParser:
             # This will be handled separately in import resolution
             pass
 
-        # Filter out keywords and common tokens
-        keywords = {
-            'import', 'export', 'from', 'const', 'let', 'var', 'function', 'class',
-            'interface', 'type', 'if', 'else', 'for', 'while', 'return', 'true',
-            'false', 'null', 'undefined', 'string', 'number', 'boolean', 'object',
-            'async', 'await', 'new', 'this', 'super', 'extends', 'implements',
-            'default', 'case', 'switch', 'try', 'catch', 'finally', 'throw'
-        }
-
-        for identifier in all_symbols:
-            if identifier not in keywords:
-                used_symbols.add(identifier)
+        # Interned, like parsed symbol names, so lookups against them compare by identity
+        used_symbols.update(map(sys.intern, all_symbols - USAGE_KEYWORDS))
 
         return used_symbols
 
@@ -761,9 +1174,9 @@ class TypeScriptParser:
 
             # Remove type annotations and default values
             # Handle complex types like { prop: string }
-            arg = re.sub(r':\s*\{[^}]*\}', '', arg)  # Remove object type annotations
-            arg = re.sub(r':\s*[^=,{}]+', '', arg)   # Remove simple type annotations
-            arg = re.sub(r'=.*$', '', arg)           # Remove default values
+            arg = OBJECT_TYPE_ANNOTATION_PATTERN.sub('', arg)  # Remove object type annotations
+            arg = TYPE_ANNOTATION_PATTERN.sub('', arg)         # Remove simple type annotations
+            arg = DEFAULT_VALUE_PATTERN.sub('', arg)           # Remove default values
             arg = arg.strip()
 
             if arg:
@@ -898,23 +1311,8 @@ class TypeScriptParser:
         Returns True for obvious function calls.
         """
         # Common patterns that indicate function calls
-        function_call_patterns = [
-            # Lines that end with semicolon and parenthesis (function calls)
-            r'\w+\([^)]*\);?\s*$',
-            # Lines with object method calls (dot notation)
-            r'\w+\.\w+\(',
-            # Lines that start with 'this.' (method calls)
-            r'^\s*this\.\w+\(',
-            # Hook calls (useEffect, useState, etc.)
-            r'^\s*use\w+\(',
-            # Common function calls
-            r'^\s*(?:console|setTimeout|setInterval|addEventListener|dispatch|eventBus)\(',
-            # Lines with complex call chains
-            r'\w+\([^)]*\)\s*\.',
-        ]
-
-        for pattern in function_call_patterns:
-            if re.search(pattern, line_stripped):
+        for pattern in FUNCTION_CALL_PATTERNS:
+            if pattern.search(line_stripped):
                 return True
 
         # Check for lines that have nested calls or complex expressions
@@ -947,7 +1345,7 @@ class TypeScriptParser:
             brace_count -= line.count('{')
 
             # If we find a class declaration and we're inside its braces, return True
-            if re.match(r'(?:export\s+)?class\s+\w+', line):
+            if CLASS_SYMBOL_PATTERN.match(line):
                 # If brace_count is 0 or negative, we're inside this class
                 return brace_count <= 0
 
@@ -963,6 +1361,10 @@ class TypeScriptParser:
         lines = content.split('\n')
         
         for i, line in enumerate(lines, 1):
+            # Every pattern below starts at a '{', so most lines can be skipped outright
+            if '{' not in line:
+                continue
+            
             line_stripped = line.strip()
             
             # Skip comments and empty lines
@@ -975,7 +1377,7 @@ class TypeScriptParser:
             # Pattern: method({ key1, key2, key3, ... })
             
             # Find destructured object parameters
-            destructure_matches = re.findall(r'\{\s*([^}]+)\s*\}[^=]*(?::\s*\{[^}]*\})?(?:\s*=\s*\{[^}]*\})?', line_stripped)
+            destructure_matches = DESTRUCTURED_OBJECT_PATTERN.findall(line_stripped)
             
             for match in destructure_matches:
                 # Count the keys in the destructured object
@@ -998,8 +1400,8 @@ class TypeScriptParser:
         """Extract function names from content for validation purposes."""
         function_names = set()
         
-        for pattern in self.function_patterns:
-            matches = re.finditer(pattern, content, re.MULTILINE)
+        for pattern in MULTILINE_FUNCTION_DECLARATION_PATTERNS:
+            matches = pattern.finditer(content)
             for match in matches:
                 func_name = match.group(1)
                 if func_name.lower() not in self.excluded_keywords:
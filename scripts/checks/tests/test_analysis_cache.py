@@ -0,0 +1,46 @@
+"""
+Tests for the on-disk analysis cache shared by the checkers.
+"""
+
+from pathlib import Path
+
+from utils.test_helpers import create_cached_test_project
+from shared.analysis_cache import AnalysisCache, content_digest
+
+
+class TestAnalysisCache:
+    """Test suite for AnalysisCache load, save and reuse."""
+
+    def test_round_trip_with_matching_version(self):
+        with create_cached_test_project({}) as (_, cache_file):
+            cache = AnalysisCache(cache_file)
+            entries = {Path("src/a.ts"): (1, 2, b"digest", "analysis")}
+            cache.save(entries, ("v", 1))
+
+            assert cache.load(("v", 1)) == entries
+            assert cache.load(("v", 2)) == {}
+
+    def test_unreadable_cache_is_empty(self):
+        with create_cached_test_project({}) as (_, cache_file):
+            Path(cache_file).write_bytes(b"not a pickle")
+
+            assert AnalysisCache(cache_file).load(("v", 1)) == {}
+            assert AnalysisCache(None).load(("v", 1)) == {}
+
+    def test_reuse_checks_stat_then_content(self):
+        content = "export const a = 1;"
+        with create_cached_test_project({"src/a.ts": content}) as (project_path, _):
+            file_path = project_path / "src/a.ts"
+            stat = AnalysisCache.stat(file_path)
+            entry = stat + (content_digest(content), "analysis", 0.0)
+
+            # Same stat: the entry is kept as is
+            assert AnalysisCache.reuse(entry, file_path, stat) is entry
+
+            # New mtime, same content: kept, with the new stat and its extra fields
+            touched = (stat[0] + 10**9, stat[1])
+            assert AnalysisCache.reuse(entry, file_path, touched) == touched + entry[2:]
+
+            # Same size, different content: re-analyzed
+            file_path.write_text("export const b = 1;")
+            assert AnalysisCache.reuse(entry, file_path, touched) is None
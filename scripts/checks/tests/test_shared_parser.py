@@ -434,6 +434,25 @@ export const realValue = 'real';
         except Exception as e:
             pytest.fail(f"Parser failed on large file: {e}")
 
+    def test_import_export_memoization(self):
+        """Test that repeated parses of the same content reuse cached results."""
+        content = "import { foo } from './utils';\nexport const bar = foo;"
+
+        first = self.parser.extract_imports(content, Path("test.ts"))
+        first.clear()  # Callers get their own list, not the cached one
+        second = self.parser.extract_imports(content, Path("test.ts"))
+        assert [imp.name for imp in second] == ['foo']
+        assert self.parser._cached_imports.cache_info().hits == 1
+
+        # The same content under another path is parsed separately
+        other = self.parser.extract_imports(content, Path("other.ts"))
+        assert other[0].file_path == Path("other.ts")
+
+        self.parser.extract_exports(content, Path("test.ts"))
+        self.parser.cache_clear()
+        assert self.parser._cached_imports.cache_info().currsize == 0
+        assert self.parser._cached_exports.cache_info().currsize == 0
+
 
 class TestParserIntegration:
     """Integration tests for parser with real file scenarios."""
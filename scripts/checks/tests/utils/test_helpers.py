@@ -5,21 +5,46 @@ Provides utilities for creating test projects, running checkers,
 and asserting test results consistently across all test suites.
 """
 
+import atexit
 import os
 import tempfile
 import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Union, Any
 from contextlib import contextmanager
 
-# Import checker modules
+# Checker modules are imported on first use in run_checker, so collecting tests
+# that never run a checker doesn't pay for importing (and compiling) all of them
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
-from architecture.checker import ArchitectureChecker
-from deadcode.checker import DeadCodeChecker
-from ruleof6.checker import RuleOf6Checker
-from shared.typescript_parser import TypeScriptParser
+if TYPE_CHECKING:
+    from shared.typescript_parser import TypeScriptParser
+
+# Directory for temporary test projects; set HEXFRAME_TEST_TMPDIR=/dev/shm to write
+# them to tmpfs and skip the disk (defaults to the usual temporary directory)
+TEST_PROJECT_DIR = os.environ.get("HEXFRAME_TEST_TMPDIR") or tempfile.gettempdir()
+
+# Parent directory shared by every test project in this process, removed once at exit
+_session_root: Optional[str] = None
+
+
+def _test_projects_root() -> str:
+    """Create the per-process parent directory for test projects on first use."""
+    global _session_root
+    if _session_root is None:
+        _session_root = tempfile.mkdtemp(prefix="checks-tests-", dir=TEST_PROJECT_DIR)
+        atexit.register(shutil.rmtree, _session_root, ignore_errors=True)
+    return _session_root
+
+
+def _write_files(root: Path, files: Dict[str, str]) -> None:
+    """Write files under root, creating each parent directory once."""
+    targets = [(root / file_path, content) for file_path, content in files.items()]
+    for directory in {target.parent for target, _ in targets}:
+        directory.mkdir(parents=True, exist_ok=True)
+    for target, content in targets:
+        target.write_bytes(content.encode('utf-8'))
 
 
 @contextmanager
@@ -42,21 +67,58 @@ def create_test_project(files: Dict[str, str], base_name: str = "test_project"):
             # Run tests on project_path
             pass
     """
-    temp_dir = tempfile.mkdtemp(prefix=f"{base_name}_")
-    project_path = Path(temp_dir)
+    # Projects live under a shared per-process root; each is removed when its test is done
+    project_path = Path(tempfile.mkdtemp(prefix=f"{base_name}_", dir=_test_projects_root()))
 
     try:
         # Create all files and their directories
-        for file_path, content in files.items():
-            full_path = project_path / file_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.write_text(content, encoding='utf-8')
+        _write_files(project_path, files)
 
         yield project_path
-
     finally:
-        # Clean up temporary directory
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        shutil.rmtree(project_path, ignore_errors=True)
+
+
+@contextmanager
+def create_cached_test_project(files: Dict[str, str], cache_name: str = ".analysis-cache.pkl"):
+    """
+    Create a temporary test project along with the path of an analysis cache file in it.
+
+    Args:
+        files: Dictionary mapping file paths to file contents
+        cache_name: Name of the cache file (not created; the checker writes it)
+
+    Yields:
+        Tuple[Path, str]: The project directory and the cache file path
+    """
+    with create_test_project(files) as project_path:
+        yield project_path, str(project_path / cache_name)
+
+
+def record_analyzed_files(monkeypatch: Any, checker_class: type, method_name: str) -> List[str]:
+    """
+    Patch a checker method that analyzes one file or a list of files to record them.
+
+    The method still runs, so a checker run behaves as usual while the test learns
+    which files missed the analysis cache.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture
+        checker_class: Checker class whose method is patched
+        method_name: Method taking a file path or a list of file paths first
+
+    Returns:
+        List[str]: The recorded file paths, appended to as the checker runs
+    """
+    analyzed: List[str] = []
+    method = getattr(checker_class, method_name)
+
+    def recording_method(checker, files, *args, **kwargs):
+        analyzed.extend(str(file_path) for file_path in ([files] if isinstance(files, Path) else files))
+        return method(checker, files, *args, **kwargs)
+
+    monkeypatch.setattr(checker_class, method_name, recording_method)
+    return analyzed
 
 
 def create_temp_files(files: Dict[str, str], temp_dir: Optional[Path] = None) -> Path:
@@ -72,23 +134,21 @@ def create_temp_files(files: Dict[str, str], temp_dir: Optional[Path] = None) ->
         Path: Path to the directory containing the files
     """
     if temp_dir is None:
-        temp_dir = Path(tempfile.mkdtemp(prefix="test_files_"))
+        temp_dir = Path(tempfile.mkdtemp(prefix="test_files_", dir=TEST_PROJECT_DIR))
 
-    for file_path, content in files.items():
-        full_path = temp_dir / file_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(content, encoding='utf-8')
+    _write_files(temp_dir, files)
 
     return temp_dir
 
 
-def run_checker(checker_type: str, path: Union[str, Path], **kwargs) -> Any:
+def run_checker(checker_type: str, path: Union[str, Path], parser: Optional["TypeScriptParser"] = None, **kwargs) -> Any:
     """
     Run a specific checker on the given path.
 
     Args:
         checker_type: Type of checker ('architecture', 'deadcode', 'ruleof6', 'parser')
         path: Path to check
+        parser: Optional parser to reuse across runs (e.g. a session fixture)
         **kwargs: Additional arguments to pass to the checker
 
     Returns:
@@ -100,16 +160,21 @@ def run_checker(checker_type: str, path: Union[str, Path], **kwargs) -> Any:
     path = Path(path)
 
     if checker_type == 'architecture':
+        from architecture.checker import ArchitectureChecker
         checker = ArchitectureChecker(str(path))
         return checker.run_all_checks()
     elif checker_type == 'deadcode':
-        checker = DeadCodeChecker(str(path))
-        return checker.check()
+        from deadcode.checker import DeadCodeChecker
+        checker = DeadCodeChecker(str(path), parser=parser, **kwargs)
+        return checker.run_all_checks()
     elif checker_type == 'ruleof6':
-        checker = RuleOf6Checker(str(path))
-        return checker.check()
+        from ruleof6.checker import RuleOf6Checker
+        checker = RuleOf6Checker(str(path), **kwargs)
+        return checker.run_all_checks()
     elif checker_type == 'parser':
-        parser = TypeScriptParser()
+        if parser is None:
+            from shared.typescript_parser import TypeScriptParser
+            parser = TypeScriptParser()
         if path.is_file():
             content = path.read_text(encoding='utf-8')
             return {